@@ -1,7 +1,121 @@
-from core.api_client import APIClient
+from typing import Optional
+
+from playwright.sync_api import BrowserContext, Route
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from core.api_client import IDEMPOTENT_METHODS, APIClient
+from core.async_api_client import AsyncAPIClient
 from core.config import Config
+from core.token_cache import TokenCache, get_token_cache
 
 
 class ReqResClient(APIClient):
+    """
+    ReqRes API client with cached authentication.
+
+    The token for (base URL, credentials) is fetched once per worker through
+    /login and shared by every ReqResClient; a 401 on an authenticated
+    request refreshes it. Idempotent requests are then retried once (same
+    methods as build_retry); POST/PATCH return the 401 so they never run twice.
+    """
+
+    LOGIN_PATH = "/login"
+
+    def __init__(
+        self,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        token_cache: Optional[TokenCache] = None,
+        transport: Optional[BaseAdapter] = None,
+    ):
+        super().__init__(Config.REQRES_URL, transport=transport)
+
+        self.email = email or Config.REQRES_EMAIL
+        self.password = password or Config.REQRES_PASSWORD
+        self.token_cache = token_cache or get_token_cache()
+
+        self._authenticated = False
+
+    # ---------- Auth ----------
+
+    def login(
+        self, email: Optional[str] = None, password: Optional[str] = None
+    ) -> Response:
+        """POST /login (raw response, no token caching)."""
+        payload = {}
+        if email is not None:
+            payload["email"] = email
+        if password is not None:
+            payload["password"] = password
+        return self.post(self.LOGIN_PATH, json=payload)
+
+    def token(self) -> str:
+        """Return the cached token for this client's credentials."""
+        return self.token_cache.get(self._token_key(), self._fetch_token)
+
+    def authenticate(self) -> "ReqResClient":
+        """Send the cached token with every following request."""
+        self.session.headers.update(self.auth_headers())
+        self._authenticated = True
+        return self
+
+    def auth_headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.token()}"}
+
+    def inject_into(self, context: BrowserContext, url: Optional[str] = None) -> None:
+        """
+        Share the API session with a browser context (hybrid API + UI tests).
+
+        Adds the Authorization header to context requests for the ReqRes
+        API only (other origins never see the token) and a "token" cookie
+        for the given URL (defaults to the ReqRes base URL).
+        """
+        token = self.token()
+
+        def add_auth(route: Route) -> None:
+            # fallback(): other handlers (HAR cache, resource policy) still apply
+            route.fallback(headers={**route.request.headers, **self.auth_headers()})
+
+        context.route(f"{self.base_url}/**", add_auth)
+        context.add_cookies(
+            [{"name": "token", "value": token, "url": url or self.base_url}]
+        )
+
+    # ---------- Internal ----------
+
+    def _token_key(self) -> tuple:
+        return (self.base_url, self.email, self.password)
+
+    def _fetch_token(self) -> str:
+        response = self.login(self.email, self.password)
+        response.raise_for_status()
+        return response.json()["token"]
+
+    def _request(self, method: str, path: str, **kwargs) -> Response:
+        response = super()._request(method, path, **kwargs)
+
+        if (
+            self._authenticated
+            and response.status_code == 401
+            and path != self.LOGIN_PATH
+        ):
+            self.logger.info("Auth token rejected, refreshing | %s %s", method, path)
+            self.token_cache.invalidate(self._token_key())
+            self.authenticate()
+            if method.upper() in IDEMPOTENT_METHODS:
+                response = super()._request(method, path, **kwargs)
+
+        return response
+
+
+class AsyncReqResClient(AsyncAPIClient):
+    """
+    asyncio ReqRes API client for fan-out requests (see AsyncAPIClient.gather).
+
+    Unauthenticated: use AsyncAPIClient.from_client(authenticated ReqResClient)
+    when requests need the cached token.
+    """
+
     def __init__(self):
         super().__init__(Config.REQRES_URL)
@@ -0,0 +1,9 @@
+"""JSON schemas of ReqRes API responses (see utils.validators)."""
+
+from pathlib import Path
+
+
+SCHEMA_DIR = Path(__file__).resolve().parent
+
+USER_SCHEMA = SCHEMA_DIR / "user_schema.json"
+USERS_PAGE_SCHEMA = SCHEMA_DIR / "users_page_schema.json"
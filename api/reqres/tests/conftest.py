@@ -0,0 +1,104 @@
+"""
+Pytest configuration and fixtures for ReqRes API tests.
+
+Clients are session-scoped, i.e. created once per xdist worker, so tests
+share pooled connections. Auth tokens are cached per worker (see
+ReqResClient) and fetched through /login only once.
+"""
+
+import asyncio
+
+import pytest
+
+from api.reqres.client import AsyncReqResClient, ReqResClient
+from core.api_client import APIClient
+from core.config import Config
+from core.load_runner import LoadHistory, LoadProfile, LoadRunner, compare_results
+
+
+@pytest.fixture(scope="session")
+def reqres_client():
+    """Session-wide (per worker) anonymous ReqResClient."""
+    client = ReqResClient()
+
+    yield client
+
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def authenticated_reqres_client():
+    """Session-wide (per worker) ReqResClient sending the cached auth token."""
+    client = ReqResClient().authenticate()
+
+    yield client
+
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def run_async():
+    """
+    Session-wide (per worker) event loop runner for async API calls.
+
+    Usage:
+        users = run_async(async_reqres_client.get("/users"))
+    """
+    loop = asyncio.new_event_loop()
+
+    yield loop.run_until_complete
+
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def async_reqres_client(run_async):
+    """Session-wide (per worker) AsyncReqResClient bound to the session loop."""
+    client = AsyncReqResClient()
+
+    yield client
+
+    run_async(client.aclose())
+
+
+@pytest.fixture
+def run_load(request: pytest.FixtureRequest, record_property):
+    """
+    Run a load profile against ReqRes, store it and compare with the last run.
+
+    The profile comes from the test's load marker (LoadProfile fields),
+    with Config.LOAD_* defaults. Results are appended to LoadHistory
+    under the test name and recorded as test properties.
+
+    Usage:
+        @pytest.mark.load(users=20, duration=10, ramp_up=2)
+        def test_users_load(run_load):
+            result = run_load([Endpoint("GET", "/users")])
+    """
+    marker = request.node.get_closest_marker("load")
+    profile = LoadProfile(
+        users=Config.LOAD_USERS,
+        duration=Config.LOAD_DURATION,
+        ramp_up=Config.LOAD_RAMP_UP,
+        mode=Config.LOAD_MODE,
+    )._replace(**(marker.kwargs if marker else {}))
+
+    client = APIClient(Config.REQRES_URL, retries=0, pool_maxsize=profile.users)
+
+    def run(endpoints, name=None):
+        runner = LoadRunner(client, endpoints, profile, name or request.node.name)
+        row = runner.run().to_dict()
+
+        history = LoadHistory()
+        previous = history.latest(row["name"])
+        for line in compare_results(previous, row) if previous else []:
+            runner.logger.info("vs previous run | %s", line)
+        history.append(row)
+
+        record_property("load_rps", row["total"]["rps"])
+        record_property("load_p99_ms", row["total"]["p99_ms"])
+        return row
+
+    yield run
+
+    client.close()
@@ -0,0 +1,98 @@
+"""
+Tests for ReqRes authentication endpoints.
+"""
+
+import json
+
+import pytest
+
+from api.reqres.client import ReqResClient
+from core.config import Config
+from core.token_cache import TokenCache
+from core.transport import WSGITransport
+
+
+def test_login_returns_token(reqres_client):
+    """Login with valid credentials returns a token."""
+    response = reqres_client.login(Config.REQRES_EMAIL, Config.REQRES_PASSWORD)
+
+    assert response.status_code == 200
+    assert response.json()["token"]
+
+
+def test_login_without_password_fails(reqres_client):
+    """Login without password is rejected."""
+    response = reqres_client.login(Config.REQRES_EMAIL)
+
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+def test_token_is_fetched_once_per_cache():
+    """Clients sharing a token cache log in only once."""
+    cache = TokenCache()
+
+    first = ReqResClient(token_cache=cache)
+    second = ReqResClient(token_cache=cache)
+    try:
+        assert first.token() == second.token()
+        assert cache.misses == 1
+        assert cache.hits == 1
+    finally:
+        first.close()
+        second.close()
+
+
+def test_authenticated_client_sends_token(authenticated_reqres_client):
+    """Authenticated client sends the cached bearer token."""
+    token = authenticated_reqres_client.token()
+
+    assert (
+        authenticated_reqres_client.session.headers["Authorization"]
+        == f"Bearer {token}"
+    )
+
+
+class ExpiringTokenApp:
+    """WSGI app that rejects the first token it issued."""
+
+    def __init__(self):
+        self.logins = 0
+        self.calls = []
+
+    def __call__(self, environ, start_response):
+        path = environ["PATH_INFO"]
+        self.calls.append((environ["REQUEST_METHOD"], path))
+
+        if path.endswith("/login"):
+            self.logins += 1
+            status, body = "200 OK", {"token": f"token-{self.logins}"}
+        elif environ.get("HTTP_AUTHORIZATION") == "Bearer token-1":
+            status, body = "401 Unauthorized", {"error": "token expired"}
+        else:
+            status, body = "200 OK", {}
+
+        start_response(status, [("Content-Type", "application/json")])
+        return [json.dumps(body).encode()]
+
+
+@pytest.mark.parametrize(
+    "method, replayed",
+    [("get", True), ("delete", True), ("post", False), ("patch", False)],
+)
+def test_rejected_token_replays_idempotent_requests_only(method, replayed):
+    """A 401 refreshes the token; only idempotent requests are sent again."""
+    app = ExpiringTokenApp()
+    client = ReqResClient(token_cache=TokenCache(), transport=WSGITransport(app))
+    try:
+        client.authenticate()
+        response = client.request(method, "/users/2")
+
+        assert app.logins == 2
+        assert len([call for call in app.calls if not call[1].endswith("/login")]) == (
+            2 if replayed else 1
+        )
+        assert response.status_code == (200 if replayed else 401)
+        assert client.session.headers["Authorization"] == "Bearer token-2"
+    finally:
+        client.close()
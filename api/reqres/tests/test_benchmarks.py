@@ -0,0 +1,201 @@
+"""
+Benchmarks for API client internals (no network).
+
+Timings are recorded as test properties (visible in JUnit XML).
+"""
+
+import io
+import logging
+import time
+import tracemalloc
+
+import jsonschema
+import pytest
+from requests import Response
+
+from api.reqres.schemas import USER_SCHEMA
+from core.api_client import APIClient, log_request, log_response
+from core.transport import WSGITransport
+from stubs.reqres import ReqResStub
+from stubs.server import StubServer
+from utils.validators import SchemaStore, iter_validated
+
+
+LARGE_JSON = {
+    "data": [
+        {"id": i, "email": f"user{i}@reqres.in", "first_name": "Name", "tags": ["a"] * 10}
+        for i in range(2000)
+    ]
+}
+
+
+def _large_response() -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = repr(LARGE_JSON).encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("level", ["INFO", "DEBUG"])
+def test_api_logging_overhead_per_request(record_property, level):
+    """
+    Per-request logging cost for large JSON bodies at INFO vs DEBUG.
+    """
+    logger = logging.getLogger(f"APIClientLoggingBenchmark.{level}")
+    logger.handlers = [logging.StreamHandler(io.StringIO())]
+    logger.propagate = False
+    logger.setLevel(level)
+
+    response = _large_response()
+    kwargs = {"json": LARGE_JSON, "params": {"page": 1}}
+    runs = 200
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        log_request(logger, "POST", "https://reqres.in/api/users", kwargs)
+        log_response(
+            logger,
+            "POST",
+            "https://reqres.in/api/users",
+            response.status_code,
+            0.01,
+            lambda: response.text,
+        )
+    per_request = (time.perf_counter() - start) / runs
+
+    record_property("log_level", level)
+    record_property("microseconds_per_request", round(per_request * 1e6, 1))
+
+    emitted = logger.handlers[0].stream.getvalue()
+    if level == "INFO":
+        assert "Response body" not in emitted
+    else:
+        # Payloads are capped, not dumped in full
+        assert "[truncated" in emitted
+
+
+@pytest.mark.benchmark
+def test_inprocess_transport_vs_local_socket(record_property):
+    """
+    Same ReqRes stand-in over local TCP vs the in-process WSGI transport:
+    identical responses, calls per second for each.
+    """
+    app = ReqResStub()
+    runs = 300
+
+    with StubServer(app) as server:
+        socket_client = APIClient(f"{server.url}/api")
+        inprocess_client = APIClient(f"{server.url}/api", transport=WSGITransport(app))
+
+        rates = {}
+        for name, client in (("socket", socket_client), ("inprocess", inprocess_client)):
+            client.logger.disabled = True
+            start = time.perf_counter()
+            for _ in range(runs):
+                client.get("/users", params={"page": 2})
+            rates[name] = runs / (time.perf_counter() - start)
+
+        over_socket = socket_client.get("/users/2")
+        in_process = inprocess_client.get("/users/2")
+
+        socket_client.close()
+        inprocess_client.close()
+
+    record_property("socket_calls_per_second", round(rates["socket"]))
+    record_property("inprocess_calls_per_second", round(rates["inprocess"]))
+
+    assert in_process.status_code == over_socket.status_code == 200
+    assert in_process.json() == over_socket.json()
+    assert in_process.headers["Content-Type"] == over_socket.headers["Content-Type"]
+    assert in_process.url == over_socket.url
+
+
+@pytest.mark.benchmark
+def test_compiled_schema_validation_vs_naive(record_property):
+    """
+    Validating a 2000-user list: cached compiled validator (validate_many)
+    vs jsonschema.validate per item (re-checks and re-compiles every call).
+    """
+    schema_path = USER_SCHEMA
+    users = [
+        {
+            "id": i,
+            "email": f"user{i}@reqres.in",
+            "first_name": "Name",
+            "last_name": "Last",
+            "avatar": f"https://reqres.in/img/faces/{i}-image.jpg",
+        }
+        for i in range(2000)
+    ]
+
+    store = SchemaStore()
+    schema = store.schema(schema_path)
+
+    compiles = []
+    compile_validator = store._compile
+    store._compile = lambda path: compiles.append(path) or compile_validator(path)
+
+    start = time.perf_counter()
+    for user in users:
+        jsonschema.validate(user, schema)
+    naive = time.perf_counter() - start
+
+    store.validate_many(users, schema_path)  # compile once (warm-up)
+    start = time.perf_counter()
+    assert store.validate_many(users, schema_path) == []
+    compiled = time.perf_counter() - start
+
+    record_property("naive_microseconds_per_item", round(naive / len(users) * 1e6, 1))
+    record_property("compiled_microseconds_per_item", round(compiled / len(users) * 1e6, 1))
+
+    # Timings are recorded only (wall clock flakes on loaded runners)
+    assert len(compiles) == 1
+
+
+@pytest.mark.benchmark
+def test_paginated_stream_memory_is_flat(record_property):
+    """
+    Peak memory of validating a user export: all pages loaded first vs
+    APIClient.paginate + iter_validated (one page at a time), at 2k and 5k
+    users. Streaming keeps the peak flat as the export grows.
+    """
+    schema_path = USER_SCHEMA
+    params = {"per_page": 100}
+
+    def client_for(total: int) -> APIClient:
+        client = APIClient(
+            "http://reqres.local/api", transport=WSGITransport(ReqResStub(total_users=total))
+        )
+        client.logger.disabled = True
+        return client
+
+    def eager(client: APIClient, total: int) -> int:
+        pages = [
+            client.get("/users", params={**params, "page": p}).json()
+            for p in range(1, total // params["per_page"] + 1)
+        ]
+        users = [user for page in pages for user in page["data"]]
+        SchemaStore().validate_many(users, schema_path)
+        return len(users)
+
+    def streamed(client: APIClient, total: int) -> int:
+        return sum(1 for _ in iter_validated(client.paginate("/users", params=params), schema_path))
+
+    peaks = {}
+    for total in (2000, 5000):
+        for name, run in (("eager", eager), ("streamed", streamed)):
+            client = client_for(total)
+            tracemalloc.start()
+            count = run(client, total)
+            peaks[name, total] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            client.close()
+            assert count == total
+
+    for (name, total), peak in peaks.items():
+        record_property(f"{name}_{total}_peak_kib", peak // 1024)
+
+    # 2.5x the records: the eager peak grows with them, the streamed one does not
+    assert peaks["streamed", 5000] < peaks["streamed", 2000] * 1.5
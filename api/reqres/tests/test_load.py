@@ -0,0 +1,32 @@
+"""
+Load tests for the ReqRes API (run with --load).
+
+Each run is stored in the load history (.cache/load.jsonl) and compared
+with the previous run of the same test.
+"""
+
+import pytest
+
+from core.load_runner import Endpoint
+
+
+@pytest.mark.load(users=10, duration=5, ramp_up=2)
+def test_users_read_load(run_load):
+    result = run_load(
+        [
+            Endpoint("GET", "/users", {"params": {"page": 2}}),
+            Endpoint("GET", "/users/2", weight=3),
+        ]
+    )
+
+    total = result["total"]
+    assert total["requests"] > 0
+    assert total["errors"] == 0
+    assert total["p50_ms"] <= total["p90_ms"] <= total["p99_ms"] <= total["max_ms"]
+
+
+@pytest.mark.load(users=10, duration=5, ramp_up=2, mode="async")
+def test_users_read_load_async(run_load):
+    result = run_load([Endpoint("GET", "/users/2")])
+
+    assert result["endpoints"]["GET /users/2"]["errors"] == 0
@@ -1,2 +1,91 @@
+import json
+
+import pytest
+
+from api.reqres.schemas import USER_SCHEMA, USERS_PAGE_SCHEMA
+from core.api_client import APIClient
+from core.transport import WSGITransport
+from stubs.reqres import ReqResStub
+from utils.validators import (
+    SchemaValidationError,
+    assert_schema,
+    assert_schema_many,
+    iter_validated,
+)
+
+
 def test_placeholder():
     assert True
+
+
+def test_users_page_matches_schema(reqres_client):
+    response = reqres_client.get("/users", params={"page": 1})
+    assert response.status_code == 200
+
+    assert_schema(response.json(), USERS_PAGE_SCHEMA)
+    assert_schema_many(response.json()["data"], USER_SCHEMA)
+
+
+def test_all_user_pages_fetched_concurrently(async_reqres_client, run_async):
+    """Fan out over every /users page in one event loop."""
+
+    async def fetch_all_pages():
+        first = await async_reqres_client.get("/users", params={"page": 1})
+        assert first.status_code == 200
+
+        total_pages = first.json()["total_pages"]
+        rest = await async_reqres_client.gather(
+            async_reqres_client.get("/users", params={"page": page})
+            for page in range(2, total_pages + 1)
+        )
+        return [first, *rest]
+
+    responses = run_async(fetch_all_pages())
+
+    assert all(response.status_code == 200 for response in responses)
+
+    total = responses[0].json()["total"]
+    users = [user for response in responses for user in response.json()["data"]]
+    assert len(users) == total
+
+
+def test_users_stream_matches_schema(reqres_client):
+    """Walk every /users page lazily, validating each record as it arrives."""
+    first = reqres_client.get("/users").json()
+
+    ids = [
+        user["id"]
+        for user in iter_validated(reqres_client.paginate("/users"), USER_SCHEMA)
+    ]
+
+    assert len(ids) == first["total"]
+    assert len(set(ids)) == len(ids)
+
+
+@pytest.mark.parametrize("link_header", [False, True], ids=["total_pages", "link"])
+def test_paginate_walks_every_page_once(link_header):
+    stub = ReqResStub(total_users=30, link_header=link_header)
+    client = APIClient("http://reqres.local/api", transport=WSGITransport(stub))
+
+    ids = [user["id"] for user in client.paginate("/users", params={"per_page": 6})]
+
+    assert ids == list(range(1, 31))
+    assert stub.requests == 5
+
+
+@pytest.mark.parametrize("link_header", [False, True], ids=["total_pages", "link"])
+def test_paginate_stops_fetching_on_first_invalid_record(tmp_path, link_header):
+    """Early abort: no page after the one holding the invalid record is requested."""
+    stub = ReqResStub(total_users=60, link_header=link_header)
+    client = APIClient("http://reqres.local/api", transport=WSGITransport(stub))
+
+    schema_path = tmp_path / "small_id.json"
+    schema_path.write_text(json.dumps({"properties": {"id": {"maximum": 8}}}))
+
+    seen = []
+    with pytest.raises(SchemaValidationError, match="9 is greater than the maximum"):
+        for user in iter_validated(client.paginate("/users", params={"per_page": 6}), schema_path):
+            seen.append(user["id"])
+
+    assert seen == list(range(1, 9))
+    assert stub.requests == 2  # of 10 pages
@@ -1,8 +1,15 @@
 """Base page for DemoQA application."""
 
+import importlib
+import pkgutil
+import time
 from typing import Self
+
+from playwright.sync_api import Page
+
 from core.base_page import BasePage
 from core.config import Config
+from core.network_cache import get_network_cache
 
 
 class BaseDemoQAPage(BasePage):
@@ -10,13 +17,25 @@ class BaseDemoQAPage(BasePage):
 
     URL_PATH: str | None = None
 
-    def open(self, url: str):
+    # Visible side-menu name leading to this page (e.g. "Check Box")
+    MENU_NAME: str | None = None
+
+    # Page classes keyed by URL_PATH and by MENU_NAME
+    _registry: dict[str, type["BaseDemoQAPage"]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for key in (cls.URL_PATH, cls.MENU_NAME):
+            if key:
+                BaseDemoQAPage._registry[key] = cls
+
+    def open(self, url: str, wait_ready: bool = True):
         """
         Open a DemoQA page by relative path.
         """
         full_url = f"{Config.DEMOQA_URL.rstrip('/')}/{url.lstrip('/')}"
-        self.page.goto(full_url)
-        self.page.wait_for_load_state("domcontentloaded")
+        get_network_cache().attach(self.page, "demoqa", url.strip("/"))
+        super().open(full_url, wait_ready=wait_ready)
         return self
 
     def open_page(self) -> Self:
@@ -25,3 +44,47 @@ class BaseDemoQAPage(BasePage):
             raise ValueError(f"{self.__class__.__name__} must define URL_PATH")
 
         return self.open(self.URL_PATH)
+
+    # ---------- Deep-link navigation ----------
+
+    @classmethod
+    def navigate(cls, page: Page) -> Self:
+        """
+        Deep-link straight to this page and return its page object.
+
+        Skips the landing page + side-menu hop. Use menu navigation only in
+        tests that verify the menu itself.
+
+        The page's READY_ANCHOR must be visible before the object is handed
+        out: a safety check against mis-navigation (not a test assertion).
+        """
+        if not cls.URL_PATH:
+            raise ValueError(f"{cls.__name__} must define URL_PATH")
+
+        page_object = cls(page)
+        start = time.perf_counter()
+        page_object.open(cls.URL_PATH, wait_ready=False)
+        page_object.wait_until_ready(start)
+        return page_object
+
+    def go_to(self, name: str) -> "BaseDemoQAPage":
+        """Deep-link to a page by side-menu name or URL_PATH (no menu click)."""
+        return self.page_for(name).navigate(self.page)
+
+    @classmethod
+    def page_for(cls, key: str) -> type["BaseDemoQAPage"]:
+        """Return the page class registered for a URL_PATH or menu name."""
+        if key not in cls._registry:
+            _import_page_modules()
+
+        try:
+            return cls._registry[key]
+        except KeyError:
+            raise ValueError(f"No DemoQA page registered for '{key}'") from None
+
+
+def _import_page_modules() -> None:
+    """Import all DemoQA page modules so their classes get registered."""
+    package = importlib.import_module(__package__)
+    for module in pkgutil.iter_modules(package.__path__):
+        importlib.import_module(f"{__package__}.{module.name}")
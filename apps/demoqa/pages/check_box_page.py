@@ -2,7 +2,6 @@
 Check Box page object for DemoQA application.
 """
 
-from playwright.sync_api import Page, expect
 from apps.demoqa.pages.base_demoqa_page import BaseDemoQAPage
 
 
@@ -17,9 +16,11 @@ class CheckBoxPage(BaseDemoQAPage):
     """
 
     URL_PATH = "checkbox"
+    MENU_NAME = "Check Box"
 
     # ---------- Page readiness ----------
     PAGE_HEADER = "h1:text('Check Box')"
+    READY_ANCHOR = PAGE_HEADER
 
     # ---------- Controls ----------
     EXPAND_ALL_BTN = "button[title='Expand all']"
@@ -36,15 +37,6 @@ class CheckBoxPage(BaseDemoQAPage):
     RESULT_CONTAINER = "#result"
     RESULT_ITEMS = "#result span.text-success"
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self._assert_page_ready()
-
-    # ---------- Readiness ----------
-
-    def _assert_page_ready(self) -> None:
-        expect(self.page.locator(self.PAGE_HEADER)).to_be_visible()
-
     # ---------- Actions ----------
 
     def expand_all(self) -> None:
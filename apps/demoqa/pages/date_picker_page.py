@@ -2,7 +2,6 @@
 Date Picker page object for DemoQA application.
 """
 
-from playwright.sync_api import Page, expect
 from apps.demoqa.pages.base_demoqa_page import BaseDemoQAPage
 
 
@@ -16,23 +15,16 @@ class DatePickerPage(BaseDemoQAPage):
     """
 
     URL_PATH = "date-picker"
+    MENU_NAME = "Date Picker"
 
     # ---------- Page readiness ----------
     PAGE_HEADER = "h1:text('Date Picker')"
+    READY_ANCHOR = PAGE_HEADER
 
     # ---------- Inputs ----------
     DATE_INPUT = "#datePickerMonthYearInput"
     DATE_TIME_INPUT = "#dateAndTimePickerInput"
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self._assert_page_ready()
-
-    # ---------- Readiness ----------
-
-    def _assert_page_ready(self) -> None:
-        expect(self.page.locator(self.PAGE_HEADER)).to_be_visible()
-
     # ---------- Actions ----------
 
     def set_date(self, value: str) -> None:
@@ -10,6 +10,7 @@ class ElementsPage(BaseDemoQAPage):
 
     # Page readiness (app shell)
     PAGE_READY = ".left-pannel"
+    READY_ANCHOR = PAGE_READY
 
     # Side menu
     SIDE_MENU_ITEMS = ".element-list .menu-list li"
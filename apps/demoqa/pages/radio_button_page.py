@@ -2,7 +2,6 @@
 Radio Button page object for DemoQA application.
 """
 
-from playwright.sync_api import Page, expect
 from apps.demoqa.pages.base_demoqa_page import BaseDemoQAPage
 
 
@@ -16,9 +15,11 @@ class RadioButtonPage(BaseDemoQAPage):
     """
 
     URL_PATH = "radio-button"
+    MENU_NAME = "Radio Button"
 
     # ---------- Page readiness ----------
     PAGE_HEADER = "h1:text('Radio Button')"
+    READY_ANCHOR = PAGE_HEADER
 
     # ---------- Radio controls ----------
     RADIO_LABEL = "label"
@@ -32,15 +33,6 @@ class RadioButtonPage(BaseDemoQAPage):
     # ---------- Output ----------
     RESULT_TEXT = ".text-success"
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self._assert_page_ready()
-
-    # ---------- Readiness ----------
-
-    def _assert_page_ready(self) -> None:
-        expect(self.page.locator(self.PAGE_HEADER)).to_be_visible()
-
     # ---------- Actions ----------
 
     def select_yes(self) -> None:
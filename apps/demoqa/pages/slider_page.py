@@ -2,10 +2,21 @@
 Slider page object for DemoQA application.
 """
 
-from playwright.sync_api import Page, expect
 from apps.demoqa.pages.base_demoqa_page import BaseDemoQAPage
 
 
+_SET_RANGE_VALUE_JS = """
+(el, value) => {
+    const setter = Object.getOwnPropertyDescriptor(
+        HTMLInputElement.prototype, "value"
+    ).set;
+    setter.call(el, String(value));
+    el.dispatchEvent(new Event("input", { bubbles: true }));
+    el.dispatchEvent(new Event("change", { bubbles: true }));
+}
+"""
+
+
 class SliderPage(BaseDemoQAPage):
     """
     Page object representing the Slider widget.
@@ -16,29 +27,37 @@ class SliderPage(BaseDemoQAPage):
     """
 
     URL_PATH = "slider"
+    MENU_NAME = "Slider"
 
     # ---------- Page readiness ----------
     PAGE_HEADER = "h1:text('Slider')"
+    READY_ANCHOR = PAGE_HEADER
 
     # ---------- Slider ----------
     SLIDER_INPUT = "input[type='range']"
     SLIDER_VALUE = "#sliderValue"
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self._assert_page_ready()
-
-    # ---------- Readiness ----------
-
-    def _assert_page_ready(self) -> None:
-        expect(self.page.locator(self.PAGE_HEADER)).to_be_visible()
-
     # ---------- Actions ----------
 
     def set_value(self, value: int) -> None:
         """
-        Set slider to a specific value using keyboard interaction.
+        Set slider to a specific value in constant time.
         DemoQA slider range: 0–100, step 1
+
+        The range input value is set directly (native setter + input/change
+        events). If the app does not reflect it, falls back to keyboard.
+        """
+        if not 0 <= value <= 100:
+            raise ValueError("Slider value must be between 0 and 100")
+
+        self.page.locator(self.SLIDER_INPUT).evaluate(_SET_RANGE_VALUE_JS, value)
+
+        if self.current_value() != value:
+            self.set_value_with_keyboard(value)
+
+    def set_value_with_keyboard(self, value: int) -> None:
+        """
+        Set slider using keyboard interaction (one keypress per step).
         """
         if not 0 <= value <= 100:
             raise ValueError("Slider value must be between 0 and 100")
@@ -1,6 +1,5 @@
 """Text Box page object for DemoQA."""
 
-from playwright.sync_api import Page, expect
 from apps.demoqa.pages.base_demoqa_page import BaseDemoQAPage
 
 
@@ -14,9 +13,11 @@ class TextBoxPage(BaseDemoQAPage):
     """
 
     URL_PATH = "text-box"
+    MENU_NAME = "Text Box"
 
     # --- Page readiness anchor ---
     PAGE_HEADER = "h1:text('Text Box')"
+    READY_ANCHOR = PAGE_HEADER
 
     # --- Form inputs ---
     FULL_NAME_INPUT = "#userName"
@@ -28,21 +29,6 @@ class TextBoxPage(BaseDemoQAPage):
     # --- Output ---
     OUTPUT_CONTAINER = "#output"
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self._assert_page_ready()
-
-    # ---------- Readiness ----------
-
-    def _assert_page_ready(self) -> None:
-        """
-        Assert that the Text Box page is loaded and ready.
-
-        This is NOT a test assertion.
-        This is a safety check to prevent mis-navigation usage.
-        """
-        expect(self.page.locator(self.PAGE_HEADER)).to_be_visible()
-
     # ---------- Actions ----------
 
     def fill_full_name(self, value: str) -> None:
@@ -86,11 +72,17 @@ class TextBoxPage(BaseDemoQAPage):
         """
         High-level intent method.
         Keeps tests readable and focused on behavior.
+
+        All fields are filled in one round-trip (see BasePage.fill_many).
         """
-        self.fill_full_name(full_name)
-        self.fill_email(email)
-        self.fill_current_address(current_address)
-        self.fill_permanent_address(permanent_address)
+        self.fill_many(
+            {
+                self.FULL_NAME_INPUT: full_name,
+                self.EMAIL_INPUT: email,
+                self.CURRENT_ADDRESS_INPUT: current_address,
+                self.PERMANENT_ADDRESS_INPUT: permanent_address,
+            }
+        )
         self.submit()
 
     # ---------- Queries ----------
@@ -22,6 +22,7 @@ class WidgetsPage(BaseDemoQAPage):
 
     # ---------- Page readiness ----------
     PAGE_READY = ".left-pannel"
+    READY_ANCHOR = PAGE_READY
 
     # ---------- Side menu ----------
     SIDE_MENU_ITEMS = ".element-list .menu-list li"
@@ -0,0 +1,129 @@
+"""
+Benchmarks for DemoQA page object interactions.
+
+Driver round-trips and timings are recorded as test properties
+(visible in JUnit XML) so before/after numbers can be compared.
+"""
+
+import time
+
+import pytest
+
+from apps.demoqa.pages.slider_page import SliderPage
+from apps.demoqa.pages.text_box_page import TextBoxPage
+from core.tracing import TraceRecorder
+from utils.round_trips import RoundTripCounter
+
+
+TEXT_BOX_FIELDS = {
+    TextBoxPage.FULL_NAME_INPUT: "John Doe",
+    TextBoxPage.EMAIL_INPUT: "john@doe.com",
+    TextBoxPage.CURRENT_ADDRESS_INPUT: "123 Main St",
+    TextBoxPage.PERMANENT_ADDRESS_INPUT: "456 Oak Ave",
+}
+
+
+@pytest.mark.benchmark
+def test_text_box_bulk_fill_round_trips(page, record_property):
+    """
+    Compare per-field fill with BasePage.fill_many on the Text Box form.
+    """
+    text_box_page = TextBoxPage.navigate(page)
+
+    per_field = RoundTripCounter(page)
+    text_box_page.page = per_field
+    start = time.perf_counter()
+    for selector, value in TEXT_BOX_FIELDS.items():
+        text_box_page.page.fill(selector, value)
+    per_field_time = time.perf_counter() - start
+
+    text_box_page = TextBoxPage(page)
+    text_box_page.refresh()
+
+    bulk = RoundTripCounter(page)
+    text_box_page.page = bulk
+    start = time.perf_counter()
+    text_box_page.fill_many(TEXT_BOX_FIELDS)
+    bulk_time = time.perf_counter() - start
+
+    record_property("round_trips_per_field", per_field.calls)
+    record_property("round_trips_bulk", bulk.calls)
+    record_property("seconds_per_field", round(per_field_time, 4))
+    record_property("seconds_bulk", round(bulk_time, 4))
+
+    assert per_field.calls == len(TEXT_BOX_FIELDS)
+    assert bulk.calls == 1
+
+    for selector, value in TEXT_BOX_FIELDS.items():
+        assert page.input_value(selector) == value
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("value", [0, 1, 25, 50, 75, 99, 100])
+def test_slider_set_value_is_constant_time(page, record_property, value):
+    """
+    SliderPage.set_value must cost the same round-trips for any value.
+    """
+    slider_page = SliderPage.navigate(page)
+
+    counter = RoundTripCounter(page)
+    slider_page.page = counter
+    start = time.perf_counter()
+    slider_page.set_value(value)
+    elapsed = time.perf_counter() - start
+
+    record_property("round_trips", counter.calls)
+    record_property("seconds", round(elapsed, 4))
+
+    # Direct set + read-back; the keyboard fallback would be O(value)
+    assert counter.calls == 2
+    assert slider_page.current_value() == value
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("value", [0, 50, 100])
+def test_slider_keyboard_fallback(page, value):
+    """
+    Verify the keyboard fallback path still reaches the target value.
+    """
+    slider_page = SliderPage.navigate(page)
+
+    slider_page.set_value_with_keyboard(value)
+
+    assert slider_page.current_value() == value
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("attempt", (1, 2), ids=("first_run", "rerun"))
+@pytest.mark.parametrize("mode", TraceRecorder.MODES)
+def test_tracing_overhead_per_mode(
+    browser, browser_context_args, record_property, mode, attempt
+):
+    """
+    Measure the cost of passing tests under each tracing mode, for first
+    runs and pytest-rerunfailures re-runs ("retry" traces re-runs only).
+
+    Uses its own context so the suite-level tracing does not interfere.
+    """
+    context = browser.new_context(**browser_context_args)
+    recorder = TraceRecorder(mode)
+    runs = 3
+
+    try:
+        start = time.perf_counter()
+        for _ in range(runs):
+            traced = recorder.begin(context, attempt=attempt)
+            page = context.new_page()
+            TextBoxPage.navigate(page).fill_many(TEXT_BOX_FIELDS)
+            page.close()
+            recorder.discard(context)
+        elapsed = time.perf_counter() - start
+    finally:
+        context.close()
+
+    record_property("trace_mode", mode)
+    record_property("attempt", attempt)
+    record_property("seconds_per_test", round(elapsed / runs, 4))
+
+    assert traced is not (mode == "off" or (mode == "retry" and attempt == 1))
+    assert not recorder.is_recording(context)
@@ -18,8 +18,8 @@ def test_checkbox_page_opens_from_elements_menu(page):
 
     elements_page.open_check_box()
 
-    # Page readiness enforced in constructor
-    CheckBoxPage(page)
+    # Fails if the READY_ANCHOR (page header) does not appear
+    CheckBoxPage(page).wait_until_ready()
 
 
 @pytest.mark.smoke
@@ -27,10 +27,7 @@ def test_select_single_checkbox_item(page):
     """
     Verify that selecting a single checkbox item works.
     """
-    elements_page = ElementsPage(page).open_page()
-    elements_page.open_check_box()
-
-    checkbox_page = CheckBoxPage(page)
+    checkbox_page = CheckBoxPage.navigate(page)
     checkbox_page.expand_all()
 
     checkbox_page.select("Desktop")
@@ -45,10 +42,7 @@ def test_select_multiple_checkbox_items(page):
     """
     Verify that multiple checkbox selections are reflected correctly.
     """
-    elements_page = ElementsPage(page).open_page()
-    elements_page.open_check_box()
-
-    checkbox_page = CheckBoxPage(page)
+    checkbox_page = CheckBoxPage.navigate(page)
     checkbox_page.expand_all()
 
     checkbox_page.select("Documents")
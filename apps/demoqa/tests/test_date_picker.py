@@ -15,8 +15,8 @@ def test_date_picker_page_opens_from_widgets_menu(page):
     """
     WidgetsPage(page).open_page().open_date_picker()
 
-    # Readiness enforced in constructor
-    DatePickerPage(page)
+    # Fails if the READY_ANCHOR (page header) does not appear
+    DatePickerPage(page).wait_until_ready()
 
 
 @pytest.mark.smoke
@@ -24,8 +24,7 @@ def test_set_date(page):
     """
     Verify that a date can be set in the Date Picker.
     """
-    WidgetsPage(page).open_page().open_date_picker()
-    date_picker = DatePickerPage(page)
+    date_picker = DatePickerPage.navigate(page)
 
     date_picker.set_date("12/25/2025")
 
@@ -37,8 +36,7 @@ def test_set_date_and_time(page):
     """
     Verify that date and time can be set.
     """
-    WidgetsPage(page).open_page().open_date_picker()
-    date_picker = DatePickerPage(page)
+    date_picker = DatePickerPage.navigate(page)
 
     value = "December 25, 2025 10:30 AM"
     date_picker.set_date_time(value)
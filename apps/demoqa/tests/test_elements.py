@@ -5,10 +5,12 @@ Scope:
 - Elements landing page loads correctly
 - Text Box page can be opened via Elements navigation
 - Text Box form submission works as expected
+- Menu names deep-link to their page objects
 
 Notes:
 - Navigation assertions belong to ElementsPage
 - Content assertions belong to content pages (e.g. TextBoxPage)
+- Tests that do not verify the menu deep-link via Page.navigate()
 """
 
 import pytest
@@ -38,8 +40,8 @@ def test_text_box_page_opens_from_elements_menu(page):
 
     elements_page.open_text_box()
 
-    # Page readiness is enforced inside TextBoxPage
-    TextBoxPage(page)
+    # Fails if the READY_ANCHOR (page header) does not appear
+    TextBoxPage(page).wait_until_ready()
 
 
 @pytest.mark.smoke
@@ -47,10 +49,7 @@ def test_text_box_form_submission(page):
     """
     Verify that Text Box form can be submitted and output is displayed.
     """
-    elements_page = ElementsPage(page).open_page()
-    elements_page.open_text_box()
-
-    text_box_page = TextBoxPage(page)
+    text_box_page = TextBoxPage.navigate(page)
 
     text_box_page.submit_form(
         full_name="John Doe",
@@ -65,3 +64,13 @@ def test_text_box_form_submission(page):
     assert "john@doe.com" in output
     assert "123 Main St" in output
     assert "456 Oak Ave" in output
+
+
+@pytest.mark.smoke
+def test_text_box_deep_link_from_menu_name(page):
+    """
+    Verify that an Elements menu name deep-links to its page object.
+    """
+    text_box_page = ElementsPage(page).go_to(ElementsPage.TEXT_BOX)
+
+    assert isinstance(text_box_page, TextBoxPage)
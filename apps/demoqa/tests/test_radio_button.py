@@ -18,8 +18,8 @@ def test_radio_button_page_opens_from_elements_menu(page):
 
     elements_page.open_radio_button()
 
-    # Page readiness enforced in constructor
-    RadioButtonPage(page)
+    # Fails if the READY_ANCHOR (page header) does not appear
+    RadioButtonPage(page).wait_until_ready()
 
 
 @pytest.mark.smoke
@@ -27,8 +27,7 @@ def test_select_yes_radio_button(page):
     """
     Verify selecting 'Yes' radio button.
     """
-    ElementsPage(page).open_page().open_radio_button()
-    radio_page = RadioButtonPage(page)
+    radio_page = RadioButtonPage.navigate(page)
 
     radio_page.select_yes()
 
@@ -40,8 +39,7 @@ def test_select_impressive_radio_button(page):
     """
     Verify selecting 'Impressive' radio button.
     """
-    ElementsPage(page).open_page().open_radio_button()
-    radio_page = RadioButtonPage(page)
+    radio_page = RadioButtonPage.navigate(page)
 
     radio_page.select_impressive()
 
@@ -53,8 +51,7 @@ def test_no_radio_button_is_disabled(page):
     """
     Verify 'No' radio button cannot be selected.
     """
-    ElementsPage(page).open_page().open_radio_button()
-    radio_page = RadioButtonPage(page)
+    radio_page = RadioButtonPage.navigate(page)
 
     radio_page.select_yes()
     assert radio_page.selected_value() == "Yes"
@@ -18,8 +18,8 @@ def test_slider_page_opens_from_widgets_menu(page):
 
     widgets_page.open_slider()
 
-    # Readiness enforced in constructor
-    SliderPage(page)
+    # Fails if the READY_ANCHOR (page header) does not appear
+    SliderPage(page).wait_until_ready()
 
 
 @pytest.mark.smoke
@@ -28,8 +28,7 @@ def test_set_slider_value(page, value):
     """
     Verify slider can be set to specific values.
     """
-    WidgetsPage(page).open_page().open_slider()
-    slider_page = SliderPage(page)
+    slider_page = SliderPage.navigate(page)
 
     slider_page.set_value(value)
 
@@ -4,18 +4,19 @@ Base page abstraction for SauceDemo application.
 
 from core.base_page import BasePage
 from core.config import Config
+from core.network_cache import get_network_cache
 
 
 class BaseSaucePage(BasePage):
     """Common navigation behavior for SauceDemo pages."""
 
-    def open(self, url: str = ""):
+    def open(self, url: str = "", wait_ready: bool = True):
         """
         Open a SauceDemo page using a relative path.
         """
         base_url = Config.SAUCE_URL.rstrip("/")
         url = url.lstrip("/")
+        get_network_cache().attach(self.page, "saucedemo", url)
 
         url = f"{base_url}/{url}" if url else base_url
-        self.page.goto(url)
-        self.page.wait_for_load_state("domcontentloaded")
+        super().open(url, wait_ready=wait_ready)
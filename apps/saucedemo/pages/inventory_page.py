@@ -6,7 +6,10 @@ from apps.saucedemo.pages.base_sauce_page import BaseSaucePage
 class InventoryPage(BaseSaucePage):
     """SauceDemo inventory screen."""
 
+    URL_PATH = "inventory.html"
+
     TITLE = ".title"
+    READY_ANCHOR = TITLE
     INVENTORY_ITEM = ".inventory_item"
     CART_BADGE = ".shopping_cart_badge"
     CART_LINK = ".shopping_cart_link"
@@ -11,14 +11,15 @@ class LoginPage(BaseSaucePage):
     LOGIN_BTN = '[data-test="login-button"]'
     ERROR = '[data-test="error"]'
 
-    def open(self, url: str = ""):
-        super().open("")  # login is the root page
+    READY_ANCHOR = LOGIN_BTN
+
+    def open(self, url: str = "", wait_ready: bool = True):
+        super().open("", wait_ready=wait_ready)  # login is the root page
         return self
 
     def login(self, username: str, password: str):
         """Login to the application."""
-        self.page.fill(self.USERNAME, username)
-        self.page.fill(self.PASSWORD, password)
+        self.fill_many({self.USERNAME: username, self.PASSWORD: password})
         self.page.click(self.LOGIN_BTN)
 
     def get_error_text(self) -> str:
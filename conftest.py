@@ -10,6 +10,16 @@ On UI test failure (rep.when == "call"):
 - saves Playwright trace zip to: reports/traces/ (if enabled)
 - saves browser console log to: reports/logs/
 - attaches artifacts to Allure (if allure-pytest is installed)
+
+Screenshots and console logs are captured in memory; writing and Allure
+attaching happen on a background writer thread flushed at session finish.
+
+SauceDemo sessions for 'authenticated_page' are logged in once per persona
+(per worker) and restored from a cached storage state afterwards.
+
+Browser contexts come from a per-worker pool of warm contexts that are
+reset between tests instead of being torn down. Each test's context gets
+its app's resource-blocking policy (images, fonts, ads, analytics).
 """
 
 from __future__ import annotations
@@ -26,8 +36,29 @@ try:
 except ImportError:
     allure = None  # type: ignore[assignment]
 
-from playwright.sync_api import Error
+from playwright.sync_api import BrowserContext, Error
+# pytest-playwright's own naming, so artifacts of pooled and plugin contexts match
+from pytest_playwright.pytest_playwright import _build_artifact_test_folder, slugify
+from core.action_timing import get_action_timer
+from core.artifact_writer import ArtifactWriter
+from core.browser_pool import ContextPool
 from core.config import Config
+from core.duration_profiler import DurationProfiler
+from core.logger import clear_log_context, set_log_context, shutdown_logging
+from core.network_cache import get_network_cache
+from core.resource_policy import (
+    ResourceBlocker,
+    ResourcePolicy,
+    ResourceSizeTable,
+)
+from core.storage_state import (
+    StorageStateCache,
+    apply_cookies,
+    restore_local_storage,
+)
+from core.token_cache import get_token_cache
+from core.tracing import TraceRecorder
+from core.transport import WSGITransport, register_transport, unregister_transport
 
 # ------------------------------------------------------------------------------
 # Paths
@@ -38,6 +69,12 @@ SCREENSHOTS_DIR = REPORTS_DIR / "screenshots"
 TRACES_DIR = REPORTS_DIR / "traces"
 LOGS_DIR = REPORTS_DIR / "logs"
 
+# Writes/attaches failure artifacts off the test's hot path (per worker)
+ARTIFACT_WRITER = ArtifactWriter()
+
+# Session-scoped caches reporting hits/misses (per worker), by name
+FIXTURE_CACHES: dict = {"api_token": get_token_cache()}
+
 
 # ------------------------------------------------------------------------------
 # Helpers
@@ -78,6 +115,37 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default="true",
         help="Save Playwright trace zip on failure (true/false). Default: true",
     )
+    parser.addoption(
+        "--trace-mode",
+        action="store",
+        default=Config.TRACE_MODE,
+        choices=TraceRecorder.MODES,
+        help=(
+            "Tracing strategy: off, full (start/stop per test), chunk (per-test "
+            "chunks of a long-lived session), retry (trace reruns only). "
+            f"Default: {Config.TRACE_MODE}"
+        ),
+    )
+    parser.addoption(
+        "--schedule",
+        action="store",
+        default=Config.SCHEDULE,
+        choices=("default", "duration", "affinity"),
+        help=(
+            "xdist work distribution: default (--dist as given), duration "
+            "(longest-first from recorded durations) or affinity (keep each "
+            f"app/persona on one worker). Default: {Config.SCHEDULE}"
+        ),
+    )
+    parser.addoption(
+        "--profile-durations",
+        action="store",
+        default=str(Config.DURATION_PROFILE).lower(),
+        help=(
+            "Record per-phase/per-fixture durations and flag regressions "
+            f"(true/false). Default: {str(Config.DURATION_PROFILE).lower()}"
+        ),
+    )
 
     # Execution modes
     group = parser.getgroup("execution modes")
@@ -97,6 +165,16 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         action="store_true",
         help="Run flaky tests only",
     )
+    group.addoption(
+        "--load",
+        action="store_true",
+        help="Run load tests only (excluded from every other mode)",
+    )
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Run benchmarks only (excluded from every other mode)",
+    )
 
 
 # ------------------------------------------------------------------------------
@@ -109,25 +187,81 @@ def pytest_configure(config: pytest.Config) -> None:
     Apply marker expressions based on custom CLI execution flags.
     """
 
+    config._trace_recorder = TraceRecorder(  # type: ignore[attr-defined]
+        config.getoption("trace_mode")
+    )
+
+    config._cache_stats = {}  # type: ignore[attr-defined]  # worker -> cache -> hits/misses
+
+    if config.getoption("profile_durations").lower() == "true":
+        config.pluginmanager.register(DurationProfiler(config), "duration_profiler")
+
     selected = [
         config.getoption("smoke"),
         config.getoption("full"),
         config.getoption("flaky"),
+        config.getoption("load"),
+        config.getoption("benchmark"),
     ]
 
     if sum(bool(x) for x in selected) > 1:
         raise pytest.UsageError(
-            "Only one execution mode can be selected: --smoke, --full, or --flaky"
+            "Only one execution mode can be selected: "
+            "--smoke, --full, --flaky, --load or --benchmark"
         )
 
+    # Load tests and benchmarks are opt-in (timing-sensitive, live sites)
     if config.getoption("smoke"):
-        config.option.markexpr = "smoke"
+        config.option.markexpr = "smoke and not load and not benchmark"
 
     elif config.getoption("full"):
-        config.option.markexpr = "not flaky"
+        config.option.markexpr = "not flaky and not load and not benchmark"
 
     elif config.getoption("flaky"):
-        config.option.markexpr = "flaky"
+        config.option.markexpr = "flaky and not load and not benchmark"
+
+    elif config.getoption("load"):
+        config.option.markexpr = "load"
+
+    elif config.getoption("benchmark"):
+        config.option.markexpr = "benchmark"
+
+    elif not config.option.markexpr:
+        config.option.markexpr = "not load and not benchmark"
+
+
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_make_scheduler(config: pytest.Config, log):
+    """Use a custom scheduler for --schedule=duration|affinity (xdist only)."""
+    from core.scheduling import AffinityScheduling, DurationScheduling  # requires pytest-xdist
+
+    schedulers = {"duration": DurationScheduling, "affinity": AffinityScheduling}
+    scheduler = schedulers.get(config.getoption("schedule"))
+    return scheduler(config, log) if scheduler else None
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """Collect fixture cache stats published by an xdist worker."""
+    stats = getattr(node, "workeroutput", {}).get("cache_stats")
+    if stats:
+        node.config._cache_stats[node.gateway.id] = stats
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config: pytest.Config) -> None:
+    """Report fixture cache hit rates (per worker and overall)."""
+    stats = getattr(config, "_cache_stats", {})
+    lookups = sum(
+        s["hits"] + s["misses"] for caches in stats.values() for s in caches.values()
+    )
+    if not lookups:
+        return
+
+    from core.scheduling import format_cache_stats
+
+    terminalreporter.section("fixture cache hit rates")
+    for line in format_cache_stats(stats):
+        terminalreporter.write_line(line)
 
 
 # ------------------------------------------------------------------------------
@@ -163,43 +297,41 @@ def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
     # ---- Console log ----
     console_lines = getattr(item, "_console_lines", None)
     if console_lines:
-        LOGS_DIR.mkdir(parents=True, exist_ok=True)
-        log_path = LOGS_DIR / f"{test_id}_{stamp}.txt"
-        log_path.write_text("\n".join(console_lines), encoding="utf-8")
+        console_text = "\n".join(console_lines)
+        ARTIFACT_WRITER.write_text(LOGS_DIR / f"{test_id}_{stamp}.txt", console_text)
 
         if allure is not None:
             allure.attach(
-                "\n".join(console_lines),
+                console_text,
                 name="browser_console_log",
                 attachment_type=allure.attachment_type.TEXT,
             )
 
     # ---- Screenshot ----
     if page is not None:
-        SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
-        shot_path = SCREENSHOTS_DIR / f"{test_id}_{stamp}.png"
         try:
-            page.screenshot(path=str(shot_path), full_page=True)
+            screenshot = page.screenshot(full_page=True)
         except Error:
             pass
         else:
+            ARTIFACT_WRITER.write_bytes(
+                SCREENSHOTS_DIR / f"{test_id}_{stamp}.png", screenshot
+            )
             if allure is not None:
-                allure.attach.file(
-                    str(shot_path),
+                allure.attach(
+                    screenshot,
                     name="failure_screenshot",
                     attachment_type=allure.attachment_type.PNG,
                 )
 
     # ---- Trace ----
+    # The zip is written by the Playwright driver; Allure copies it on this thread
     trace_enabled = item.config.getoption("trace_on_failure").lower() == "true"
     if trace_enabled and context is not None:
         TRACES_DIR.mkdir(parents=True, exist_ok=True)
         trace_path = TRACES_DIR / f"{test_id}_{stamp}.zip"
-        try:
-            context.tracing.stop(path=str(trace_path))
-        except Error:
-            pass
-        else:
+        recorder: TraceRecorder = item.config._trace_recorder  # type: ignore[attr-defined]
+        if recorder.save(context, trace_path):
             if allure is not None:
                 allure.attach.file(
                     str(trace_path),
@@ -209,6 +341,40 @@ def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
                 )
 
 
+# ------------------------------------------------------------------------------
+# Log correlation (nodeid / phase on every record)
+# ------------------------------------------------------------------------------
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item: pytest.Item):
+    set_log_context(item.nodeid, "setup")
+    yield
+    clear_log_context()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    set_log_context(item.nodeid, "call")
+    yield
+    clear_log_context()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: pytest.Item):
+    set_log_context(item.nodeid, "teardown")
+    yield
+    clear_log_context()
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Flush queued failure artifacts, action timings and log records before the session (worker) ends."""
+    ARTIFACT_WRITER.close()
+    get_action_timer().write_report()
+    _publish_cache_stats(session.config)
+    shutdown_logging()
+
+
 # ------------------------------------------------------------------------------
 # UI runtime capture (console + tracing)
 # ------------------------------------------------------------------------------
@@ -221,8 +387,8 @@ def ui_runtime_capture(request: pytest.FixtureRequest):
 
     Responsibilities:
     - Capture browser console + page errors
-    - Start tracing at test start (if enabled)
-    - Stop tracing on success (failure saving handled elsewhere)
+    - Start tracing at test start (if enabled, see --trace-mode)
+    - Discard the trace on success (failure saving handled elsewhere)
     """
 
     is_ui_test = "page" in request.fixturenames or "context" in request.fixturenames
@@ -231,7 +397,11 @@ def ui_runtime_capture(request: pytest.FixtureRequest):
         return
 
     artifacts_enabled = request.config.getoption("artifacts").lower() == "true"
-    trace_enabled = request.config.getoption("trace_on_failure").lower() == "true"
+    # pytest-playwright's --tracing owns the context's tracing when enabled
+    trace_enabled = (
+        request.config.getoption("trace_on_failure").lower() == "true"
+        and request.config.getoption("--tracing") == "off"
+    )
 
     page = request.getfixturevalue("page") if "page" in request.fixturenames else None
     context = (
@@ -261,44 +431,325 @@ def ui_runtime_capture(request: pytest.FixtureRequest):
         page.on("pageerror", on_page_error)
 
     # ---- Tracing ----
+    recorder: TraceRecorder = request.config._trace_recorder  # type: ignore[attr-defined]
     tracing_started = False
     if artifacts_enabled and trace_enabled and context is not None:
-        try:
-            context.tracing.start(screenshots=True, snapshots=True, sources=True)
-            tracing_started = True
-        except Error:
-            pass
+        # pytest-rerunfailures counts attempts (1 = first run)
+        attempt = getattr(request.node, "execution_count", 1)
+        tracing_started = recorder.begin(context, attempt=attempt)
 
     yield
 
-    # Stop trace on success (do not save)
-    if tracing_started and context is not None:
-        rep = getattr(request.node, "rep_call", None)
-        if rep is not None and not rep.failed:
+    # Drop the trace unless the failure hook already saved it
+    if tracing_started and context is not None and recorder.is_recording(context):
+        recorder.discard(context)
+
+
+# ------------------------------------------------------------------------------
+# Browser contexts (warm pool)
+# ------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stub_servers():
+    """
+    Serve SauceDemo, DemoQA and ReqRes from local stand-ins (STUB_SERVER=true).
+
+    Config URLs are pointed at the stand-ins for the session (per worker).
+    With STUB_TRANSPORT=inprocess, sync API clients call the ReqRes
+    stand-in in-process (no sockets); async clients still use its port.
+    """
+    if not Config.STUB_SERVER:
+        yield None
+        return
+
+    from stubs import start_stub_servers
+
+    servers = start_stub_servers()
+    if Config.STUB_TRANSPORT == "inprocess":
+        register_transport(servers["reqres"].url, WSGITransport(servers["reqres"].app))
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Config, "SAUCE_URL", servers["saucedemo"].url)
+        mp.setattr(Config, "DEMOQA_URL", servers["demoqa"].url)
+        mp.setattr(Config, "REQRES_URL", f"{servers['reqres'].url}/api")
+        yield servers
+
+    unregister_transport(servers["reqres"].url)
+    for server in servers.values():
+        server.stop()
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args) -> dict:
+    """Apply framework context options on top of pytest-playwright defaults."""
+    return {**browser_context_args, **Config.get_browser_context_options()}
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, browser_context_args):
+    """Session-wide (per worker) pool of warm browser contexts."""
+    pool = ContextPool(browser, context_options=browser_context_args)
+    pool.warm()
+    FIXTURE_CACHES["context_pool"] = pool
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def resource_sizes() -> ResourceSizeTable:
+    """Session-wide (per worker) table of known response sizes."""
+    return ResourceSizeTable()
+
+
+@pytest.fixture
+def context(request: pytest.FixtureRequest, browser, browser_context_args):
+    """
+    Override pytest-playwright's 'context' with a pooled context.
+
+    The context is reset and returned to the pool only when the test passed;
+    failed or errored tests discard it so no broken state leaks into the
+    next test. Set CONTEXT_POOL=false to get a brand-new context per test.
+
+    The app's resource policy (off unless enabled) is applied for the
+    duration of the test:
+        @pytest.mark.resource_policy(mode="enforce")
+        @pytest.mark.resource_policy(resources=["media"], third_party=True)
+
+    pytest-playwright's --video, --tracing and --screenshot options and
+    @pytest.mark.browser_context_args need a context of their own: when
+    any is used the pool is bypassed and artifacts are written to
+    --output as with the stock fixture.
+    """
+    context_args_marker = request.node.get_closest_marker("browser_context_args")
+    playwright_artifacts = _playwright_artifacts_requested(request.config)
+
+    # Recorded HARs and videos are written on context close: use a fresh context
+    pooled = (
+        Config.CONTEXT_POOL
+        and not get_network_cache().recording
+        and not playwright_artifacts
+        and context_args_marker is None
+    )
+    pool: ContextPool | None = (
+        request.getfixturevalue("context_pool") if pooled else None
+    )
+    if pool is not None:
+        context = pool.acquire()
+    else:
+        context_args = dict(browser_context_args)
+        if context_args_marker is not None:
+            context_args.update(context_args_marker.kwargs)
+        context = browser.new_context(**context_args)
+
+    pages: list = []
+    if playwright_artifacts:
+        _start_playwright_artifacts(request, context, pages)
+
+    blocker = _resource_blocker(request)
+    if blocker is not None:
+        blocker.attach(context)
+
+    yield context
+
+    if blocker is not None:
+        blocker.detach()
+        request.node.user_properties.append(("resource_policy", blocker.stats()))
+
+    if pool is None:
+        if playwright_artifacts:
+            _save_playwright_artifacts(request, context, pages)
+        else:
+            context.close()
+        return
+
+    rep_setup = getattr(request.node, "rep_setup", None)
+    rep_call = getattr(request.node, "rep_call", None)
+    passed = (
+        rep_setup is not None
+        and rep_setup.passed
+        and rep_call is not None
+        and rep_call.passed
+    )
+    pool.release(context, reusable=passed)
+
+
+def _playwright_artifacts_requested(config: pytest.Config) -> bool:
+    """True when pytest-playwright's --video / --tracing / --screenshot is on."""
+    return any(
+        config.getoption(option) != "off"
+        for option in ("--video", "--tracing", "--screenshot")
+    )
+
+
+def _playwright_artifact_path(request: pytest.FixtureRequest, name: str) -> str:
+    """Path under --output, laid out like pytest-playwright's artifacts."""
+    return _build_artifact_test_folder(request.config, request, name)
+
+
+def _start_playwright_artifacts(
+    request: pytest.FixtureRequest, context: BrowserContext, pages: list
+) -> None:
+    """Collect the context's pages and start --tracing (as pytest-playwright does)."""
+    context.on("page", pages.append)
+
+    if request.config.getoption("--tracing") != "off":
+        context.tracing.start(
+            title=slugify(request.node.nodeid),
+            screenshots=True,
+            snapshots=True,
+            sources=True,
+        )
+
+
+def _save_playwright_artifacts(
+    request: pytest.FixtureRequest, context: BrowserContext, pages: list
+) -> None:
+    """Write --tracing / --screenshot / --video artifacts and close the context."""
+    config = request.config
+    rep_call = getattr(request.node, "rep_call", None)
+    failed = rep_call is None or rep_call.failed
+
+    def wanted(option: str, on_failure: str) -> bool:
+        value = config.getoption(option)
+        return value == "on" or (failed and value == on_failure)
+
+    if config.getoption("--tracing") != "off":
+        if wanted("--tracing", "retain-on-failure"):
+            context.tracing.stop(path=_playwright_artifact_path(request, "trace.zip"))
+        else:
+            context.tracing.stop()
+
+    if wanted("--screenshot", "only-on-failure"):
+        status = "failed" if failed else "finished"
+        for index, page in enumerate(pages, start=1):
             try:
-                context.tracing.stop()
+                page.screenshot(
+                    timeout=5000,
+                    path=_playwright_artifact_path(request, f"test-{status}-{index}.png"),
+                    full_page=config.getoption("--full-page-screenshot"),
+                )
             except Error:
                 pass
 
+    # Videos are complete only once the context is closed
+    context.close()
+
+    if wanted("--video", "retain-on-failure"):
+        for page in pages:
+            if not page.video:
+                continue
+            try:
+                name = Path(page.video.path()).name
+                page.video.save_as(_playwright_artifact_path(request, name))
+            except Error:
+                pass  # empty video
+
+
+def _resource_blocker(request: pytest.FixtureRequest) -> ResourceBlocker | None:
+    """Build the resource blocker for a test (None when the policy is off)."""
+    marker = request.node.get_closest_marker("resource_policy")
+    overrides = dict(marker.kwargs) if marker else {}
+
+    app = _app_name(request.node)
+    app_settings = Config.get_resource_policies().get(app or "", {})
+    mode = overrides.pop("mode", app_settings.get("mode", Config.RESOURCE_POLICY))
+    if mode == "off":
+        return None
+
+    policy = ResourcePolicy.for_app(app, overrides)
+    return ResourceBlocker(
+        policy, mode=mode, sizes=request.getfixturevalue("resource_sizes")
+    )
+
+
+def _publish_cache_stats(config: pytest.Config) -> None:
+    """Hand this process' cache hits/misses to the controller (or keep them locally)."""
+    stats = {
+        name: {"hits": cache.hits, "misses": cache.misses}
+        for name, cache in FIXTURE_CACHES.items()
+    }
+
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["cache_stats"] = stats  # type: ignore[attr-defined]
+    else:
+        config._cache_stats[Config.worker_id()] = stats  # type: ignore[attr-defined]
+
+
+def _app_name(item: pytest.Item) -> str | None:
+    """Return the app a test belongs to (apps/<name>/...), if any."""
+    parts = Path(str(item.path)).parts
+    if "apps" in parts:
+        index = parts.index("apps")
+        if index + 1 < len(parts):
+            return parts[index + 1]
+    return None
+
+
+# ------------------------------------------------------------------------------
+# Authenticated SauceDemo sessions
+# ------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def auth_state_cache() -> StorageStateCache:
+    """Session-wide (per worker) cache of SauceDemo storage states."""
+    cache = StorageStateCache()
+    FIXTURE_CACHES["auth_state"] = cache
+    return cache
+
 
 @pytest.fixture
-def authenticated_page(page):
+def authenticated_page(request: pytest.FixtureRequest, page, auth_state_cache):
     """
     Returns a Playwright page with an authenticated SauceDemo session.
 
-    Fails fast if login does not succeed.
+    Persona defaults to "standard"; select another via indirect parametrization:
+        @pytest.mark.parametrize("authenticated_page", ["problem"], indirect=True)
+
+    The cached storage state is injected into the fresh context first.
+    A real UI login happens only when the state is missing, stale or
+    rejected by the app. Fails fast if login does not succeed.
     """
+    persona = getattr(request, "param", "standard")
+    username = Config.get_sauce_personas()[persona]
+
+    inventory_page = InventoryPage(page)
+
+    state = auth_state_cache.load(persona) if Config.AUTH_STATE_CACHE else None
+    if state is not None:
+        apply_cookies(page, state)
+
+        # A rejected session lands on the login form instead of the inventory
+        landed = page.locator(InventoryPage.READY_ANCHOR).or_(
+            page.locator(LoginPage.READY_ANCHOR)
+        )
+        inventory_page.open(InventoryPage.URL_PATH, wait_ready=False)
+        landed.first.wait_for()
+
+        if restore_local_storage(page, state):
+            inventory_page.refresh(wait_ready=False)
+            landed.first.wait_for()
+
+        if inventory_page.is_loaded():
+            return page
+
+        auth_state_cache.invalidate(persona)
+
     login_page = LoginPage(page)
     login_page.open()
 
     login_page.login(
-        username=Config.SAUCE_STANDARD_USER,
+        username=username,
         password=Config.SAUCE_PASSWORD,
     )
 
-    inventory_page = InventoryPage(page)
-
     # Fail fast if login did not succeed
     assert inventory_page.is_loaded(), "Login failed: inventory page not loaded"
 
+    if Config.AUTH_STATE_CACHE:
+        auth_state_cache.save(persona, page.context.storage_state())
+
     return page
@@ -0,0 +1,226 @@
+# core/action_timing.py
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, TypeVar
+
+from core.config import Config
+from core.logger import event_extra, get_log_context, get_logger
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class ActionTiming(NamedTuple):
+    action: str
+    selector: str
+    page: str
+    nodeid: Optional[str]
+    duration: float  # seconds
+    ok: bool
+
+
+class ActionTimer:
+    """
+    In-memory ring buffer of page object action timings (one per worker).
+
+    Responsibilities:
+    - Record duration, selector, page class and test nodeid per action
+    - Keep memory bounded (oldest entries are dropped)
+    - Summarize p50/p95/p99 per action type and per selector
+    - Write the summary report at session end
+
+    Enabled with Config.ACTION_TIMING; recording is a no-op otherwise.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None, size: Optional[int] = None):
+        self.enabled = Config.ACTION_TIMING if enabled is None else enabled
+        self._buffer: Deque[ActionTiming] = deque(
+            maxlen=size or Config.ACTION_TIMING_BUFFER
+        )
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+        self.logger = get_logger(self.__class__.__name__)
+
+    def record(
+        self, action: str, selector: str, page: str, duration: float, ok: bool = True
+    ) -> None:
+        if not self.enabled:
+            return
+
+        entry = ActionTiming(
+            action, selector, page, get_log_context()["nodeid"], duration, ok
+        )
+        with self._lock:
+            self._buffer.append(entry)
+            self.recorded += 1
+
+    def entries(self) -> List[ActionTiming]:
+        with self._lock:
+            return list(self._buffer)
+
+    def summary(self) -> Dict[str, Any]:
+        """Percentiles (ms) per action type and per action + selector."""
+        entries = self.entries()
+
+        by_action: Dict[str, List[float]] = {}
+        by_selector: Dict[str, List[float]] = {}
+        for entry in entries:
+            by_action.setdefault(entry.action, []).append(entry.duration)
+            by_selector.setdefault(f"{entry.action} {entry.selector}", []).append(
+                entry.duration
+            )
+
+        return {
+            "worker": Config.worker_id(),
+            "recorded": self.recorded,
+            "dropped": self.recorded - len(entries),
+            "by_action": {key: _stats(values) for key, values in by_action.items()},
+            "by_selector": {
+                key: _stats(values) for key, values in by_selector.items()
+            },
+        }
+
+    def write_report(self, path: Optional[Path] = None) -> Optional[Path]:
+        """Write the summary (per worker) and return its path; None if nothing recorded."""
+        if not self.enabled or not self.recorded:
+            return None
+
+        path = Path(path or Config.worker_path(Config.ACTION_TIMING_REPORT))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+        self.logger.info("Action timings written | %s | actions=%s", path, self.recorded)
+        return path
+
+
+_timer: Optional[ActionTimer] = None
+
+
+def get_action_timer() -> ActionTimer:
+    """Return the process-wide (per worker) ActionTimer."""
+    global _timer
+    if _timer is None:
+        _timer = ActionTimer()
+    return _timer
+
+
+def timed_action(name: Optional[str] = None, with_selector: bool = True) -> Callable[[F], F]:
+    """
+    Time a page object method (first argument is treated as the selector).
+
+    with_selector=False records no selector (for methods whose arguments
+    are test data, e.g. add_item_to_cart("Backpack")).
+
+    Records into the ActionTimer when enabled and emits a DEBUG "ui.action"
+    record; otherwise the method is called directly.
+
+    Nested actions are recorded separately (click includes its
+    wait_for_visible).
+
+    Usage:
+        @timed_action()
+        def add_item_to_cart(self, item_name: str): ...
+    """
+
+    def decorator(func: F) -> F:
+        action = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            timer = get_action_timer()
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            if not (timer.enabled or debug):
+                return func(self, *args, **kwargs)
+
+            start = time.perf_counter()
+            ok = False
+            try:
+                result = func(self, *args, **kwargs)
+                ok = True
+                return result
+            finally:
+                duration = time.perf_counter() - start
+                selector = _selector(args, kwargs) if with_selector else ""
+                page = self.__class__.__name__
+                timer.record(action, selector, page, duration, ok)
+
+                if debug:
+                    self.logger.debug(
+                        "%s | selector=%s | %.3fs",
+                        action,
+                        selector,
+                        duration,
+                        extra=event_extra(
+                            "ui.action",
+                            page=page,
+                            action=action,
+                            selector=selector,
+                            duration_ms=round(duration * 1000, 3),
+                            ok=ok,
+                        ),
+                    )
+
+        wrapper.__timed_action__ = action  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def time_page_actions(cls: type) -> None:
+    """
+    Wrap the public methods a page object class defines with timed_action.
+
+    Page object actions (LoginPage.login, CheckBoxPage.select, ...) often
+    call Playwright directly instead of the timed BasePage primitives; this
+    records them too. Overrides of already-timed methods (e.g. open) are
+    left alone, the base implementation records them.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        if any(_is_timed(getattr(base, attr, None)) for base in cls.__mro__):
+            continue
+        setattr(cls, attr, timed_action(attr, with_selector=False)(value))
+
+
+def _is_timed(func: Any) -> bool:
+    return hasattr(func, "__timed_action__")
+
+
+def _selector(args: tuple, kwargs: dict) -> str:
+    target = args[0] if args else kwargs.get("selector", kwargs.get("url", ""))
+    if isinstance(target, dict):
+        return ",".join(str(key) for key in target)
+    return target if isinstance(target, str) else ""
+
+
+def _stats(durations: List[float]) -> Dict[str, float]:
+    values = sorted(durations)
+    return {
+        "count": len(values),
+        "total_ms": round(sum(values) * 1000, 3),
+        "p50_ms": _percentile(values, 50),
+        "p95_ms": _percentile(values, 95),
+        "p99_ms": _percentile(values, 99),
+        "max_ms": round(values[-1] * 1000, 3),
+    }
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile in milliseconds."""
+    rank = max(math.ceil(len(sorted_values) * pct / 100), 1)
+    return round(sorted_values[rank - 1] * 1000, 3)
@@ -2,14 +2,153 @@
 
 from __future__ import annotations
 
+import logging
+import reprlib
+import socket
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional
+from urllib.parse import urljoin
 
 import requests
 from requests import Response, Session
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import RequestHistory, Retry
 
 from core.config import Config
-from core.logger import get_logger
+from core.logger import event_extra, get_logger
+from core.transport import registered_transports
+
+
+# Methods safe to retry automatically (POST is not idempotent)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class LazyPayload:
+    """
+    Log argument rendered only if the record is emitted, capped in size.
+
+    Accepts a value or a zero-arg callable (e.g. lambda: response.text).
+    """
+
+    __slots__ = ("_value", "_limit")
+
+    def __init__(self, value: Any, limit: Optional[int] = None):
+        self._value = value
+        self._limit = Config.API_LOG_BODY_LIMIT if limit is None else limit
+
+    def __str__(self) -> str:
+        try:
+            value = self._value() if callable(self._value) else self._value
+        except Exception:
+            return "<unreadable>"
+
+        if isinstance(value, str):
+            if self._limit and len(value) > self._limit:
+                return f"{value[: self._limit]}... [truncated {len(value) - self._limit} chars]"
+            return value
+
+        if not self._limit:
+            return repr(value)
+
+        # Bounded render: large payloads are never repr()-ed in full
+        text = _bounded_repr(self._limit).repr(value)
+        if len(text) > self._limit:
+            return f"{text[: self._limit]}... [truncated]"
+        return text
+
+
+def _bounded_repr(limit: int) -> reprlib.Repr:
+    """reprlib.Repr whose output stays close to limit chars."""
+    bounded = reprlib.Repr()
+    bounded.maxlevel = 4
+    bounded.maxstring = bounded.maxother = limit
+    # Enough items to fill the limit, even for tiny ones ("1, ")
+    bounded.maxlist = bounded.maxtuple = bounded.maxdict = bounded.maxset = max(limit // 3, 1)
+    bounded.maxfrozenset = bounded.maxdeque = bounded.maxarray = bounded.maxlist
+    return bounded
+
+
+def log_request(logger: logging.Logger, method: str, url: str, kwargs: dict) -> None:
+    """DEBUG log of an outgoing request (payloads rendered lazily)."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "➡️ %s %s | params=%s | json=%s",
+            method,
+            url,
+            LazyPayload(kwargs.get("params")),
+            LazyPayload(kwargs.get("json")),
+        )
+
+
+def log_response(
+    logger: logging.Logger,
+    method: str,
+    url: str,
+    status: int,
+    elapsed: float,
+    body: Callable[[], str],
+) -> None:
+    """INFO log of a response; body only at DEBUG (rendered lazily)."""
+    logger.info(
+        "⬅️ %s %s | status=%s | %.2fs",
+        method,
+        url,
+        status,
+        elapsed,
+        extra=event_extra(
+            "api.response",
+            method=method,
+            url=url,
+            status=status,
+            duration_ms=round(elapsed * 1000, 3),
+        ),
+    )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response body: %s", LazyPayload(body))
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keep-alive on pooled connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        if Config.API_TCP_KEEPALIVE:
+            options = list(HTTPConnection.default_socket_options)
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            kwargs["socket_options"] = options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def build_retry(
+    total: Optional[int] = None, backoff: Optional[float] = None
+) -> Retry:
+    """
+    Retry policy from Config.
+
+    Connection errors and transient statuses (Config.API_RETRY_STATUSES)
+    are retried with exponential backoff for idempotent methods only;
+    Retry-After headers (429/503) are honored.
+    """
+    return Retry(
+        total=Config.API_RETRY_COUNT if total is None else total,
+        backoff_factor=Config.API_RETRY_DELAY if backoff is None else backoff,
+        status_forcelist=Config.API_RETRY_STATUSES,
+        allowed_methods=IDEMPOTENT_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # return the last response, tests assert on it
+    )
+
+
+def backoff_delay(retry: Retry, attempt: int) -> float:
+    """
+    Seconds urllib3 waits before retry number `attempt` (1-based) of `retry`.
+
+    Lets clients that retry by hand (AsyncAPIClient) follow the same
+    schedule as build_retry().
+    """
+    history = (RequestHistory(None, None, None, None, None),) * attempt
+    return retry.new(history=history).get_backoff_time()
 
 
 class APIClient:
@@ -17,10 +156,13 @@ class APIClient:
     Thin HTTP client abstraction for API testing.
 
     Responsibilities:
-    - Manage HTTP session lifecycle
+    - Manage HTTP session lifecycle (pooled keep-alive connections)
+    - Route requests through pluggable transports (e.g. in-process WSGI)
+    - Retry transient failures of idempotent requests
     - Centralize base URL, headers, timeout
     - Log requests and responses
     - Return raw Response objects (no assertions)
+    - Stream records of paginated list endpoints lazily
 
     NOT responsible for:
     - Test assertions
@@ -33,6 +175,9 @@ class APIClient:
         base_url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
+        retries: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        transport: Optional[BaseAdapter] = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout or Config.API_TIMEOUT
@@ -40,12 +185,38 @@ class APIClient:
         self.session: Session = requests.Session()
         self.session.headers.update(headers or {})
 
+        pool_maxsize = pool_maxsize or Config.API_POOL_MAXSIZE
+        adapter = KeepAliveAdapter(
+            pool_connections=Config.API_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize,
+            pool_block=Config.API_POOL_BLOCK,
+            max_retries=build_retry(total=retries),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Longest prefix wins: transports take over their URLs only
+        transports = registered_transports()
+        if transport is not None:
+            transports[self.base_url] = transport
+        for prefix, prefix_adapter in transports.items():
+            self.session.mount(prefix, prefix_adapter)
+
         self.logger = get_logger(self.__class__.__name__)
 
         self.logger.info(
-            f"APIClient initialized | base_url={self.base_url}, timeout={self.timeout}s"
+            "APIClient initialized | base_url=%s, timeout=%ss, pool_maxsize=%s, retries=%s, transport=%s",
+            self.base_url,
+            self.timeout,
+            pool_maxsize,
+            adapter.max_retries.total,
+            type(self.session.get_adapter(self.base_url + "/")).__name__,
         )
 
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
     # ------------------------------------------------------------------
     # Public HTTP methods
     # ------------------------------------------------------------------
@@ -62,6 +233,64 @@ class APIClient:
     def delete(self, path: str, **kwargs) -> Response:
         return self._request("DELETE", path, **kwargs)
 
+    def request(self, method: str, path: str, **kwargs) -> Response:
+        return self._request(method.upper(), path, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Pagination
+    # ------------------------------------------------------------------
+
+    def paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        items_key: str = "data",
+        page_param: str = "page",
+        **kwargs,
+    ) -> Iterator[Any]:
+        """
+        Yield the records of a paginated GET endpoint, one page at a time.
+
+        The next page comes from Link rel="next" headers when the API sends
+        them (a page without one is the last), otherwise from the body's
+        page/total_pages. Only the current page is
+        held in memory, and the next page is requested only when its first
+        record is needed: stop iterating (or raise) to stop fetching.
+
+        Non-2xx responses raise requests.HTTPError.
+
+        Usage:
+            for user in client.paginate("/users", params={"per_page": 100}):
+                ...
+        """
+        params = dict(params or {})
+        page = int(params.get(page_param, 1))
+        linked = False  # Link headers seen: they alone drive pagination
+
+        while True:
+            response = self._request("GET", path, params=params, **kwargs)
+            response.raise_for_status()
+
+            body = response.json()
+            items = (body.get(items_key) or []) if isinstance(body, dict) else body
+            next_link = response.links.get("next", {}).get("url")
+
+            yield from items
+
+            if next_link:
+                next_url = urljoin(response.url, next_link)
+                if not next_url.startswith(self.base_url):
+                    raise ValueError(f"Next page outside base URL: {next_url}")
+                path, params = next_url[len(self.base_url) :], {}
+                linked = True
+            elif linked:
+                return
+            elif isinstance(body, dict) and page < int(body.get("total_pages") or 0):
+                page += 1
+                params[page_param] = page
+            else:
+                return
+
     # ------------------------------------------------------------------
     # Internal request handler
     # ------------------------------------------------------------------
@@ -71,27 +300,24 @@ class APIClient:
 
         timeout = kwargs.pop("timeout", self.timeout)
 
-        self.logger.debug(
-            f"➡️ {method} {url} | params={kwargs.get('params')} | json={kwargs.get('json')}"
-        )
+        log_request(self.logger, method, url, kwargs)
 
-        start = time.time()
+        start = time.perf_counter()
         response = self.session.request(
             method=method,
             url=url,
             timeout=timeout,
             **kwargs,
         )
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
-        self.logger.info(
-            f"⬅️ {method} {url} | status={response.status_code} | {elapsed:.2f}s"
+        log_response(
+            self.logger,
+            method,
+            url,
+            response.status_code,
+            elapsed,
+            lambda: response.text,
         )
 
-        if self.logger.isEnabledFor(10):  # DEBUG
-            try:
-                self.logger.debug(f"Response body: {response.text}")
-            except Exception:
-                self.logger.debug("Response body could not be read")
-
         return response
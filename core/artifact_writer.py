@@ -0,0 +1,118 @@
+# core/artifact_writer.py
+
+from __future__ import annotations
+
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from core.config import Config
+from core.logger import get_logger
+
+_STOP = object()
+
+
+class ArtifactWriter:
+    """
+    Background writer for failure artifacts (one thread per worker).
+
+    Responsibilities:
+    - Take ownership of artifact bytes captured in memory by test hooks
+    - Write them to reports/ off the test's hot path
+    - Apply back-pressure through a bounded queue
+    - Flush deterministically when the session finishes
+
+    Only these reports/ writes are deferred. Allure attachments are not
+    handled here: allure.attach must run on the test's thread (Allure
+    tracks the current test per thread), so hooks call it directly.
+
+    With Config.ASYNC_ARTIFACTS disabled every job runs inline.
+    """
+
+    def __init__(self, max_queue: Optional[int] = None, enabled: Optional[bool] = None):
+        self.enabled = Config.ASYNC_ARTIFACTS if enabled is None else enabled
+        self._queue: "queue.Queue[Any]" = queue.Queue(
+            maxsize=Config.ARTIFACT_QUEUE_SIZE if max_queue is None else max_queue
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self.written = 0
+        self.failed = 0
+
+        self.logger = get_logger(self.__class__.__name__)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> None:
+        """Queue a job (blocks while the queue is full)."""
+        if not self.enabled:
+            self._run(func, args, kwargs)
+            return
+
+        self._ensure_started()
+        self._queue.put((func, args, kwargs))
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        self.submit(_write_bytes, Path(path), data)
+
+    def write_text(self, path: Path, text: str) -> None:
+        self.submit(_write_bytes, Path(path), text.encode("utf-8"))
+
+    def flush(self) -> None:
+        """Block until every queued job has been processed."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending jobs and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+        self.logger.debug(
+            "Artifact writer closed | written=%s | failed=%s", self.written, self.failed
+        )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="artifact-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is _STOP:
+                    return
+                func, args, kwargs = job
+                self._run(func, args, kwargs)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, func: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        try:
+            func(*args, **kwargs)
+        except Exception as exc:
+            self.failed += 1
+            self.logger.warning("Artifact job failed | %s", exc)
+        else:
+            self.written += 1
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
@@ -0,0 +1,217 @@
+# core/async_api_client.py
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, TypeVar
+
+import httpx
+from httpx import Response
+
+from core.api_client import (
+    IDEMPOTENT_METHODS,
+    APIClient,
+    backoff_delay,
+    build_retry,
+    log_request,
+    log_response,
+)
+from core.config import Config
+from core.logger import get_logger
+
+
+T = TypeVar("T")
+
+
+class AsyncAPIClient:
+    """
+    asyncio counterpart of APIClient (same get/post/put/delete surface).
+
+    Responsibilities:
+    - Manage an httpx.AsyncClient (pooled keep-alive connections)
+    - Centralize base URL, headers, timeout (shared with APIClient)
+    - Retry transient failures of idempotent requests (same policy as APIClient)
+    - Run fan-out requests with bounded concurrency (gather)
+    - Log requests and responses
+
+    NOT responsible for:
+    - Test assertions
+    - Schema validation
+    - Owning the event loop (see the run_async fixture)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        retries: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout or Config.API_TIMEOUT
+        self.retries = Config.API_RETRY_COUNT if retries is None else retries
+        # Status retries sleep on APIClient's urllib3 schedule (API_RETRY_DELAY)
+        self.retry = build_retry(total=self.retries)
+        self.concurrency = concurrency or Config.API_ASYNC_CONCURRENCY
+
+        pool_maxsize = pool_maxsize or Config.API_POOL_MAXSIZE
+        self.session = httpx.AsyncClient(
+            headers=headers or {},
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize,
+            ),
+            # Connection-level retries (connect errors); status retries below
+            transport=httpx.AsyncHTTPTransport(retries=self.retries),
+        )
+
+        self.logger = get_logger(self.__class__.__name__)
+
+        self.logger.info(
+            "AsyncAPIClient initialized | base_url=%s, timeout=%ss, concurrency=%s",
+            self.base_url,
+            self.timeout,
+            self.concurrency,
+        )
+
+    @classmethod
+    def from_client(cls, client: APIClient, **kwargs) -> "AsyncAPIClient":
+        """Build an async client sharing a sync client's base URL, headers, timeout."""
+        return cls(
+            client.base_url,
+            headers=dict(client.session.headers),
+            timeout=client.timeout,
+            **kwargs,
+        )
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    # ------------------------------------------------------------------
+    # Public HTTP methods
+    # ------------------------------------------------------------------
+
+    async def get(self, path: str, **kwargs) -> Response:
+        return await self._request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> Response:
+        return await self._request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> Response:
+        return await self._request("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> Response:
+        return await self._request("DELETE", path, **kwargs)
+
+    async def request(self, method: str, path: str, **kwargs) -> Response:
+        return await self._request(method.upper(), path, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Fan-out helper
+    # ------------------------------------------------------------------
+
+    async def gather(
+        self, requests: Iterable[Awaitable[T]], limit: Optional[int] = None
+    ) -> List[T]:
+        """
+        Await request coroutines with at most `limit` in flight.
+
+        Results keep the input order. The first exception is raised once the
+        other requests (in flight or still queued) have been cancelled.
+        """
+        semaphore = asyncio.Semaphore(limit or self.concurrency)
+
+        async def bounded(request: Awaitable[T]) -> T:
+            try:
+                async with semaphore:
+                    return await request
+            finally:
+                # Cancelled while queued: never started, close it silently
+                if inspect.iscoroutine(request):
+                    request.close()
+
+        tasks = [asyncio.ensure_future(bounded(r)) for r in requests]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    # ------------------------------------------------------------------
+    # Internal request handler
+    # ------------------------------------------------------------------
+
+    async def _request(self, method: str, path: str, **kwargs) -> Response:
+        url = f"{self.base_url}{path}"
+
+        timeout = kwargs.pop("timeout", self.timeout)
+
+        log_request(self.logger, method, url, kwargs)
+
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            response = await self.session.request(
+                method=method,
+                url=url,
+                timeout=timeout,
+                **kwargs,
+            )
+
+            if (
+                method not in IDEMPOTENT_METHODS
+                or response.status_code not in Config.API_RETRY_STATUSES
+                or attempt >= self.retries
+            ):
+                break
+
+            attempt += 1
+            delay = _retry_after(response)
+            if delay is None:
+                delay = backoff_delay(self.retry, attempt)
+            self.logger.debug(
+                "↻ %s %s | status=%s | retry %s/%s in %.2fs",
+                method,
+                url,
+                response.status_code,
+                attempt,
+                self.retries,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+        elapsed = time.perf_counter() - start
+
+        log_response(
+            self.logger,
+            method,
+            url,
+            response.status_code,
+            elapsed,
+            lambda: response.text,
+        )
+
+        return response
+
+
+def _retry_after(response: Response) -> Optional[float]:
+    """Return Retry-After delay in seconds (numeric form only)."""
+    value: Any = response.headers.get("retry-after")
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        return None
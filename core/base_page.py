@@ -5,43 +5,144 @@ Common UI actions and safe wrappers around Playwright Page API.
 All page objects must inherit from this class.
 """
 
+import time
+from typing import Dict
+
 from playwright.sync_api import Page, expect
 
+from core.action_timing import time_page_actions, timed_action
+from core.config import Config
+from core.logger import event_extra, get_logger
+
+
+# Sets values of plain <input>/<textarea> elements through the native value
+# setter (so React & co. see the change) and fires input/change events.
+# Returns selectors it could not handle (missing, disabled, non-standard).
+_FILL_MANY_JS = """
+fields => {
+    const skipped = [];
+    for (const [selector, value] of fields) {
+        let el = null;
+        try { el = document.querySelector(selector); } catch (e) {}
+
+        const isInput = el instanceof HTMLInputElement
+            && !["checkbox", "radio", "file", "range"].includes(el.type);
+        const isTextArea = el instanceof HTMLTextAreaElement;
+        if (!(isInput || isTextArea) || el.disabled || el.readOnly) {
+            skipped.push(selector);
+            continue;
+        }
+
+        const proto = isInput ? HTMLInputElement.prototype : HTMLTextAreaElement.prototype;
+        el.focus();
+        Object.getOwnPropertyDescriptor(proto, "value").set.call(el, value);
+        el.dispatchEvent(new Event("input", { bubbles: true }));
+        el.dispatchEvent(new Event("change", { bubbles: true }));
+        el.blur();
+    }
+    return skipped;
+}
+"""
+
 
 class BasePage:
     """Base class for all UI page objects."""
 
+    # Selector that proves the page is usable (e.g. PAGE_HEADER, TITLE).
+    # Pages without one fall back to waiting for "domcontentloaded".
+    READY_ANCHOR: str | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Page object actions are timed like the primitives below
+        time_page_actions(cls)
+
     def __init__(self, page: Page):
         self.page = page
+        self.time_to_ready: float | None = None
+        self.logger = get_logger(self.__class__.__name__)
 
     # -------------------------
     # Navigation
     # -------------------------
 
-    def open(self, url: str):
-        """Navigate to a full URL."""
-        self.page.goto(url)
-        self.page.wait_for_load_state("domcontentloaded")
-
-    def refresh(self):
+    @timed_action()
+    def open(self, url: str, wait_ready: bool = True):
+        """
+        Navigate to a full URL.
+
+        Navigation returns as soon as it commits; readiness is then decided
+        by READY_ANCHOR instead of a document load state.
+        """
+        start = time.perf_counter()
+        self.page.goto(url, wait_until="commit")
+        if wait_ready:
+            self.wait_until_ready(start)
+
+    @timed_action()
+    def refresh(self, wait_ready: bool = True):
         """Refresh current page."""
-        self.page.reload()
-        self.page.wait_for_load_state("domcontentloaded")
+        start = time.perf_counter()
+        self.page.reload(wait_until="commit")
+        if wait_ready:
+            self.wait_until_ready(start)
+
+    def wait_until_ready(self, start: float | None = None):
+        """
+        Wait for the readiness anchor and record time-to-ready.
+
+        start is a time.perf_counter() value taken before navigating.
+        """
+        start = time.perf_counter() if start is None else start
+
+        if self.READY_ANCHOR:
+            self.wait_for_visible(self.READY_ANCHOR, timeout=Config.LONG_TIMEOUT)
+        else:
+            self.page.wait_for_load_state("domcontentloaded")
+
+        self.time_to_ready = time.perf_counter() - start
+        self.logger.debug(
+            "Page ready | url=%s | %.2fs",
+            self.page.url,
+            self.time_to_ready,
+            extra=event_extra(
+                "ui.ready",
+                page=self.__class__.__name__,
+                url=self.page.url,
+                duration_ms=round(self.time_to_ready * 1000, 3),
+            ),
+        )
 
     # -------------------------
     # Element actions
     # -------------------------
 
+    @timed_action()
     def click(self, selector: str):
         """Click element after ensuring it is visible."""
         self.wait_for_visible(selector)
         self.page.click(selector)
 
+    @timed_action()
     def fill(self, selector: str, value: str):
         """Fill input field safely."""
         self.wait_for_visible(selector)
         self.page.fill(selector, value)
 
+    @timed_action()
+    def fill_many(self, fields: Dict[str, str]):
+        """
+        Fill several inputs in a single browser round-trip.
+
+        Standard text inputs/textareas are set in one evaluate call; any
+        field it cannot handle falls back to a regular page.fill.
+        """
+        skipped = self.page.evaluate(_FILL_MANY_JS, list(fields.items()))
+
+        for selector in skipped:
+            self.page.fill(selector, fields[selector])
+
+    @timed_action()
     def type(self, selector: str, value: str):
         """Type text with keyboard simulation."""
         self.wait_for_visible(selector)
@@ -51,14 +152,17 @@ class BasePage:
     # Waiting helpers
     # -------------------------
 
+    @timed_action()
     def wait_for_visible(self, selector: str, timeout: int = 5000):
         """Wait until element becomes visible."""
         self.page.wait_for_selector(selector, state="visible", timeout=timeout)
 
+    @timed_action()
     def wait_for_hidden(self, selector: str, timeout: int = 5000):
         """Wait until element disappears."""
         self.page.wait_for_selector(selector, state="hidden", timeout=timeout)
 
+    @timed_action()
     def wait_for_url(self, url_part: str, timeout: int = 5000):
         """Wait until URL contains given value."""
         self.page.wait_for_url(f"**{url_part}**", timeout=timeout)
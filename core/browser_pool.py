@@ -0,0 +1,229 @@
+# core/browser_pool.py
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Browser, BrowserContext, Error
+
+from core.config import Config
+from core.logger import get_logger
+
+
+class ContextPool:
+    """
+    Per-worker pool of warm Playwright browser contexts.
+
+    Responsibilities:
+    - Pre-create N contexts with the configured context options
+    - Hand out an idle context per test (hit) or create one on demand (miss)
+    - Reset released contexts (pages, cookies, storage, permissions, routes)
+    - Track the origins each context navigated to, so their storage
+      (localStorage, IndexedDB, service workers, Cache API) can be wiped
+    - Track hit/miss counts and time spent resetting
+
+    NOT responsible for:
+    - Tracing / console capture (handled by conftest fixtures)
+    - Deciding whether a test left its context in a reusable state
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        size: Optional[int] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+    ):
+        self.browser = browser
+        self.size = Config.CONTEXT_POOL_SIZE if size is None else size
+        self.context_options = (
+            Config.get_browser_context_options()
+            if context_options is None
+            else context_options
+        )
+
+        self._idle: List[BrowserContext] = []
+        self._origins: Dict[BrowserContext, Set[str]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.resets = 0
+        self.discards = 0
+        self.reset_time = 0.0
+
+        self.logger = get_logger(self.__class__.__name__)
+
+    def warm(self) -> None:
+        """Fill the pool up to its size with fresh contexts."""
+        while len(self._idle) < self.size:
+            self._idle.append(self._new_context())
+
+        self.logger.debug("Context pool warmed | size=%s", self.size)
+
+    def acquire(self) -> BrowserContext:
+        """Return an idle context, or a new one when the pool is empty."""
+        if self._idle:
+            self.hits += 1
+            return self._idle.pop()
+
+        self.misses += 1
+        return self._new_context()
+
+    def release(self, context: BrowserContext, reusable: bool = True) -> None:
+        """
+        Give a context back to the pool.
+
+        The context is reset and kept when it is reusable and the pool has
+        room; otherwise it is closed.
+        """
+        if reusable and len(self._idle) < self.size and self._reset(context):
+            self._idle.append(context)
+            return
+
+        self.discards += 1
+        self._close(context)
+
+    def close(self) -> None:
+        """Close all idle contexts and log pool metrics."""
+        while self._idle:
+            self._close(self._idle.pop())
+
+        self.logger.info(
+            "Context pool closed | hits=%s | misses=%s | resets=%s | discards=%s "
+            "| avg_reset=%.3fs",
+            self.hits,
+            self.misses,
+            self.resets,
+            self.discards,
+            self.reset_time / self.resets if self.resets else 0.0,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool metrics (useful for reports and benchmarks)."""
+        return {
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "resets": self.resets,
+            "discards": self.discards,
+            "reset_time": self.reset_time,
+        }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _new_context(self) -> BrowserContext:
+        context = self.browser.new_context(**self.context_options)
+
+        origins: Set[str] = set()
+        self._origins[context] = origins
+
+        def track(request) -> None:
+            # Documents of pages, popups and iframes: every origin that may
+            # have written storage in this context
+            if request.is_navigation_request():
+                parts = urlsplit(request.url)
+                if parts.scheme in ("http", "https"):
+                    origins.add(f"{parts.scheme}://{parts.netloc}")
+
+        context.on("request", track)
+        return context
+
+    def _reset(self, context: BrowserContext) -> bool:
+        """Wipe per-test state. Returns False when the context is unusable."""
+        start = time.time()
+
+        try:
+            if not self._clear_storage(context):
+                return False
+
+            for page in context.pages:
+                page.close()
+
+            context.clear_cookies()
+            context.clear_permissions()
+            context.unroute_all(behavior="ignoreErrors")
+            context.set_extra_http_headers({})
+            context.set_geolocation(None)
+            context.set_offline(False)
+        except Error as exc:
+            self.logger.debug("Context reset failed, discarding | %s", exc)
+            return False
+        finally:
+            self.reset_time += time.time() - start
+
+        self.resets += 1
+        return True
+
+    def _clear_storage(self, context: BrowserContext) -> bool:
+        """
+        Wipe origin storage of every origin the context navigated to.
+
+        Chromium clears any origin through CDP, whether or not a page of it
+        is still open. Other browsers can only be cleared from a page of the
+        origin, so a context that visited an origin with no open page left
+        is reported as not clearable (and gets discarded).
+        """
+        origins = self._origins.get(context, set())
+
+        if self.browser.browser_type.name == "chromium":
+            if not origins:
+                return True
+            page = context.pages[0] if context.pages else context.new_page()
+            cdp = context.new_cdp_session(page)
+            try:
+                for origin in origins:
+                    cdp.send(
+                        "Storage.clearDataForOrigin",
+                        {"origin": origin, "storageTypes": "all"},
+                    )
+            finally:
+                cdp.detach()
+            origins.clear()
+            return True
+
+        for page in context.pages:
+            parts = urlsplit(page.url)
+            if parts.scheme not in ("http", "https"):
+                continue
+            page.evaluate(_CLEAR_PAGE_STORAGE)
+            origins.discard(f"{parts.scheme}://{parts.netloc}")
+
+        if origins:
+            self.logger.debug(
+                "Context visited origins without an open page, discarding | %s",
+                sorted(origins),
+            )
+            return False
+        return True
+
+    def _close(self, context: BrowserContext) -> None:
+        self._origins.pop(context, None)
+        try:
+            context.close()
+        except Error:
+            pass
+
+
+# Clears the storage of the page's own origin (non-Chromium fallback)
+_CLEAR_PAGE_STORAGE = """async () => {
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+    try {
+        const dbs = await indexedDB.databases();
+        await Promise.all(dbs.map(db => new Promise(resolve => {
+            const req = indexedDB.deleteDatabase(db.name);
+            req.onsuccess = req.onerror = req.onblocked = resolve;
+        })));
+    } catch (e) {}
+    try {
+        const regs = await navigator.serviceWorker.getRegistrations();
+        await Promise.all(regs.map(reg => reg.unregister()));
+    } catch (e) {}
+    try {
+        const keys = await caches.keys();
+        await Promise.all(keys.map(key => caches.delete(key)));
+    } catch (e) {}
+}"""
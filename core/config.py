@@ -40,6 +40,12 @@ class Config:
     # API Systems Under Test
     REQRES_URL = os.getenv("REQRES_URL", "https://reqres.in/api")
 
+    # Local stand-in servers (stubs/) replace the URLs above for the session
+    STUB_SERVER = os.getenv("STUB_SERVER", "false").lower() == "true"
+    STUB_HOST = os.getenv("STUB_HOST", "127.0.0.1")
+    # ReqRes transport for sync API clients: socket (local TCP) or inprocess (WSGI, no sockets)
+    STUB_TRANSPORT = os.getenv("STUB_TRANSPORT", "socket").lower()
+
     # ============================================================================
     # Test Credentials
     # ============================================================================
@@ -76,19 +82,79 @@ class Config:
     LOGS_DIR = REPORTS_DIR / "logs"
     VIDEOS_DIR = REPORTS_DIR / "videos"
 
+    # Local caches reused across runs (auth state, recordings, history)
+    CACHE_DIR = Path(os.getenv("CACHE_DIR", ".cache"))
+
     # Artifact behavior
     SCREENSHOT_ON_FAILURE = os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
     TRACE_ON_FAILURE = os.getenv("TRACE_ON_FAILURE", "false").lower() == "true"
+    # retry: first attempts are never traced (without --reruns: no tracing)
+    TRACE_MODE = os.getenv("TRACE_MODE", "retry").lower()  # off, full, chunk, retry
     VIDEO_ON_FAILURE = os.getenv("VIDEO_ON_FAILURE", "false").lower() == "true"
 
     # Screenshot settings
     SCREENSHOT_FULL_PAGE = True  # Capture entire page vs viewport only
 
+    # Failure artifacts are written by a background thread (per worker)
+    ASYNC_ARTIFACTS = os.getenv("ASYNC_ARTIFACTS", "true").lower() == "true"
+    ARTIFACT_QUEUE_SIZE = int(os.getenv("ARTIFACT_QUEUE_SIZE", "64"))
+
     # ============================================================================
     # Test Execution Settings
     # ============================================================================
     # Parallel execution
     WORKERS = int(os.getenv("PYTEST_WORKERS", "1"))  # For pytest-xdist
+    SCHEDULE = os.getenv("SCHEDULE", "default").lower()  # default, duration, affinity
+
+    # Tests using these fixtures are kept together on a worker (warm state)
+    SCHEDULE_GROUP_FIXTURES = [
+        f.strip()
+        for f in os.getenv("SCHEDULE_GROUP_FIXTURES", "authenticated_page").split(",")
+        if f.strip()
+    ]
+    SCHEDULE_DEFAULT_DURATION = float(os.getenv("SCHEDULE_DEFAULT_DURATION", "1.0"))
+
+    # Authentication state cache (log in once per persona, per worker)
+    AUTH_STATE_CACHE = os.getenv("AUTH_STATE_CACHE", "true").lower() == "true"
+    AUTH_STATE_DIR = CACHE_DIR / "auth"
+    AUTH_STATE_TTL = int(os.getenv("AUTH_STATE_TTL", "1800"))  # seconds
+
+    # Browser context pool (warm contexts reused across tests, per worker)
+    CONTEXT_POOL = os.getenv("CONTEXT_POOL", "true").lower() == "true"
+    CONTEXT_POOL_SIZE = int(os.getenv("CONTEXT_POOL_SIZE", "2"))
+
+    # Network record/replay (HAR files per app page)
+    NETWORK_CACHE = os.getenv("NETWORK_CACHE", "off").lower()  # off, record, replay
+    NETWORK_CACHE_SCOPE = os.getenv("NETWORK_CACHE_SCOPE", "assets")  # assets, all
+    HAR_DIR = CACHE_DIR / "har"
+    NETWORK_BLOCKLIST = [
+        domain.strip()
+        for domain in os.getenv(
+            "NETWORK_BLOCKLIST",
+            "doubleclick.net,googlesyndication.com,googletagservices.com,"
+            "google-analytics.com,googletagmanager.com,adservice.google.com,"
+            "amazon-adsystem.com,adnxs.com,criteo.com,pubmatic.com,"
+            "rubiconproject.com,taboola.com,outbrain.com,moatads.com,"
+            "scorecardresearch.com,facebook.net",
+        ).split(",")
+        if domain.strip()
+    ]
+
+    # Resource-blocking policy (per app, overridable with @pytest.mark.resource_policy).
+    # Off by default: any context route disables the browser HTTP cache, so
+    # "enforce" is opt-in (globally, per app or per test marker).
+    RESOURCE_POLICY = os.getenv("RESOURCE_POLICY", "off").lower()  # off, enforce, measure
+    RESOURCE_SIZES_DIR = CACHE_DIR / "resource_sizes"
+    DEMOQA_RESOURCE_POLICY = os.getenv("DEMOQA_RESOURCE_POLICY", RESOURCE_POLICY).lower()
+    SAUCE_RESOURCE_POLICY = os.getenv("SAUCE_RESOURCE_POLICY", RESOURCE_POLICY).lower()
+    DEMOQA_BLOCK_RESOURCES = os.getenv("DEMOQA_BLOCK_RESOURCES", "image,media,font")
+    DEMOQA_BLOCK_THIRD_PARTY = (
+        os.getenv("DEMOQA_BLOCK_THIRD_PARTY", "false").lower() == "true"
+    )
+    SAUCE_BLOCK_RESOURCES = os.getenv("SAUCE_BLOCK_RESOURCES", "")
+    SAUCE_BLOCK_THIRD_PARTY = (
+        os.getenv("SAUCE_BLOCK_THIRD_PARTY", "false").lower() == "true"
+    )
 
     # Retry behavior (for flaky tests)
     FLAKY_TEST_RETRIES = int(os.getenv("FLAKY_TEST_RETRIES", "2"))
@@ -105,6 +171,22 @@ class Config:
     # ============================================================================
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")  # DEBUG, INFO, WARNING, ERROR
     LOG_FILE = REPORTS_DIR / "test_execution.log"
+    LOG_QUEUE = os.getenv("LOG_QUEUE", "true").lower() == "true"  # background writes
+    LOG_JSONL = os.getenv("LOG_JSONL", "false").lower() == "true"  # structured sink
+    LOG_JSONL_FILE = REPORTS_DIR / "execution.jsonl"
+
+    # Per-action timing of page objects (opt-in, in-memory ring buffer)
+    ACTION_TIMING = os.getenv("ACTION_TIMING", "false").lower() == "true"
+    ACTION_TIMING_BUFFER = int(os.getenv("ACTION_TIMING_BUFFER", "10000"))
+    ACTION_TIMING_REPORT = REPORTS_DIR / "action_timings.json"
+
+    # Per-test / per-fixture duration history and regression detection (opt-in)
+    DURATION_PROFILE = os.getenv("DURATION_PROFILE", "false").lower() == "true"
+    DURATION_HISTORY_FILE = CACHE_DIR / "durations.jsonl"
+    DURATION_HISTORY_RUNS = int(os.getenv("DURATION_HISTORY_RUNS", "20"))
+    DURATION_BASELINE_RUNS = int(os.getenv("DURATION_BASELINE_RUNS", "5"))
+    DURATION_REGRESSION_PCT = float(os.getenv("DURATION_REGRESSION_PCT", "50"))
+    DURATION_REGRESSION_MIN_S = float(os.getenv("DURATION_REGRESSION_MIN_S", "0.5"))
 
     # ============================================================================
     # Browser Context Settings (Playwright)
@@ -125,6 +207,31 @@ class Config:
     API_TIMEOUT = int(os.getenv("API_TIMEOUT", "30"))  # seconds
     API_RETRY_COUNT = int(os.getenv("API_RETRY_COUNT", "3"))
     API_RETRY_DELAY = int(os.getenv("API_RETRY_DELAY", "1"))  # seconds
+    API_RETRY_STATUSES = [
+        int(code)
+        for code in os.getenv("API_RETRY_STATUSES", "429,502,503,504").split(",")
+        if code.strip()
+    ]
+
+    # HTTP connection pooling (per APIClient session)
+    API_POOL_CONNECTIONS = int(os.getenv("API_POOL_CONNECTIONS", "10"))  # hosts
+    API_POOL_MAXSIZE = int(os.getenv("API_POOL_MAXSIZE", "20"))  # per host
+    API_POOL_BLOCK = os.getenv("API_POOL_BLOCK", "false").lower() == "true"
+    API_TCP_KEEPALIVE = os.getenv("API_TCP_KEEPALIVE", "true").lower() == "true"
+
+    # Max in-flight requests for AsyncAPIClient.gather
+    API_ASYNC_CONCURRENCY = int(os.getenv("API_ASYNC_CONCURRENCY", "10"))
+
+    # Max characters of payloads/bodies in API DEBUG logs (0 = unlimited)
+    API_LOG_BODY_LIMIT = int(os.getenv("API_LOG_BODY_LIMIT", "2000"))
+
+    # Load runner defaults (core/load_runner.py)
+    LOAD_USERS = int(os.getenv("LOAD_USERS", "10"))  # concurrent virtual users
+    LOAD_DURATION = float(os.getenv("LOAD_DURATION", "10"))  # seconds after ramp-up
+    LOAD_RAMP_UP = float(os.getenv("LOAD_RAMP_UP", "0"))  # seconds
+    LOAD_MODE = os.getenv("LOAD_MODE", "thread").lower()  # thread, async
+    LOAD_HISTORY_FILE = CACHE_DIR / "load.jsonl"
+    LOAD_HISTORY_RUNS = int(os.getenv("LOAD_HISTORY_RUNS", "50"))
 
     # ============================================================================
     # Feature Flags
@@ -142,6 +249,66 @@ class Config:
         """Check if running in CI environment."""
         return cls.CI
 
+    @classmethod
+    def worker_id(cls) -> str:
+        """Return pytest-xdist worker id ("gw0", "gw1", ...) or "main"."""
+        return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+    @classmethod
+    def worker_path(cls, path: Path) -> Path:
+        """Return a per-worker variant of a file path (name.gw0.ext) under xdist."""
+        path = Path(path)
+        worker = cls.worker_id()
+        if worker == "main":
+            return path
+        return path.with_name(f"{path.stem}.{worker}{path.suffix}")
+
+    @classmethod
+    def get_sauce_personas(cls) -> dict:
+        """
+        Get SauceDemo personas that can log in.
+
+        Returns:
+            dict: Persona name -> username (locked out user excluded)
+        """
+        return {
+            "standard": cls.SAUCE_STANDARD_USER,
+            "problem": cls.SAUCE_PROBLEM_USER,
+            "performance_glitch": cls.SAUCE_PERFORMANCE_GLITCH_USER,
+            "error": cls.SAUCE_ERROR_USER,
+            "visual": cls.SAUCE_VISUAL_USER,
+        }
+
+    @classmethod
+    def get_resource_policies(cls) -> dict:
+        """
+        Get resource-blocking policy settings per app.
+
+        Returns:
+            dict: App name -> policy settings (mode, base URL, resource
+                  types, blocked domains, third-party blocking)
+        """
+
+        def _split(value: str) -> list:
+            return [item.strip() for item in value.split(",") if item.strip()]
+
+        return {
+            "demoqa": {
+                "mode": cls.DEMOQA_RESOURCE_POLICY,
+                "base_url": cls.DEMOQA_URL,
+                "resources": _split(cls.DEMOQA_BLOCK_RESOURCES),
+                "domains": list(cls.NETWORK_BLOCKLIST),
+                "third_party": cls.DEMOQA_BLOCK_THIRD_PARTY,
+            },
+            "saucedemo": {
+                "mode": cls.SAUCE_RESOURCE_POLICY,
+                "base_url": cls.SAUCE_URL,
+                "resources": _split(cls.SAUCE_BLOCK_RESOURCES),
+                "domains": list(cls.NETWORK_BLOCKLIST),
+                "third_party": cls.SAUCE_BLOCK_THIRD_PARTY,
+            },
+        }
+
     @classmethod
     def get_browser_context_options(cls) -> dict:
         """
@@ -182,6 +349,7 @@ class Config:
             cls.TRACES_DIR,
             cls.LOGS_DIR,
             cls.VIDEOS_DIR,
+            cls.CACHE_DIR,
         ]:
             directory.mkdir(parents=True, exist_ok=True)
 
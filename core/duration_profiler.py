@@ -0,0 +1,313 @@
+# core/duration_profiler.py
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import pytest
+
+from core.config import Config
+from core.logger import get_logger
+
+
+PHASES = ("setup", "call", "teardown")
+
+
+class DurationHistory:
+    """
+    On-disk run history: one JSON line per run (newest last).
+
+    Row format (seconds, 3 decimals):
+        {"ts": ..., "tests": {nodeid: [setup, call, teardown, outcome]},
+         "fixtures": {name: [count, total]},
+         "groups": {fixture: [nodeid, ...]}}
+
+    "groups" lists the tests using each Config.SCHEDULE_GROUP_FIXTURES
+    fixture (used by duration-aware scheduling).
+
+    Only the last Config.DURATION_HISTORY_RUNS rows are kept.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_runs: Optional[int] = None):
+        self.path = Path(path or Config.DURATION_HISTORY_FILE)
+        self.max_runs = max_runs or Config.DURATION_HISTORY_RUNS
+
+    def runs(self) -> List[Dict[str, Any]]:
+        """Return stored runs, oldest first (unreadable rows skipped)."""
+        return list(self._iter_runs())
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Add a run and trim the history (atomic rewrite)."""
+        rows = [*self.runs(), row][-self.max_runs :]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in rows),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+
+    def baseline(
+        self, runs: Optional[int] = None, skip_latest: bool = False
+    ) -> Dict[str, float]:
+        """
+        Median total duration per passed test over the last `runs` runs.
+
+        skip_latest excludes the newest row (to compare it against the others).
+        """
+        rows = self.runs()
+        if skip_latest:
+            rows = rows[:-1]
+
+        samples: Dict[str, List[float]] = {}
+        for row in rows[-(runs or Config.DURATION_BASELINE_RUNS) :]:
+            for nodeid, (setup, call, teardown, outcome) in row["tests"].items():
+                if outcome == "passed":
+                    samples.setdefault(nodeid, []).append(setup + call + teardown)
+
+        return {nodeid: statistics.median(values) for nodeid, values in samples.items()}
+
+    def groups(self) -> Dict[str, str]:
+        """Map nodeid -> expensive fixture it uses (most recent run wins)."""
+        groups: Dict[str, str] = {}
+        for row in self.runs():
+            for fixture, nodeids in row.get("groups", {}).items():
+                groups.update(dict.fromkeys(nodeids, fixture))
+        return groups
+
+    def _iter_runs(self) -> Iterator[Dict[str, Any]]:
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def find_regressions(
+    tests: Dict[str, List[Any]],
+    baseline: Dict[str, float],
+    threshold_pct: Optional[float] = None,
+    min_seconds: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Return passed tests slower than baseline by more than threshold_pct
+    (and by at least min_seconds, to ignore noise on fast tests), slowest first.
+    """
+    if threshold_pct is None:
+        threshold_pct = Config.DURATION_REGRESSION_PCT
+    if min_seconds is None:
+        min_seconds = Config.DURATION_REGRESSION_MIN_S
+
+    regressions = []
+    for nodeid, (setup, call, teardown, outcome) in tests.items():
+        base = baseline.get(nodeid)
+        if outcome != "passed" or not base:
+            continue
+
+        current = setup + call + teardown
+        if current - base >= min_seconds and current > base * (1 + threshold_pct / 100):
+            regressions.append(
+                {
+                    "nodeid": nodeid,
+                    "baseline": round(base, 3),
+                    "current": round(current, 3),
+                    "increase_pct": round((current / base - 1) * 100, 1),
+                }
+            )
+
+    return sorted(regressions, key=lambda r: r["current"] - r["baseline"], reverse=True)
+
+
+class DurationProfiler:
+    """
+    pytest plugin recording per-phase and per-fixture durations.
+
+    - Workers time fixture setup and attach it to the setup report
+    - The controller (or the single process) collects every report and,
+      at session end, appends one row to the DurationHistory and reports
+      tests that regressed against the rolling baseline
+    """
+
+    def __init__(self, config: pytest.Config, history: Optional[DurationHistory] = None):
+        self.config = config
+        self.history = history or DurationHistory()
+        self.is_worker = hasattr(config, "workerinput")
+
+        self.tests: Dict[str, List[Any]] = {}
+        self.fixtures: Dict[str, List[float]] = {}
+        self.groups: Dict[str, List[str]] = {}
+        self.regressions: List[Dict[str, Any]] = []
+
+        # Worker side: fixture setup times of the running item
+        self._fixture_times: Dict[str, float] = {}
+
+        self.logger = get_logger(self.__class__.__name__)
+
+    # ------------------------------------------------------------------
+    # Worker side (where fixtures run)
+    # ------------------------------------------------------------------
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef: pytest.FixtureDef, request):
+        start = time.perf_counter()
+        yield
+        name = fixturedef.argname
+        self._fixture_times[name] = self._fixture_times.get(name, 0.0) + (
+            time.perf_counter() - start
+        )
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when == "setup":
+            # Plain dict attribute: survives xdist report serialization
+            report.fixture_durations = {
+                name: round(seconds, 4) for name, seconds in self._fixture_times.items()
+            }
+            self._fixture_times = {}
+
+    # ------------------------------------------------------------------
+    # Controller side (where reports arrive)
+    # ------------------------------------------------------------------
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if self.is_worker:
+            return
+
+        row = self.tests.setdefault(report.nodeid, [0.0, 0.0, 0.0, "passed"])
+        row[PHASES.index(report.when)] += report.duration
+        if report.failed:
+            row[3] = "failed"
+        elif report.skipped and row[3] == "passed":
+            row[3] = "skipped"
+
+        for name, seconds in (getattr(report, "fixture_durations", None) or {}).items():
+            stats = self.fixtures.setdefault(name, [0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+
+            if name in Config.SCHEDULE_GROUP_FIXTURES:
+                self.groups.setdefault(name, []).append(report.nodeid)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if self.is_worker or not self.tests:
+            return
+
+        tests = {
+            nodeid: [round(s, 3), round(c, 3), round(t, 3), outcome]
+            for nodeid, (s, c, t, outcome) in self.tests.items()
+        }
+        self.regressions = find_regressions(tests, self.history.baseline())
+
+        self.history.append(
+            {
+                "ts": round(time.time()),
+                "tests": tests,
+                "fixtures": {
+                    name: [count, round(total, 3)]
+                    for name, (count, total) in self.fixtures.items()
+                },
+                "groups": self.groups,
+            }
+        )
+
+        self.logger.info(
+            "Duration history updated | %s | tests=%s | regressions=%s",
+            self.history.path,
+            len(tests),
+            len(self.regressions),
+        )
+
+    def pytest_terminal_summary(self, terminalreporter, exitstatus, config) -> None:
+        if self.is_worker or not self.tests:
+            return
+
+        terminalreporter.section("duration profile")
+        for line in format_summary(self.tests, self.fixtures, self.regressions):
+            terminalreporter.write_line(line)
+
+
+def format_summary(
+    tests: Dict[str, List[Any]],
+    fixtures: Dict[str, List[float]],
+    regressions: Sequence[Dict[str, Any]],
+    top: int = 5,
+) -> List[str]:
+    """Human-readable summary lines: phase totals, slowest fixtures, regressions."""
+    totals = [sum(row[i] for row in tests.values()) for i in range(len(PHASES))]
+    lines = [
+        "phases: "
+        + ", ".join(f"{phase}={total:.2f}s" for phase, total in zip(PHASES, totals))
+    ]
+
+    slowest = sorted(fixtures.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    for name, (count, total) in slowest:
+        if total < 0.01:
+            break
+        lines.append(f"fixture {name}: {total:.2f}s over {count} setups")
+
+    if not regressions:
+        lines.append("no duration regressions")
+    for regression in regressions:
+        lines.append(
+            "REGRESSION {nodeid}: {current:.2f}s vs baseline {baseline:.2f}s "
+            "(+{increase_pct}%)".format(**regression)
+        )
+
+    return lines
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Summarize the latest recorded run against the baseline of previous runs.
+
+    Usage:
+        python -m core.duration_profiler [--history .cache/durations.jsonl]
+    """
+    parser = argparse.ArgumentParser(description="Test duration history summary")
+    parser.add_argument("--history", default=str(Config.DURATION_HISTORY_FILE))
+    parser.add_argument("--threshold", type=float, default=Config.DURATION_REGRESSION_PCT)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    history = DurationHistory(Path(args.history))
+    runs = history.runs()
+    if not runs:
+        print(f"No duration history at {history.path}")
+        return
+
+    latest = runs[-1]
+    baseline = history.baseline(skip_latest=True)
+
+    print(f"Runs stored: {len(runs)} | latest: {len(latest['tests'])} tests")
+    slowest = sorted(
+        latest["tests"].items(), key=lambda item: sum(item[1][:3]), reverse=True
+    )
+    for nodeid, (setup, call, teardown, _) in slowest[: args.top]:
+        print(
+            f"{setup + call + teardown:8.2f}s  setup={setup:.2f} call={call:.2f} "
+            f"teardown={teardown:.2f}  {nodeid}"
+        )
+
+    for line in format_summary(
+        latest["tests"],
+        latest.get("fixtures", {}),
+        find_regressions(latest["tests"], baseline, args.threshold),
+        top=args.top,
+    ):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,529 @@
+# core/load_runner.py
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from core.api_client import APIClient
+from core.async_api_client import AsyncAPIClient
+from core.config import Config
+from core.logger import get_logger
+
+
+MODES = ("thread", "async")
+
+
+class Endpoint(NamedTuple):
+    method: str
+    path: str
+    kwargs: Optional[Dict[str, Any]] = None  # passed to APIClient.request
+    weight: int = 1
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.path.split('?')[0]}"
+
+
+class LoadProfile(NamedTuple):
+    users: int = 10
+    duration: float = 10.0  # seconds of full load, after ramp-up
+    ramp_up: float = 0.0  # seconds until all users are running
+    ramp_steps: int = 0  # 0: linear ramp; N: users start in N equal batches
+    iterations: Optional[int] = None  # requests per user (overrides duration)
+    think_time: float = 0.0  # seconds between a user's requests
+    mode: str = "thread"  # thread, async
+
+    def start_delay(self, user: int) -> float:
+        """Seconds after the start at which a user begins sending requests."""
+        if self.ramp_up <= 0 or self.users <= 1:
+            return 0.0
+        if self.ramp_steps > 0:
+            step = user * self.ramp_steps // self.users
+            return self.ramp_up * step / self.ramp_steps
+        return self.ramp_up * user / self.users
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram (microsecond resolution, bounded memory).
+
+    Values below 2 * 2**precision_bits us are exact; above that, buckets
+    are log-linear with 2**precision_bits sub-buckets per power of two,
+    i.e. under 1% relative error at the default precision. Histograms
+    from different users are merged, so recording needs no locking.
+    """
+
+    def __init__(self, precision_bits: int = 7):
+        self.precision_bits = precision_bits
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, seconds: float) -> None:
+        value = max(int(seconds * 1e6), 0)
+        bucket = self._bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentile(self, pct: float) -> float:
+        """Latency (seconds) at or below which `pct` % of values fall."""
+        if not self.count:
+            return 0.0
+
+        target = max(math.ceil(pct / 100 * self.count), 1)
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= target:
+                return min(bucket + self._width(bucket) - 1, self.max) / 1e6
+        return self.max / 1e6
+
+    def mean(self) -> float:
+        return self.total / self.count / 1e6 if self.count else 0.0
+
+    def _bucket(self, value: int) -> int:
+        shift = value.bit_length() - self.precision_bits - 1
+        return value if shift <= 0 else (value >> shift) << shift
+
+    def _width(self, bucket: int) -> int:
+        return 1 << max(bucket.bit_length() - self.precision_bits - 1, 0)
+
+
+class EndpointStats:
+    """
+    Latencies, errors and status counts of one endpoint (one user, or merged).
+
+    `full_load` counts requests sent after ramp-up, the basis of throughput.
+    """
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.errors = 0
+        self.full_load = 0
+        self.statuses: Dict[str, int] = {}
+
+    def record(self, seconds: float, status: str, ok: bool, full_load: bool = True) -> None:
+        self.latency.record(seconds)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if not ok:
+            self.errors += 1
+        if full_load:
+            self.full_load += 1
+
+    def merge(self, other: "EndpointStats") -> "EndpointStats":
+        self.latency.merge(other.latency)
+        self.errors += other.errors
+        self.full_load += other.full_load
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        return self
+
+    def summary(self, window: float) -> Dict[str, Any]:
+        """Stats with throughput over the full-load window (seconds after ramp-up)."""
+        latency = self.latency
+        return {
+            "requests": latency.count,
+            "errors": self.errors,
+            "rps": round(self.full_load / window, 1) if window > 0 else 0.0,
+            "mean_ms": round(latency.mean() * 1000, 3),
+            "p50_ms": round(latency.percentile(50) * 1000, 3),
+            "p90_ms": round(latency.percentile(90) * 1000, 3),
+            "p99_ms": round(latency.percentile(99) * 1000, 3),
+            "max_ms": round(latency.max / 1000, 3),
+            "statuses": dict(sorted(self.statuses.items())),
+        }
+
+
+class LoadResult:
+    """
+    Merged per-endpoint stats of one load run.
+
+    Throughput covers the full-load window only (elapsed minus ramp-up),
+    so it is comparable between runs with different ramp-up profiles.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        profile: LoadProfile,
+        endpoints: Dict[str, EndpointStats],
+        elapsed: float,
+    ):
+        self.name = name
+        self.profile = profile
+        self.endpoints = endpoints
+        self.elapsed = elapsed
+        self.window = max(elapsed - profile.ramp_up, 0.0)
+
+    @property
+    def total(self) -> EndpointStats:
+        total = EndpointStats()
+        for stats in self.endpoints.values():
+            total.merge(stats)
+        return total
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ts": round(time.time(), 3),
+            "name": self.name,
+            "profile": self.profile._asdict(),
+            "elapsed": round(self.elapsed, 3),
+            "window": round(self.window, 3),
+            "endpoints": {
+                name: stats.summary(self.window)
+                for name, stats in sorted(self.endpoints.items())
+            },
+            "total": self.total.summary(self.window),
+        }
+
+
+class LoadHistory:
+    """
+    On-disk load run history: one JSON line per run (LoadResult.to_dict()).
+
+    Only the last Config.LOAD_HISTORY_RUNS rows are kept (all scenarios).
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_runs: Optional[int] = None):
+        self.path = Path(path or Config.LOAD_HISTORY_FILE)
+        self.max_runs = max_runs or Config.LOAD_HISTORY_RUNS
+
+    def runs(self, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return stored runs (optionally of one scenario), oldest first."""
+        return [row for row in self._iter_runs() if name is None or row.get("name") == name]
+
+    def latest(self, name: str) -> Optional[Dict[str, Any]]:
+        runs = self.runs(name)
+        return runs[-1] if runs else None
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Add a run and trim the history (atomic rewrite)."""
+        rows = [*self.runs(), row][-self.max_runs :]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in rows),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+
+    def _iter_runs(self) -> Iterator[Dict[str, Any]]:
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+class LoadRunner:
+    """
+    Load generator on top of APIClient (thread pool) or AsyncAPIClient (asyncio).
+
+    Responsibilities:
+    - Run `profile.users` virtual users, started along the ramp-up profile
+    - Send the endpoints round-robin (by weight) for the duration or iterations
+    - Record latency histograms, status counts and errors per endpoint
+    - Persist results to LoadHistory and compare with the previous run
+
+    Per-request API logs are suppressed during the run (WARNING and above
+    still pass). Size the client pool for the load, e.g.
+    APIClient(url, pool_maxsize=profile.users).
+
+    Usage:
+        runner = LoadRunner(client, [Endpoint("GET", "/users")], LoadProfile(users=20))
+        result = runner.run()
+    """
+
+    def __init__(
+        self,
+        client: APIClient,
+        endpoints: Sequence[Endpoint],
+        profile: Optional[LoadProfile] = None,
+        name: str = "load",
+    ):
+        if not endpoints:
+            raise ValueError("LoadRunner needs at least one endpoint")
+
+        self.client = client
+        self.endpoints = list(endpoints)
+        self.profile = profile or LoadProfile()
+        self.name = name
+
+        if self.profile.mode not in MODES:
+            raise ValueError(f"Unknown load mode: {self.profile.mode} (expected one of {MODES})")
+
+        # Weighted round-robin order shared by all users (offset per user)
+        self._schedule = [e for e in self.endpoints for _ in range(max(e.weight, 1))]
+
+        self.logger = get_logger(self.__class__.__name__)
+
+    def run(self) -> LoadResult:
+        profile = self.profile
+        self.logger.info(
+            "Load run started | %s | mode=%s | users=%s | ramp_up=%ss | %s",
+            self.name,
+            profile.mode,
+            profile.users,
+            profile.ramp_up,
+            f"iterations={profile.iterations}"
+            if profile.iterations
+            else f"duration={profile.duration}s",
+        )
+
+        start = time.perf_counter()
+        with _quiet(self.client.logger):
+            if profile.mode == "async":
+                per_user = asyncio.run(self._run_async(start))
+            else:
+                per_user = self._run_threads(start)
+        elapsed = time.perf_counter() - start
+
+        merged: Dict[str, EndpointStats] = {}
+        for stats in per_user:
+            for name, endpoint_stats in stats.items():
+                merged.setdefault(name, EndpointStats()).merge(endpoint_stats)
+
+        result = LoadResult(self.name, profile, merged, elapsed)
+        total = result.total
+        self.logger.info(
+            "Load run finished | %s | requests=%s | errors=%s | %.1fs | p99=%.1fms",
+            self.name,
+            total.latency.count,
+            total.errors,
+            elapsed,
+            total.latency.percentile(99) * 1000,
+        )
+        return result
+
+    # ------------------------------------------------------------------
+    # Concurrency models
+    # ------------------------------------------------------------------
+
+    def _run_threads(self, start: float) -> List[Dict[str, EndpointStats]]:
+        with ThreadPoolExecutor(
+            max_workers=self.profile.users, thread_name_prefix="load-user"
+        ) as pool:
+            futures = [
+                pool.submit(self._user_thread, user, start)
+                for user in range(self.profile.users)
+            ]
+            return [future.result() for future in futures]
+
+    def _user_thread(self, user: int, start: float) -> Dict[str, EndpointStats]:
+        stats: Dict[str, EndpointStats] = {}
+        time.sleep(max(start + self.profile.start_delay(user) - time.perf_counter(), 0))
+        full_load_start = start + self.profile.ramp_up
+
+        for endpoint in self._user_requests(user, start):
+            began = time.perf_counter()
+            try:
+                response = self.client.request(
+                    endpoint.method, endpoint.path, **(endpoint.kwargs or {})
+                )
+                status, ok = str(response.status_code), response.status_code < 400
+            except Exception as exc:
+                status, ok = type(exc).__name__, False
+            _stats_for(stats, endpoint).record(
+                time.perf_counter() - began, status, ok, began >= full_load_start
+            )
+
+            if self.profile.think_time:
+                time.sleep(self.profile.think_time)
+
+        return stats
+
+    async def _run_async(self, start: float) -> List[Dict[str, EndpointStats]]:
+        # No retries: each attempt is a sample, as in thread mode
+        client = AsyncAPIClient.from_client(
+            self.client, retries=0, pool_maxsize=self.profile.users
+        )
+        try:
+            with _quiet(client.logger):
+                return list(
+                    await asyncio.gather(
+                        *(self._user_task(client, user, start) for user in range(self.profile.users))
+                    )
+                )
+        finally:
+            await client.aclose()
+
+    async def _user_task(
+        self, client: AsyncAPIClient, user: int, start: float
+    ) -> Dict[str, EndpointStats]:
+        stats: Dict[str, EndpointStats] = {}
+        await asyncio.sleep(max(start + self.profile.start_delay(user) - time.perf_counter(), 0))
+        full_load_start = start + self.profile.ramp_up
+
+        for endpoint in self._user_requests(user, start):
+            began = time.perf_counter()
+            try:
+                response = await client.request(
+                    endpoint.method, endpoint.path, **(endpoint.kwargs or {})
+                )
+                status, ok = str(response.status_code), response.status_code < 400
+            except Exception as exc:
+                status, ok = type(exc).__name__, False
+            _stats_for(stats, endpoint).record(
+                time.perf_counter() - began, status, ok, began >= full_load_start
+            )
+
+            # Yield to the other users even when responses are immediate
+            await asyncio.sleep(self.profile.think_time)
+
+        return stats
+
+    def _user_requests(self, user: int, start: float) -> Iterator[Endpoint]:
+        """Endpoints a user sends, until its iterations or the deadline are used up."""
+        deadline = start + self.profile.ramp_up + self.profile.duration
+        sent = 0
+        while True:
+            if self.profile.iterations is not None:
+                if sent >= self.profile.iterations:
+                    return
+            elif time.perf_counter() >= deadline:
+                return
+
+            yield self._schedule[(user + sent) % len(self._schedule)]
+            sent += 1
+
+
+def compare_results(previous: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Per-endpoint p99 and throughput changes between two stored runs."""
+    lines = []
+    for name, stats in {**current["endpoints"], "total": current["total"]}.items():
+        before = previous["total"] if name == "total" else previous["endpoints"].get(name)
+        if not before:
+            lines.append(f"{name}: new endpoint")
+            continue
+        lines.append(
+            f"{name}: p99 {before['p99_ms']:.1f} -> {stats['p99_ms']:.1f} ms "
+            f"({_change(before['p99_ms'], stats['p99_ms'])}), "
+            f"rps {before['rps']:.1f} -> {stats['rps']:.1f} "
+            f"({_change(before['rps'], stats['rps'])})"
+        )
+    return lines
+
+
+def format_result(row: Dict[str, Any]) -> List[str]:
+    """Human-readable lines for a stored run (LoadResult.to_dict())."""
+    lines = [f"load run {row['name']}: {row['elapsed']:.1f}s"]
+    for name, stats in [*row["endpoints"].items(), ("total", row["total"])]:
+        lines.append(
+            f"{name}: requests={stats['requests']} errors={stats['errors']} "
+            f"rps={stats['rps']} p50={stats['p50_ms']}ms p90={stats['p90_ms']}ms "
+            f"p99={stats['p99_ms']}ms max={stats['max_ms']}ms"
+        )
+    return lines
+
+
+def parse_endpoint(spec: str) -> Endpoint:
+    """Parse "GET /users?page=2" (method defaults to GET; "*3" suffix sets the weight)."""
+    spec, _, weight = spec.partition("*")
+    parts = spec.split(None, 1)
+    method, path = ("GET", parts[0]) if len(parts) == 1 else (parts[0].upper(), parts[1])
+    return Endpoint(method, path.strip(), weight=int(weight or 1))
+
+
+def _stats_for(stats: Dict[str, EndpointStats], endpoint: Endpoint) -> EndpointStats:
+    endpoint_stats = stats.get(endpoint.name)
+    if endpoint_stats is None:
+        endpoint_stats = stats[endpoint.name] = EndpointStats()
+    return endpoint_stats
+
+
+def _change(before: float, after: float) -> str:
+    return f"{(after - before) / before:+.0%}" if before else "n/a"
+
+
+@contextmanager
+def _quiet(logger: logging.Logger) -> Iterator[None]:
+    """Drop a client's per-request INFO/DEBUG logs for the duration of a run."""
+    level = logger.level
+    logger.setLevel(logging.WARNING)
+    try:
+        yield
+    finally:
+        logger.setLevel(level)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Run a load profile against an API and compare with the previous run.
+
+    Usage:
+        python -m core.load_runner "GET /users?page=2" "GET /users/2*3" \\
+            --users 20 --ramp-up 5 --duration 30 --mode async --name reqres-users
+    """
+    parser = argparse.ArgumentParser(description="API load runner")
+    parser.add_argument("endpoints", nargs="+", help='e.g. "GET /users" or "POST /login*2"')
+    parser.add_argument("--base-url", default=Config.REQRES_URL)
+    parser.add_argument("--name", default="load")
+    parser.add_argument("--users", type=int, default=Config.LOAD_USERS)
+    parser.add_argument("--duration", type=float, default=Config.LOAD_DURATION)
+    parser.add_argument("--ramp-up", type=float, default=Config.LOAD_RAMP_UP)
+    parser.add_argument("--ramp-steps", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=None)
+    parser.add_argument("--think-time", type=float, default=0.0)
+    parser.add_argument("--mode", choices=MODES, default=Config.LOAD_MODE)
+    parser.add_argument("--history", default=str(Config.LOAD_HISTORY_FILE))
+    parser.add_argument("--no-save", action="store_true", help="Do not store the run")
+    args = parser.parse_args(argv)
+
+    profile = LoadProfile(
+        users=args.users,
+        duration=args.duration,
+        ramp_up=args.ramp_up,
+        ramp_steps=args.ramp_steps,
+        iterations=args.iterations,
+        think_time=args.think_time,
+        mode=args.mode,
+    )
+    client = APIClient(args.base_url, retries=0, pool_maxsize=args.users)
+    try:
+        result = LoadRunner(
+            client, [parse_endpoint(spec) for spec in args.endpoints], profile, args.name
+        ).run()
+    finally:
+        client.close()
+
+    row = result.to_dict()
+    for line in format_result(row):
+        print(line)
+
+    history = LoadHistory(Path(args.history))
+    previous = history.latest(args.name)
+    if previous:
+        print(f"compared with previous run of {args.name}:")
+        for line in compare_results(previous, row):
+            print(line)
+    if not args.no_save:
+        history.append(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import queue
 import sys
-from typing import Optional
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 from core.config import Config
 
@@ -12,6 +18,171 @@ from core.config import Config
 _LOG_FORMAT = "%(asctime)s | %(levelname)-7s | %(name)s | %(message)s"
 _DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Process-wide backend: named loggers -> QueueHandler -> listener thread
+# -> shared console/file handlers (one file handle per process / worker)
+_backend_lock = threading.Lock()
+_queue_handler: Optional["_BackgroundHandler"] = None
+_listener: Optional[QueueListener] = None
+_handlers: List[logging.Handler] = []
+
+# Correlation of records with the running test (one test at a time per
+# process / xdist worker); set by the root conftest runtest hooks
+_log_context: Dict[str, Optional[str]] = {"nodeid": None, "phase": None}
+
+
+def set_log_context(nodeid: Optional[str], phase: Optional[str]) -> None:
+    """Tag subsequent records with a test nodeid and phase (setup/call/teardown)."""
+    _log_context["nodeid"] = nodeid
+    _log_context["phase"] = phase
+
+
+def clear_log_context() -> None:
+    set_log_context(None, None)
+
+
+def get_log_context() -> Dict[str, Optional[str]]:
+    """Return the current test nodeid and phase."""
+    return dict(_log_context)
+
+
+def event_extra(event: str, **fields: Any) -> Dict[str, Any]:
+    """
+    Build `extra=` for a structured record.
+
+    Example:
+        logger.info("...", extra=event_extra("api.response", status=200))
+    """
+    return {"event": event, "fields": fields}
+
+
+class _ContextFilter(logging.Filter):
+    """Stamp nodeid / worker / phase on records (on the caller's thread, before queueing)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.nodeid = _log_context["nodeid"]
+        record.phase = _log_context["phase"]
+        record.worker = Config.worker_id()
+        return True
+
+
+_context_filter = _ContextFilter()
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per record (JSONL), including correlation fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "nodeid": getattr(record, "nodeid", None),
+            "worker": getattr(record, "worker", None),
+            "phase": getattr(record, "phase", None),
+        }
+
+        event = getattr(record, "event", None)
+        if event:
+            entry["event"] = event
+            entry.update(getattr(record, "fields", None) or {})
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _BackgroundHandler(QueueHandler):
+    """QueueHandler that writes directly once the listener has been stopped."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if _listener is None:
+            for handler in _handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            return
+
+        super().emit(record)
+
+
+def log_file_path() -> Optional[Path]:
+    """
+    Return this process' log file.
+
+    Under pytest-xdist each worker writes its own file
+    (test_execution.gw0.log, ...) to avoid interleaved writes.
+    """
+    return Config.worker_path(Config.LOG_FILE) if Config.LOG_FILE else None
+
+
+def jsonl_file_path() -> Optional[Path]:
+    """Return this process' JSONL log file (execution.gw0.jsonl, ...), if enabled."""
+    return Config.worker_path(Config.LOG_JSONL_FILE) if Config.LOG_JSONL else None
+
+
+def _backend_handlers() -> List[logging.Handler]:
+    """Create (once) the handlers shared by all loggers."""
+    global _queue_handler, _listener
+
+    with _backend_lock:
+        if _handlers:
+            return [_queue_handler] if _queue_handler else list(_handlers)
+
+        formatter = logging.Formatter(fmt=_LOG_FORMAT, datefmt=_DATE_FORMAT)
+
+        # --- Console handler (stdout, CI-friendly) ---
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        _handlers.append(console_handler)
+
+        # --- File handler (one handle per process) ---
+        file_path = log_file_path()
+        if file_path is not None:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = logging.FileHandler(file_path, encoding="utf-8")
+            file_handler.setFormatter(formatter)
+            _handlers.append(file_handler)
+
+        # --- Structured JSONL sink (optional) ---
+        jsonl_path = jsonl_file_path()
+        if jsonl_path is not None:
+            jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+            jsonl_handler = logging.FileHandler(jsonl_path, encoding="utf-8")
+            jsonl_handler.setFormatter(JsonLineFormatter())
+            _handlers.append(jsonl_handler)
+
+        if not Config.LOG_QUEUE:
+            return list(_handlers)
+
+        # --- Non-blocking: writes happen on the listener thread ---
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        _queue_handler = _BackgroundHandler(log_queue)
+        _listener = QueueListener(log_queue, *_handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        return [_queue_handler]
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener (idempotent)."""
+    global _listener
+
+    with _backend_lock:
+        listener, _listener = _listener, None
+
+    if listener is not None:
+        listener.stop()  # drains the queue
+
+    for handler in _handlers:
+        try:
+            handler.flush()
+        except (OSError, ValueError):
+            pass  # stream already closed (e.g. pytest capture at exit)
+
 
 def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     """
@@ -21,6 +192,9 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     - Applies consistent formatting
     - Respects Config.LOG_LEVEL
     - CI-safe (stdout)
+    - Non-blocking: records are queued and written by a background thread
+      (Config.LOG_QUEUE), sharing one file handle per process / xdist worker
+    - Records carry nodeid / worker / phase (optional JSONL sink, Config.LOG_JSONL)
     """
 
     logger = logging.getLogger(name)
@@ -31,30 +205,16 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     log_level = level or Config.LOG_LEVEL
     logger.setLevel(log_level)
 
-    # --- Console handler (stdout, CI-friendly) ---
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-
-    formatter = logging.Formatter(
-        fmt=_LOG_FORMAT,
-        datefmt=_DATE_FORMAT,
-    )
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-
-    # --- Optional file logging (disabled by default) ---
-    if Config.LOG_FILE:
-        file_handler = logging.FileHandler(Config.LOG_FILE, encoding="utf-8")
-        file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+    for handler in _backend_handlers():
+        logger.addHandler(handler)
 
+    logger.addFilter(_context_filter)
     logger.propagate = False  # avoid duplicate root logs
 
     logger.debug(
         "Logger initialized | level=%s | file=%s",
         log_level,
-        Config.LOG_FILE if Config.LOG_FILE else "stdout-only",
+        log_file_path() or "stdout-only",
     )
 
     return logger
@@ -0,0 +1,179 @@
+# core/network_cache.py
+
+from __future__ import annotations
+
+import re
+import weakref
+from pathlib import Path
+from typing import List, Optional, Set
+
+from playwright.sync_api import Page, Route
+
+from core.config import Config
+from core.logger import get_logger
+
+
+# Static assets served from the HAR in "assets" scope
+STATIC_ASSET_PATTERN = re.compile(
+    r".*\.(?:js|mjs|css|png|jpe?g|gif|webp|svg|ico|woff2?|ttf|otf|eot)(?:\?.*)?$",
+    re.IGNORECASE,
+)
+
+
+class NetworkCache:
+    """
+    HAR-based record/replay of page loads, keyed per app and URL path.
+
+    Modes (Config.NETWORK_CACHE):
+    - "off":    live network, nothing recorded
+    - "record": traffic of each opened page is written to a HAR file
+    - "replay": responses are served from the recorded HAR files
+
+    Scope (Config.NETWORK_CACHE_SCOPE):
+    - "assets": only static assets are replayed, documents/XHR stay live
+    - "all":    everything is replayed, requests found in none of the
+                page's HARs are aborted (offline)
+
+    Recording writes one HAR per xdist worker (name.gw0.har); replay uses
+    the most recent recording of a page. A HAR is written when its browser
+    context closes, so recording needs a context per test (no ContextPool).
+
+    In "record" and "replay" modes requests to blocklisted ad/analytics
+    domains are aborted so they are neither recorded nor waited for.
+    """
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        scope: Optional[str] = None,
+        directory: Optional[Path] = None,
+        blocklist: Optional[List[str]] = None,
+    ):
+        self.mode = (mode or Config.NETWORK_CACHE).lower()
+        self.scope = (scope or Config.NETWORK_CACHE_SCOPE).lower()
+        self.directory = Path(directory or Config.HAR_DIR)
+        self.blocklist = Config.NETWORK_BLOCKLIST if blocklist is None else blocklist
+
+        if self.mode not in ("off", "record", "replay"):
+            raise ValueError(f"Unknown NETWORK_CACHE mode: {self.mode}")
+        if self.scope not in ("assets", "all"):
+            raise ValueError(f"Unknown NETWORK_CACHE_SCOPE: {self.scope}")
+
+        self._blocked_host = (
+            re.compile(
+                r"^https?://(?:[^/]+\.)?(?:"
+                + "|".join(re.escape(domain) for domain in self.blocklist)
+                + r")(?:[:/]|$)"
+            )
+            if self.blocklist
+            else None
+        )
+
+        # Pages already prepared, with the HAR keys attached to them
+        self._attached: "weakref.WeakKeyDictionary[Page, Set[str]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        self.logger = get_logger(self.__class__.__name__)
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def har_path(self, app: str, key: str) -> Path:
+        """Return HAR file path for an app page (key is its URL path)."""
+        name = re.sub(r"[^a-zA-Z0-9_.-]+", "_", key).strip("_") or "index"
+        return self.directory / app / f"{name}.har"
+
+    def replay_path(self, app: str, key: str) -> Optional[Path]:
+        """Return the most recent recording of a page (any worker), or None."""
+        path = self.har_path(app, key)
+        worker_file = re.compile(rf"{re.escape(path.stem)}\.gw\d+\.har")
+        recordings = [
+            candidate
+            for candidate in path.parent.glob(f"{path.stem}.gw*.har")
+            if worker_file.fullmatch(candidate.name)
+        ]
+        if path.exists():
+            recordings.append(path)
+        return max(recordings, key=lambda c: c.stat().st_mtime, default=None)
+
+    def attach(self, page: Page, app: str, key: str) -> None:
+        """
+        Prepare a page before navigating to an app URL path.
+
+        Safe to call on every navigation: each HAR is attached once per page.
+        """
+        if not self.enabled:
+            return
+
+        keys = self._attached.get(page)
+        if keys is None:
+            keys = self._attached[page] = set()
+
+        har_key = f"{app}/{key}"
+        if har_key in keys:
+            return
+        keys.add(har_key)
+
+        if self.mode == "record":
+            # Per worker: parallel workers never write the same file
+            path = Config.worker_path(self.har_path(app, key))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # HAR is written when the browser context closes
+            page.route_from_har(
+                path,
+                url=STATIC_ASSET_PATTERN if self.scope == "assets" else None,
+                update=True,
+                update_content="embed",
+                update_mode="minimal",
+            )
+            self.logger.debug("Recording HAR | key=%s | path=%s", har_key, path)
+
+        elif (path := self.replay_path(app, key)) is not None:
+            if self.scope == "all" and _OFFLINE not in keys:
+                # Routes run newest first: registered before any HAR, this
+                # aborts only requests that none of the page's HARs serve
+                keys.add(_OFFLINE)
+                page.route("**/*", self._abort)
+
+            # fallback: a request missing here may be in another HAR of the page
+            page.route_from_har(
+                path,
+                url=STATIC_ASSET_PATTERN if self.scope == "assets" else None,
+                not_found="fallback",
+            )
+            self.logger.debug("Replaying HAR | key=%s | path=%s", har_key, path)
+
+        else:
+            self.logger.debug("No HAR recorded, using network | key=%s", har_key)
+
+        # Blocklist is installed once per page, after the first HAR route
+        if _BLOCKLIST not in keys and self._blocked_host is not None:
+            keys.add(_BLOCKLIST)
+            page.route(self._blocked_host, self._abort)
+
+    @staticmethod
+    def _abort(route: Route) -> None:
+        route.abort("blockedbyclient")
+
+
+# Markers stored with a page's HAR keys
+_OFFLINE = "<offline>"
+_BLOCKLIST = "<blocklist>"
+
+_network_cache: Optional[NetworkCache] = None
+
+
+def get_network_cache() -> NetworkCache:
+    """Return the process-wide NetworkCache configured from Config."""
+    global _network_cache
+
+    if _network_cache is None:
+        _network_cache = NetworkCache()
+
+    return _network_cache
@@ -0,0 +1,243 @@
+# core/resource_policy.py
+
+from __future__ import annotations
+
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Error, Request, Route
+
+from core.config import Config
+from core.logger import get_logger
+
+
+class ResourcePolicy:
+    """
+    Declarative description of what an app's pages may load.
+
+    A request is blocked when its resource type is listed (image, media,
+    font, ...), its host belongs to a blocked domain (ads, analytics), or
+    it is third-party and third-party blocking is on.
+    """
+
+    def __init__(
+        self,
+        resources: Iterable[str] = (),
+        domains: Iterable[str] = (),
+        third_party: bool = False,
+        base_url: Optional[str] = None,
+    ):
+        self.resources = frozenset(r.lower() for r in resources)
+        self.domains = tuple(d.lower().lstrip(".") for d in domains)
+        self.third_party = third_party
+        self.first_party = _site(urlsplit(base_url).hostname) if base_url else None
+
+    @classmethod
+    def for_app(
+        cls, app: Optional[str], overrides: Optional[Dict[str, Any]] = None
+    ) -> "ResourcePolicy":
+        """
+        Build the policy of an app from Config, applying marker overrides.
+
+        Overrides: resources (replaces types), domains (added to the
+        blocklist), third_party (bool).
+        """
+        settings = dict(
+            Config.get_resource_policies().get(app or "")
+            or {"domains": list(Config.NETWORK_BLOCKLIST)}
+        )
+        overrides = overrides or {}
+
+        if "resources" in overrides:
+            settings["resources"] = overrides["resources"]
+        if "domains" in overrides:
+            settings["domains"] = [*settings.get("domains", []), *overrides["domains"]]
+        if "third_party" in overrides:
+            settings["third_party"] = overrides["third_party"]
+
+        return cls(
+            resources=settings.get("resources", ()),
+            domains=settings.get("domains", ()),
+            third_party=settings.get("third_party", False),
+            base_url=settings.get("base_url"),
+        )
+
+    def match(self, request: Request) -> Optional[str]:
+        """Return the block reason for a request, or None if allowed."""
+        if request.resource_type in self.resources:
+            return request.resource_type
+
+        host = (urlsplit(request.url).hostname or "").lower()
+        if not host:
+            return None  # data:, blob:, about:
+
+        for domain in self.domains:
+            if host == domain or host.endswith(f".{domain}"):
+                return "domain"
+
+        if self.third_party and self.first_party and _site(host) != self.first_party:
+            return "third-party"
+
+        return None
+
+
+class ResourceSizeTable:
+    """
+    Known response sizes per URL, learned in "measure" mode.
+
+    Used to estimate bytes saved for requests that "enforce" mode blocks
+    before any byte is transferred. One file per xdist worker; all files
+    are merged on load.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory or Config.RESOURCE_SIZES_DIR)
+        self.sizes: Dict[str, int] = {}
+        self._dirty = False
+
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                self.sizes.update(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                continue
+
+    def get(self, url: str) -> int:
+        return self.sizes.get(url, 0)
+
+    def learn(self, url: str, size: int) -> None:
+        if self.sizes.get(url) != size:
+            self.sizes[url] = size
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist learned sizes for this worker (atomic write)."""
+        if not self._dirty:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{Config.worker_id()}.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.sizes), encoding="utf-8")
+        os.replace(tmp_path, path)
+        self._dirty = False
+
+
+class ResourceBlocker:
+    """
+    Applies a ResourcePolicy to one browser context for one test.
+
+    Modes:
+    - "enforce": matching requests are aborted; bytes saved are estimated
+                 from the size table (reported as "estimated_bytes").
+                 The catch-all route disables the browser HTTP cache
+    - "measure": nothing is blocked; matching requests are counted and
+                 their actual response body sizes recorded into the size
+                 table (reported as "bytes")
+
+    Must be detached before the context is reused (see ContextPool).
+    """
+
+    def __init__(
+        self,
+        policy: ResourcePolicy,
+        mode: str = "measure",
+        sizes: Optional[ResourceSizeTable] = None,
+    ):
+        if mode not in ("enforce", "measure"):
+            raise ValueError(f"Unknown resource policy mode: {mode}")
+
+        self.policy = policy
+        self.mode = mode
+        self.sizes = sizes or ResourceSizeTable()
+
+        self.requests_saved: Counter = Counter()
+        self.bytes_saved = 0
+
+        self._context: Optional[BrowserContext] = None
+
+        self.logger = get_logger(self.__class__.__name__)
+
+    def attach(self, context: BrowserContext) -> None:
+        self._context = context
+
+        if self.mode == "enforce":
+            context.route("**/*", self._on_route)
+        else:
+            context.on("requestfinished", self._on_request_finished)
+
+    def detach(self) -> None:
+        context, self._context = self._context, None
+        if context is None:
+            return
+
+        try:
+            if self.mode == "enforce":
+                context.unroute("**/*", self._on_route)
+            else:
+                context.remove_listener("requestfinished", self._on_request_finished)
+        except Error:
+            pass
+
+        if self.mode == "measure":
+            self.sizes.save()
+
+        self.logger.debug(
+            "Resource policy | mode=%s | requests_saved=%s | bytes_saved=%s",
+            self.mode,
+            sum(self.requests_saved.values()),
+            self.bytes_saved,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return requests and bytes saved (or that would be saved).
+
+        Bytes are measured in "measure" mode; blocked requests transfer
+        nothing, so "enforce" reports the learned sizes as an estimate.
+        """
+        bytes_key = "estimated_bytes" if self.mode == "enforce" else "bytes"
+        return {
+            "mode": self.mode,
+            "requests": sum(self.requests_saved.values()),
+            "by_reason": dict(self.requests_saved),
+            bytes_key: self.bytes_saved,
+        }
+
+    # ------------------------------------------------------------------
+    # Playwright callbacks
+    # ------------------------------------------------------------------
+
+    def _on_route(self, route: Route) -> None:
+        reason = self.policy.match(route.request)
+        if reason is None:
+            route.fallback()
+            return
+
+        self.requests_saved[reason] += 1
+        self.bytes_saved += self.sizes.get(route.request.url)
+        route.abort("blockedbyclient")
+
+    def _on_request_finished(self, request: Request) -> None:
+        reason = self.policy.match(request)
+        if reason is None:
+            return
+
+        # Actual body bytes received (Content-Length is absent when chunked)
+        try:
+            size = max(request.sizes()["responseBodySize"], 0)
+        except Error:
+            size = 0
+
+        self.requests_saved[reason] += 1
+        self.bytes_saved += size
+        self.sizes.learn(request.url, size)
+
+
+def _site(host: Optional[str]) -> str:
+    """Approximate registrable domain (last two labels) of a host."""
+    labels = (host or "").lower().split(".")
+    return ".".join(labels[-2:])
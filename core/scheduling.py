@@ -0,0 +1,203 @@
+# core/scheduling.py
+
+from __future__ import annotations
+
+import heapq
+import statistics
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+from xdist.scheduler import LoadScopeScheduling
+
+from core.config import Config
+from core.duration_profiler import DurationHistory
+
+
+def lpt_makespan(costs: Sequence[float], workers: int) -> float:
+    """Makespan of greedy longest-processing-time-first assignment."""
+    loads = [0.0] * max(workers, 1)
+    for cost in sorted(costs, reverse=True):
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """
+    xdist scheduler: longest-processing-time-first using historical durations.
+
+    - Test costs come from the DurationHistory baseline (median of recent
+      runs); unknown tests cost the median known duration
+    - Tests sharing an expensive fixture (Config.SCHEDULE_GROUP_FIXTURES,
+      e.g. authenticated_page) form work units that stay on one worker,
+      split so that no unit exceeds a worker's fair share
+    - Units are dispatched longest first; idle workers pull the next
+      unit, which is the online form of LPT bin packing
+
+    Selected with --schedule=duration (together with -n).
+    """
+
+    def __init__(self, config, log=None, history: Optional[DurationHistory] = None):
+        super().__init__(config, log)
+        history = history or DurationHistory()
+
+        self.durations = history.baseline()
+        self.groups = history.groups()
+        self.default_cost = (
+            statistics.median(self.durations.values())
+            if self.durations
+            else Config.SCHEDULE_DEFAULT_DURATION
+        )
+
+        self._scopes: Dict[str, str] = {}
+
+    def cost(self, nodeid: str) -> float:
+        return self.durations.get(nodeid, self.default_cost)
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        # Initial distribution already happened (new nodes): xdist behavior
+        if self.collection is not None:
+            super().schedule()
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+
+        self._scopes = self._plan_scopes(self.collection, len(self.nodes))
+
+        units: Dict[str, "OrderedDict[str, bool]"] = OrderedDict()
+        for nodeid in self.collection:
+            units.setdefault(self._split_scope(nodeid), OrderedDict())[nodeid] = False
+
+        unit_costs = {
+            scope: sum(self.cost(nodeid) for nodeid in nodeids)
+            for scope, nodeids in units.items()
+        }
+        for scope in sorted(units, key=lambda s: unit_costs[s], reverse=True):
+            self.workqueue[scope] = units[scope]
+
+        self.log(
+            "Duration scheduling | units=%s | total=%.1fs | estimated makespan=%.1fs"
+            % (
+                len(units),
+                sum(unit_costs.values()),
+                lpt_makespan(list(unit_costs.values()), len(self.nodes)),
+            )
+        )
+
+        # Avoid having more workers than work
+        for _ in range(len(self.nodes) - len(self.workqueue)):
+            unused_node, _assigned = self.assigned_work.popitem(last=True)
+            unused_node.shutdown()
+
+        for node in self.nodes:
+            self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)
+
+        if not self.workqueue:
+            for node in self.nodes:
+                node.shutdown()
+
+    def group_key(self, nodeid: str) -> Optional[str]:
+        """Tests with the same key are kept together (None: schedule alone)."""
+        return self.groups.get(nodeid)
+
+    def _split_scope(self, nodeid: str) -> str:
+        return self._scopes.get(nodeid, nodeid)
+
+    def _plan_scopes(self, collection: List[str], workers: int) -> Dict[str, str]:
+        """Chunk grouped tests (collection order) into units of at most a fair share."""
+        fair_share = sum(self.cost(nodeid) for nodeid in collection) / max(workers, 1)
+
+        scopes: Dict[str, str] = {}
+        chunks: Dict[str, List[float]] = {}  # key -> [chunk index, chunk cost]
+        for nodeid in collection:
+            key = self.group_key(nodeid)
+            if key is None:
+                continue
+
+            index, chunk_cost = chunks.get(key, [0, 0.0])
+            if chunk_cost and chunk_cost + self.cost(nodeid) > fair_share:
+                index, chunk_cost = index + 1, 0.0
+            chunks[key] = [index, chunk_cost + self.cost(nodeid)]
+            scopes[nodeid] = f"{key}#{index}"
+
+        return scopes
+
+
+class AffinityScheduling(DurationScheduling):
+    """
+    xdist scheduler keeping tests of one app and persona on the same worker.
+
+    Work units are app + persona (e.g. "apps/saucedemo:problem",
+    "apps/demoqa", "api/reqres"), so per-worker warm state (cached logins,
+    warm contexts, API tokens) is reused instead of being rebuilt on every
+    worker. Units are still capped at a worker's fair share and dispatched
+    longest first, as in DurationScheduling.
+
+    Selected with --schedule=affinity (together with -n).
+    """
+
+    def group_key(self, nodeid: str) -> Optional[str]:
+        return affinity_key(nodeid)
+
+
+def affinity_key(nodeid: str) -> str:
+    """
+    Return "<app>[:<persona>]" for a nodeid.
+
+    The app is the first two path parts (apps/saucedemo, api/reqres).
+    The persona is taken from parametrize ids naming a SauceDemo persona
+    (e.g. test_x[problem]); SauceDemo tests default to "standard".
+    """
+    path, _, name = nodeid.partition("::")
+    app = "/".join(path.split("/")[:2])
+
+    if not app.endswith("saucedemo"):
+        return app
+
+    params = name.partition("[")[2].rstrip("]").split("-")
+    persona = next(
+        (p for p in params if p in Config.get_sauce_personas()), "standard"
+    )
+    return f"{app}:{persona}"
+
+
+def format_cache_stats(stats_by_worker: Dict[str, Dict[str, Dict[str, Any]]]) -> List[str]:
+    """
+    Summarize per-worker fixture cache hits/misses.
+
+    Input: {worker: {cache name: {"hits": int, "misses": int}}}
+    """
+    totals: Dict[str, List[int]] = {}
+    lines = []
+    for worker, caches in sorted(stats_by_worker.items()):
+        parts = []
+        for name, stats in sorted(caches.items()):
+            hits, misses = stats.get("hits", 0), stats.get("misses", 0)
+            total = totals.setdefault(name, [0, 0])
+            total[0] += hits
+            total[1] += misses
+            parts.append(f"{name}={_rate(hits, misses)}")
+        lines.append(f"{worker}: " + ", ".join(parts))
+
+    lines.append(
+        "overall: "
+        + ", ".join(
+            f"{name}={_rate(hits, misses)} ({hits}/{hits + misses})"
+            for name, (hits, misses) in sorted(totals.items())
+        )
+    )
+    return lines
+
+
+def _rate(hits: int, misses: int) -> str:
+    lookups = hits + misses
+    return f"{hits / lookups:.0%}" if lookups else "n/a"
@@ -0,0 +1,128 @@
+# core/storage_state.py
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from playwright.sync_api import Page
+
+from core.config import Config
+from core.logger import get_logger
+
+
+StorageState = Dict[str, Any]
+
+
+class StorageStateCache:
+    """
+    Disk-backed cache of Playwright storage states (cookies + localStorage).
+
+    Responsibilities:
+    - Persist one storage state per key (e.g. SauceDemo persona)
+    - Keep states per xdist worker to avoid cross-process write races
+    - Expire states older than the configured TTL
+
+    NOT responsible for:
+    - Performing the login itself
+    - Deciding whether a restored session is still valid
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        ttl: Optional[int] = None,
+        worker_id: Optional[str] = None,
+    ):
+        self.directory = Path(directory or Config.AUTH_STATE_DIR) / (
+            worker_id or Config.worker_id()
+        )
+        self.ttl = Config.AUTH_STATE_TTL if ttl is None else ttl
+
+        self.hits = 0
+        self.misses = 0
+
+        self.logger = get_logger(self.__class__.__name__)
+
+    def path_for(self, key: str) -> Path:
+        """Return file path of the cached state for a key."""
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> Optional[StorageState]:
+        """Return cached state for a key, or None if missing or stale."""
+        path = self.path_for(key)
+
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.ttl:
+                self.logger.debug("Storage state expired | key=%s | age=%.0fs", key, age)
+                state = None
+            else:
+                state = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            state = None
+
+        if state is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return state
+
+    def save(self, key: str, state: StorageState) -> None:
+        """Persist state for a key (atomic write)."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+        self.logger.debug("Storage state saved | key=%s | path=%s", key, path)
+
+    def invalidate(self, key: str) -> None:
+        """Drop cached state for a key (e.g. session rejected by the app)."""
+        self.path_for(key).unlink(missing_ok=True)
+
+        # A rejected state is a miss, not a hit
+        self.hits -= 1
+        self.misses += 1
+
+
+# ------------------------------------------------------------------
+# Playwright helpers
+# ------------------------------------------------------------------
+
+
+def apply_cookies(page: Page, state: StorageState) -> None:
+    """Inject cookies from a storage state into the page's context."""
+    cookies = state.get("cookies") or []
+    if cookies:
+        page.context.add_cookies(cookies)
+
+
+def restore_local_storage(page: Page, state: StorageState) -> bool:
+    """
+    Restore localStorage entries for the page's current origin.
+
+    Must be called after navigation. Returns True when entries were
+    written (caller should reload for the app to pick them up).
+    """
+    origin = page.evaluate("() => window.location.origin")
+
+    for entry in state.get("origins") or []:
+        if entry.get("origin") != origin or not entry.get("localStorage"):
+            continue
+
+        page.evaluate(
+            """items => items.forEach(
+                ({ name, value }) => window.localStorage.setItem(name, value)
+            )""",
+            entry["localStorage"],
+        )
+        return True
+
+    return False
@@ -0,0 +1,68 @@
+# core/token_cache.py
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Hashable, Optional
+
+from core.logger import get_logger
+
+
+class TokenCache:
+    """
+    In-memory cache of API auth tokens, shared by all clients of a worker.
+
+    Responsibilities:
+    - Keep one token per key (e.g. base URL + credentials)
+    - Fetch a token once, even when several threads ask concurrently
+    - Drop tokens the server rejected (e.g. on 401)
+
+    NOT responsible for:
+    - Performing the login itself (callers pass a fetch callable)
+    """
+
+    def __init__(self):
+        self._tokens: Dict[Hashable, str] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        self.logger = get_logger(self.__class__.__name__)
+
+    def get(self, key: Hashable, fetch: Callable[[], str]) -> str:
+        """Return the cached token for a key, fetching it on a miss."""
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is not None:
+                self.hits += 1
+                return token
+
+            self.misses += 1
+            token = self._tokens[key] = fetch()
+
+        self.logger.debug("Auth token fetched | key=%s", _describe(key))
+        return token
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the cached token for a key."""
+        with self._lock:
+            self._tokens.pop(key, None)
+
+
+def _describe(key: Hashable) -> str:
+    """Key for logs (first two parts only: never log secrets)."""
+    return "/".join(str(part) for part in key[:2]) if isinstance(key, tuple) else "?"
+
+
+_token_cache: Optional[TokenCache] = None
+
+
+def get_token_cache() -> TokenCache:
+    """Return the process-wide (per xdist worker) TokenCache."""
+    global _token_cache
+
+    if _token_cache is None:
+        _token_cache = TokenCache()
+
+    return _token_cache
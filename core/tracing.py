@@ -0,0 +1,103 @@
+# core/tracing.py
+
+from __future__ import annotations
+
+import weakref
+from pathlib import Path
+from typing import Optional
+
+from playwright.sync_api import BrowserContext, Error
+
+from core.config import Config
+from core.logger import get_logger
+
+
+class TraceRecorder:
+    """
+    Per-test Playwright tracing with selectable cost/coverage trade-off.
+
+    Modes (Config.TRACE_MODE / --trace-mode):
+    - "off":   no tracing
+    - "full":  tracing.start()/stop() around every test (legacy behavior)
+    - "chunk": one long-lived tracing session per browser context; each test
+               records a chunk that is saved on failure or dropped on success
+    - "retry": like "chunk", but only tests re-run by pytest-rerunfailures
+               (execution_count > 1) are traced, so first attempts pay nothing
+
+    NOT responsible for:
+    - Deciding whether a test failed (callers save or discard)
+    - Attaching traces to reports
+    """
+
+    MODES = ("off", "full", "chunk", "retry")
+
+    def __init__(self, mode: Optional[str] = None):
+        self.mode = (mode or Config.TRACE_MODE).lower()
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unknown trace mode: {self.mode}")
+
+        # Contexts with a long-lived tracing session ("chunk"/"retry")
+        self._sessions: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+        # Contexts currently recording for a test -> "full" or "chunk"
+        self._active: "weakref.WeakKeyDictionary[BrowserContext, str]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        self.logger = get_logger(self.__class__.__name__)
+
+    def begin(self, context: BrowserContext, attempt: int = 1) -> bool:
+        """Start recording a test. Returns True when tracing is active."""
+        if self.mode == "off" or (self.mode == "retry" and attempt < 2):
+            return False
+
+        try:
+            if self.mode == "full":
+                context.tracing.start(**self._options())
+                self._active[context] = "full"
+                return True
+
+            if context not in self._sessions:
+                context.tracing.start(**self._options())
+                self._sessions.add(context)
+
+            context.tracing.start_chunk()
+            self._active[context] = "chunk"
+            return True
+        except Error as exc:
+            self.logger.debug("Tracing not started | %s", exc)
+            return False
+
+    def is_recording(self, context: BrowserContext) -> bool:
+        return context in self._active
+
+    def save(self, context: BrowserContext, path: Path) -> bool:
+        """Stop recording and write the trace zip. Returns True on success."""
+        return self._stop(context, str(path))
+
+    def discard(self, context: BrowserContext) -> None:
+        """Stop recording without writing anything."""
+        self._stop(context, None)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _stop(self, context: BrowserContext, path: Optional[str]) -> bool:
+        kind = self._active.pop(context, None)
+        if kind is None:
+            return False
+
+        try:
+            if kind == "full":
+                context.tracing.stop(path=path)
+            else:
+                context.tracing.stop_chunk(path=path)
+        except Error as exc:
+            self.logger.debug("Tracing stop failed | %s", exc)
+            return False
+
+        return True
+
+    @staticmethod
+    def _options() -> dict:
+        return {"screenshots": True, "snapshots": True, "sources": True}
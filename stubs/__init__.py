@@ -0,0 +1,19 @@
+# stubs/__init__.py
+
+from __future__ import annotations
+
+from typing import Dict
+
+from stubs.demoqa import demoqa
+from stubs.reqres import ReqResStub
+from stubs.saucedemo import saucedemo
+from stubs.server import StubServer
+
+
+def start_stub_servers() -> Dict[str, StubServer]:
+    """Start one stand-in server per system under test (free local ports)."""
+    return {
+        "saucedemo": StubServer(saucedemo).start(),
+        "demoqa": StubServer(demoqa).start(),
+        "reqres": StubServer(ReqResStub()).start(),
+    }
@@ -0,0 +1,29 @@
+# stubs/__main__.py
+#
+# Run the stand-in servers in the foreground:
+#   python -m stubs
+
+from __future__ import annotations
+
+import threading
+
+from stubs import start_stub_servers
+
+
+def main() -> None:
+    servers = start_stub_servers()
+    print(f"SAUCE_URL={servers['saucedemo'].url}")
+    print(f"DEMOQA_URL={servers['demoqa'].url}")
+    print(f"REQRES_URL={servers['reqres'].url}/api")
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers.values():
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
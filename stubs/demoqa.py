@@ -0,0 +1,231 @@
+# stubs/demoqa.py
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Callable, Dict
+
+from stubs.server import Request, Response, html_response, wsgi_app
+
+
+# Side menu groups: (group name, [(menu name, path)])
+_MENU = [
+    ("Elements", [("Text Box", "text-box"), ("Check Box", "checkbox"), ("Radio Button", "radio-button")]),
+    ("Widgets", [("Date Picker", "date-picker"), ("Slider", "slider")]),
+]
+
+_SHELL_HTML = """<!DOCTYPE html>
+<html><head><title>DEMOQA</title>
+<style>
+  .menu-list li a {{ display: block; }}
+  .rct-node ol[hidden] {{ display: none; }}
+</style></head>
+<body>
+  <header><a href="/">ToolsQA</a></header>
+  <div class="body-height">
+    <div class="left-pannel">{menu}</div>
+    <div class="main-content">
+      {header}
+      {content}
+    </div>
+  </div>
+  {script}
+</body></html>
+"""
+
+_TEXT_BOX_HTML = """
+<form id="userForm" onsubmit="return false">
+  <input id="userName" type="text" placeholder="Full Name">
+  <input id="userEmail" type="email" placeholder="name@example.com">
+  <textarea id="currentAddress" placeholder="Current Address"></textarea>
+  <textarea id="permanentAddress"></textarea>
+  <button id="submit" type="button">Submit</button>
+</form>
+<div id="output"></div>
+"""
+
+_TEXT_BOX_JS = """<script>
+  document.getElementById("submit").addEventListener("click", () => {
+    const rows = [
+      ["name", "Name:", "userName"],
+      ["email", "Email:", "userEmail"],
+      ["current-address", "Current Address :", "currentAddress"],
+      ["permanent-address", "Permananet Address :", "permanentAddress"],
+    ];
+    const output = document.getElementById("output");
+    output.innerHTML = "";
+    for (const [id, label, source] of rows) {
+      const value = document.getElementById(source).value;
+      if (!value) continue;
+      const p = document.createElement("p");
+      p.className = "mb-1 " + id;
+      p.textContent = label + value;
+      output.appendChild(p);
+    }
+  });
+</script>"""
+
+# Check Box tree: (value, title, children)
+_TREE = (
+    "home", "Home", [
+        ("desktop", "Desktop", [("notes", "Notes", []), ("commands", "Commands", [])]),
+        ("documents", "Documents", [
+            ("workspace", "WorkSpace", [
+                ("react", "React", []), ("angular", "Angular", []), ("veu", "Veu", []),
+            ]),
+            ("office", "Office", [
+                ("public", "Public", []), ("private", "Private", []),
+                ("classified", "Classified", []), ("general", "General", []),
+            ]),
+        ]),
+        ("downloads", "Downloads", [("wordFile", "Word File.doc", []), ("excelFile", "Excel File.doc", [])]),
+    ],
+)
+
+_CHECK_BOX_JS = """<script>
+  const boxes = () => [...document.querySelectorAll(".rct-tree input[type=checkbox]")];
+
+  function sync(node) {
+    // Parents are checked when all their children are
+    const children = node.querySelectorAll(":scope > ol > li > .rct-text input");
+    const own = node.querySelector(":scope > .rct-text input");
+    if (children.length) {
+      node.querySelectorAll(":scope > ol > li").forEach(sync);
+      own.checked = [...children].every((c) => c.checked);
+    }
+  }
+
+  document.querySelector(".rct-tree").addEventListener("change", (event) => {
+    const node = event.target.closest(".rct-node");
+    node.querySelectorAll("input[type=checkbox]").forEach((c) => (c.checked = event.target.checked));
+    sync(document.querySelector(".rct-tree > ol > li"));
+
+    const checked = boxes().filter((c) => c.checked);
+    const result = document.getElementById("result");
+    result.innerHTML = checked.length ? "<span>You have selected :</span>" : "";
+    for (const c of checked) {
+      const span = document.createElement("span");
+      span.className = "text-success";
+      span.textContent = c.value;
+      result.appendChild(span);
+    }
+  });
+
+  const toggleAll = (hidden) => document
+    .querySelectorAll(".rct-node > ol")
+    .forEach((ol) => (ol.hidden = hidden));
+  document.querySelector("button[title='Expand all']").addEventListener("click", () => toggleAll(false));
+  document.querySelector("button[title='Collapse all']").addEventListener("click", () => toggleAll(true));
+</script>"""
+
+_RADIO_HTML = """
+<div>Do you like the site?</div>
+<input type="radio" id="yesRadio" name="like" value="Yes"><label for="yesRadio">Yes</label>
+<input type="radio" id="impressiveRadio" name="like" value="Impressive"><label for="impressiveRadio">Impressive</label>
+<input type="radio" id="noRadio" name="like" value="No" disabled><label for="noRadio">No</label>
+<p id="radioResult" hidden>You have selected <span class="text-success"></span></p>
+"""
+
+_RADIO_JS = """<script>
+  document.querySelectorAll("input[name=like]").forEach((radio) => {
+    radio.addEventListener("change", () => {
+      document.querySelector("#radioResult .text-success").textContent = radio.value;
+      document.getElementById("radioResult").hidden = false;
+    });
+  });
+</script>"""
+
+_DATE_PICKER_HTML = """
+<input id="datePickerMonthYearInput" type="text" value="{date}">
+<input id="dateAndTimePickerInput" type="text" value="{date_time}">
+"""
+
+_SLIDER_HTML = """
+<input type="range" class="range-slider" min="0" max="100" step="1" value="25">
+<input id="sliderValue" type="text" value="25" readonly>
+"""
+
+_SLIDER_JS = """<script>
+  const range = document.querySelector("input[type=range]");
+  range.addEventListener("input", () => (document.getElementById("sliderValue").value = range.value));
+</script>"""
+
+
+def _menu() -> str:
+    groups = []
+    for group, items in _MENU:
+        links = "".join(
+            f'<li class="btn btn-light"><a href="/{path}"><span class="text">{name}</span></a></li>'
+            for name, path in items
+        )
+        groups.append(
+            f'<div class="element-group"><div class="header-text">{group}</div>'
+            f'<div class="element-list"><ul class="menu-list">{links}</ul></div></div>'
+        )
+    return "".join(groups)
+
+
+def _page(title: str, content: str = "", script: str = "") -> str:
+    header = f'<h1 class="text-center">{title}</h1>' if title else ""
+    return _SHELL_HTML.format(menu=_menu(), header=header, content=content, script=script)
+
+
+def _tree_node(value: str, title: str, children: list) -> str:
+    child_html = (
+        "<ol hidden>" + "".join(_tree_node(*child) for child in children) + "</ol>"
+        if children
+        else ""
+    )
+    return (
+        '<li class="rct-node">'
+        '<span class="rct-text">'
+        f'<label for="tree-node-{value}">'
+        f'<input id="tree-node-{value}" type="checkbox" value="{value}">'
+        '<span class="rct-checkbox">&#9744;</span>'
+        f'<span class="rct-title">{title}</span>'
+        "</label></span>"
+        f"{child_html}</li>"
+    )
+
+
+def _check_box_page() -> str:
+    content = (
+        '<button title="Expand all" type="button">+</button>'
+        '<button title="Collapse all" type="button">-</button>'
+        f'<div class="rct-tree"><ol>{_tree_node(*_TREE)}</ol></div>'
+        '<div id="result"></div>'
+    )
+    return _page("Check Box", content, _CHECK_BOX_JS)
+
+
+def _date_picker_page() -> str:
+    now = datetime.now()
+    content = _DATE_PICKER_HTML.format(
+        date=now.strftime("%m/%d/%Y"),
+        date_time=now.strftime("%B %d, %Y %I:%M %p"),
+    )
+    return _page("Date Picker", content)
+
+
+_PAGES: Dict[str, Callable[[], str]] = {
+    "/": lambda: _page(""),
+    "/elements": lambda: _page(""),
+    "/widgets": lambda: _page(""),
+    "/text-box": lambda: _page("Text Box", _TEXT_BOX_HTML, _TEXT_BOX_JS),
+    "/checkbox": _check_box_page,
+    "/radio-button": lambda: _page("Radio Button", _RADIO_HTML, _RADIO_JS),
+    "/date-picker": _date_picker_page,
+    "/slider": lambda: _page("Slider", _SLIDER_HTML, _SLIDER_JS),
+}
+
+
+@wsgi_app
+def demoqa(request: Request) -> Response:
+    """
+    Stand-in for demoqa.com: the Elements/Widgets shell with side menu and
+    the pages covered by the DemoQA page objects (same ids and classes).
+    """
+    render = _PAGES.get(request.path.rstrip("/") or "/")
+    if render is None:
+        return html_response(_page("Not Found"), status=404)
+    return html_response(render())
@@ -0,0 +1,198 @@
+# stubs/reqres.py
+
+from __future__ import annotations
+
+import itertools
+import math
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from stubs.server import Request, Response, json_response, respond
+
+
+TOKEN = "QpwL5tke4Pnpja7X4"
+
+_SUPPORT = {
+    "url": "https://reqres.in/#support-heading",
+    "text": "Stand-in ReqRes server (local, hermetic)",
+}
+
+# The 12 users served by the public ReqRes API
+_KNOWN_USERS = [
+    ("george.bluth", "George", "Bluth"),
+    ("janet.weaver", "Janet", "Weaver"),
+    ("emma.wong", "Emma", "Wong"),
+    ("eve.holt", "Eve", "Holt"),
+    ("charles.morris", "Charles", "Morris"),
+    ("tracey.ramos", "Tracey", "Ramos"),
+    ("michael.lawson", "Michael", "Lawson"),
+    ("lindsay.ferguson", "Lindsay", "Ferguson"),
+    ("tobias.funke", "Tobias", "Funke"),
+    ("byron.fields", "Byron", "Fields"),
+    ("george.edwards", "George", "Edwards"),
+    ("rachel.howell", "Rachel", "Howell"),
+]
+
+_USER_PATH = re.compile(r"^/api/users/(\d+)$")
+
+
+class ReqResStub:
+    """
+    WSGI stand-in for the ReqRes API (paths under /api).
+
+    Endpoints:
+    - POST /api/login, /api/register
+    - GET /api/users (page, per_page, delay), GET /api/users/<id>
+    - POST /api/users, PUT/PATCH/DELETE /api/users/<id>
+
+    `total_users` beyond 12 adds synthetic users (large paginated datasets).
+    With `require_auth`, /users calls need "Authorization: Bearer <token>".
+    With `link_header`, user pages also carry a Link rel="next" header.
+    """
+
+    def __init__(
+        self, total_users: int = 12, require_auth: bool = False, link_header: bool = False
+    ):
+        self.users = list(_build_users(total_users))
+        self.require_auth = require_auth
+        self.link_header = link_header
+        self.tokens = {TOKEN}
+
+        self._ids = itertools.count(len(self.users) + 1)
+        self._lock = threading.Lock()
+
+        self.requests = 0
+
+    def __call__(self, environ: Dict[str, Any], start_response) -> Iterable[bytes]:
+        with self._lock:
+            self.requests += 1
+
+        return respond(self.handle(Request(environ)), start_response)
+
+    def handle(self, request: Request) -> Response:
+        if request.path in ("/api/login", "/api/register") and request.method == "POST":
+            return self._login(request, register=request.path.endswith("register"))
+
+        if request.path.startswith("/api/users") and not self._authorized(request):
+            return json_response(401, {"error": "Missing API key"})
+
+        delay = _number(request.query.get("delay"), 0.0)
+        if delay:
+            time.sleep(min(delay, 10.0))
+
+        if request.path == "/api/users":
+            if request.method == "GET":
+                return self._list_users(request)
+            if request.method == "POST":
+                return self._create_user(request)
+            return json_response(405, {})
+
+        match = _USER_PATH.match(request.path)
+        if match:
+            return self._user(request, int(match.group(1)))
+
+        return json_response(404, {})
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+
+    def _login(self, request: Request, register: bool) -> Response:
+        payload = request.json() or {}
+        email = payload.get("email") or payload.get("username")
+
+        if not email:
+            return json_response(400, {"error": "Missing email or username"})
+        if not payload.get("password"):
+            return json_response(400, {"error": "Missing password"})
+
+        user = next((u for u in self.users if u["email"] == email), None)
+        if user is None:
+            return json_response(400, {"error": "user not found"})
+
+        if register:
+            return json_response(200, {"id": user["id"], "token": TOKEN})
+        return json_response(200, {"token": TOKEN})
+
+    def _list_users(self, request: Request) -> Response:
+        page = max(int(_number(request.query.get("page"), 1)), 1)
+        per_page = max(int(_number(request.query.get("per_page"), 6)), 1)
+
+        start = (page - 1) * per_page
+        total_pages = math.ceil(len(self.users) / per_page)
+        status, headers, body = json_response(
+            200,
+            {
+                "page": page,
+                "per_page": per_page,
+                "total": len(self.users),
+                "total_pages": total_pages,
+                "data": self.users[start : start + per_page],
+                "support": _SUPPORT,
+            },
+        )
+
+        if self.link_header and page < total_pages:
+            next_page = f"/api/users?page={page + 1}&per_page={per_page}"
+            headers.append(("Link", f'<{next_page}>; rel="next"'))
+        return status, headers, body
+
+    def _create_user(self, request: Request) -> Response:
+        payload = request.json() or {}
+        return json_response(
+            201, {**payload, "id": str(next(self._ids)), "createdAt": _now()}
+        )
+
+    def _user(self, request: Request, user_id: int) -> Response:
+        if request.method == "GET":
+            if 1 <= user_id <= len(self.users):
+                return json_response(
+                    200, {"data": self.users[user_id - 1], "support": _SUPPORT}
+                )
+            return json_response(404, {})
+
+        if request.method in ("PUT", "PATCH"):
+            return json_response(200, {**(request.json() or {}), "updatedAt": _now()})
+
+        if request.method == "DELETE":
+            return json_response(204)
+
+        return json_response(405, {})
+
+    def _authorized(self, request: Request) -> bool:
+        if not self.require_auth:
+            return True
+        header = request.environ.get("HTTP_AUTHORIZATION", "")
+        return header.removeprefix("Bearer ").strip() in self.tokens
+
+
+def _build_users(total: int) -> Iterable[Dict[str, Any]]:
+    for user_id in range(1, total + 1):
+        if user_id <= len(_KNOWN_USERS):
+            handle, first_name, last_name = _KNOWN_USERS[user_id - 1]
+        else:
+            handle, first_name, last_name = f"user.{user_id}", "User", str(user_id)
+
+        yield {
+            "id": user_id,
+            "email": f"{handle}@reqres.in",
+            "first_name": first_name,
+            "last_name": last_name,
+            "avatar": f"https://reqres.in/img/faces/{(user_id - 1) % 12 + 1}-image.jpg",
+        }
+
+
+def _number(value: Optional[str], default: float) -> float:
+    try:
+        return float(value) if value is not None else default
+    except ValueError:
+        return default
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace(
+        "+00:00", "Z"
+    )
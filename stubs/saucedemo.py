@@ -0,0 +1,154 @@
+# stubs/saucedemo.py
+
+from __future__ import annotations
+
+import html
+import json
+
+from core.config import Config
+from stubs.server import Request, Response, html_response, redirect, wsgi_app
+
+
+SESSION_COOKIE = "session-username"
+
+INVENTORY = [
+    ("Sauce Labs Backpack", "29.99"),
+    ("Sauce Labs Bike Light", "9.99"),
+    ("Sauce Labs Bolt T-Shirt", "15.99"),
+    ("Sauce Labs Fleece Jacket", "49.99"),
+    ("Sauce Labs Onesie", "7.99"),
+    ("Test.allTheThings() T-Shirt (Red)", "15.99"),
+]
+
+_LOGIN_HTML = """<!DOCTYPE html>
+<html><head><title>Swag Labs</title></head>
+<body>
+  <div class="login_logo">Swag Labs</div>
+  <form id="login" onsubmit="return false">
+    <input data-test="username" id="user-name" placeholder="Username">
+    <input data-test="password" id="password" type="password" placeholder="Password">
+    <div class="error-message-container"></div>
+    <input data-test="login-button" id="login-button" type="submit" value="Login">
+  </form>
+  <script>
+    const USERS = __USERS__;
+    const LOCKED = __LOCKED__;
+    const PASSWORD = __PASSWORD__;
+
+    function showError(text) {
+      document.querySelector(".error-message-container").innerHTML =
+        '<h3 data-test="error"></h3>';
+      document.querySelector('[data-test="error"]').textContent = "Epic sadface: " + text;
+    }
+
+    document.getElementById("login-button").addEventListener("click", () => {
+      const username = document.getElementById("user-name").value;
+      const password = document.getElementById("password").value;
+
+      if (!username) return showError("Username is required");
+      if (!password) return showError("Password is required");
+      if (password === PASSWORD && username === LOCKED)
+        return showError("Sorry, this user has been locked out.");
+      if (password !== PASSWORD || !USERS.includes(username))
+        return showError("Username and password do not match any user in this service");
+
+      document.cookie = "__COOKIE__=" + username + "; path=/";
+      window.location.href = "/inventory.html";
+    });
+  </script>
+</body></html>
+"""
+
+_INVENTORY_HTML = """<!DOCTYPE html>
+<html><head><title>Swag Labs</title></head>
+<body>
+  <div class="primary_header">
+    <button id="react-burger-menu-btn" type="button">Open Menu</button>
+    <nav class="bm-menu" style="display: none">
+      <a id="logout_sidebar_link" href="#">Logout</a>
+    </nav>
+    <a class="shopping_cart_link" href="#"></a>
+  </div>
+  <span class="title">Products</span>
+  <div class="inventory_list">__ITEMS__</div>
+  <script>
+    const cart = new Set(JSON.parse(localStorage.getItem("cart-contents") || "[]"));
+
+    function render() {
+      document.querySelectorAll(".inventory_item").forEach((item) => {
+        item.querySelector("button").textContent =
+          cart.has(Number(item.dataset.id)) ? "Remove" : "Add to cart";
+      });
+      const link = document.querySelector(".shopping_cart_link");
+      link.innerHTML = cart.size ? '<span class="shopping_cart_badge">' + cart.size + "</span>" : "";
+      localStorage.setItem("cart-contents", JSON.stringify([...cart]));
+    }
+
+    document.querySelectorAll(".inventory_item button").forEach((button) => {
+      button.addEventListener("click", (event) => {
+        const id = Number(event.target.closest(".inventory_item").dataset.id);
+        cart.has(id) ? cart.delete(id) : cart.add(id);
+        render();
+      });
+    });
+
+    document.getElementById("react-burger-menu-btn").addEventListener("click", () => {
+      document.querySelector(".bm-menu").style.display = "block";
+    });
+
+    document.getElementById("logout_sidebar_link").addEventListener("click", (event) => {
+      event.preventDefault();
+      document.cookie = "__COOKIE__=; path=/; max-age=0";
+      localStorage.removeItem("cart-contents");
+      window.location.href = "/";
+    });
+
+    render();
+  </script>
+</body></html>
+"""
+
+_ITEM_HTML = """
+    <div class="inventory_item" data-id="{id}">
+      <div class="inventory_item_name">{name}</div>
+      <div class="inventory_item_price">${price}</div>
+      <button class="btn_inventory" type="button">Add to cart</button>
+    </div>"""
+
+
+def _login_page() -> str:
+    return (
+        _LOGIN_HTML.replace("__USERS__", json.dumps(list(Config.get_sauce_personas().values())))
+        .replace("__LOCKED__", json.dumps(Config.SAUCE_LOCKED_OUT_USER))
+        .replace("__PASSWORD__", json.dumps(Config.SAUCE_PASSWORD))
+        .replace("__COOKIE__", SESSION_COOKIE)
+    )
+
+
+def _inventory_page() -> str:
+    items = "".join(
+        _ITEM_HTML.format(id=index, name=html.escape(name), price=price)
+        for index, (name, price) in enumerate(INVENTORY)
+    )
+    return _INVENTORY_HTML.replace("__ITEMS__", items).replace(
+        "__COOKIE__", SESSION_COOKIE
+    )
+
+
+@wsgi_app
+def saucedemo(request: Request) -> Response:
+    """
+    Stand-in for www.saucedemo.com: login form and inventory page.
+
+    Login sets the "session-username" cookie (as the real app does); the
+    inventory redirects to the login page without it.
+    """
+    if request.path in ("/", "/index.html"):
+        return html_response(_login_page())
+
+    if request.path == "/inventory.html":
+        if request.cookies.get(SESSION_COOKIE) not in Config.get_sauce_personas().values():
+            return redirect("/")
+        return html_response(_inventory_page())
+
+    return html_response("<h1>Not Found</h1>", status=404)
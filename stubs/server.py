@@ -0,0 +1,174 @@
+# stubs/server.py
+
+from __future__ import annotations
+
+import json
+import threading
+from http.cookies import SimpleCookie
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from core.config import Config
+from core.logger import get_logger
+
+
+WSGIApp = Callable[[Dict[str, Any], Callable], Iterable[bytes]]
+Response = Tuple[str, List[Tuple[str, str]], bytes]
+
+_REASONS = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    302: "Found",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+
+class _QuietHandler(WSGIRequestHandler):
+    """Request handler without per-request stderr logging."""
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class StubServer:
+    """
+    Threaded WSGI server for one stand-in app, on a free local port.
+
+    Usage:
+        with StubServer(reqres_app) as server:
+            client = APIClient(f"{server.url}/api")
+    """
+
+    def __init__(self, app: WSGIApp, host: Optional[str] = None, port: int = 0):
+        self.app = app
+        self.host = host or Config.STUB_HOST
+        self.port = port  # 0: pick a free port
+        self._server: Optional[WSGIServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.logger = get_logger(self.__class__.__name__)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "StubServer":
+        self._server = make_server(
+            self.host,
+            self.port,
+            self.app,
+            server_class=_ThreadingWSGIServer,
+            handler_class=_QuietHandler,
+        )
+        self.port = self._server.server_port
+
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name=f"stub-server-{self.port}",
+            daemon=True,
+        )
+        self._thread.start()
+
+        self.logger.info("Stub server started | %s | %s", _app_name(self.app), self.url)
+        return self
+
+    def stop(self) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+
+        server.shutdown()
+        server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+# ----------------------------------------------------------------------
+# Small WSGI helpers shared by the stand-in apps
+# ----------------------------------------------------------------------
+
+
+class Request:
+    """Minimal view of a WSGI request."""
+
+    def __init__(self, environ: Dict[str, Any]):
+        self.environ = environ
+        self.method = environ["REQUEST_METHOD"].upper()
+        self.path = environ.get("PATH_INFO") or "/"
+        self.query = {
+            key: values[-1]
+            for key, values in parse_qs(environ.get("QUERY_STRING", "")).items()
+        }
+
+        cookie = SimpleCookie(environ.get("HTTP_COOKIE", ""))
+        self.cookies = {key: morsel.value for key, morsel in cookie.items()}
+
+    def body(self) -> bytes:
+        try:
+            length = int(self.environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        return self.environ["wsgi.input"].read(length) if length else b""
+
+    def json(self) -> Any:
+        try:
+            return json.loads(self.body() or b"null")
+        except ValueError:
+            return None
+
+
+def json_response(status: int, payload: Any = None) -> Response:
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    return _status(status), [("Content-Type", "application/json")], body
+
+
+def html_response(html: str, status: int = 200) -> Response:
+    return _status(status), [("Content-Type", "text/html; charset=utf-8")], html.encode("utf-8")
+
+
+def redirect(location: str) -> Response:
+    return _status(302), [("Location", location)], b""
+
+
+def wsgi_app(handler: Callable[[Request], Response]) -> WSGIApp:
+    """Turn `handler(Request) -> (status, headers, body)` into a WSGI app."""
+
+    def app(environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        return respond(handler(Request(environ)), start_response)
+
+    app.__name__ = handler.__name__
+    return app
+
+
+def respond(response: Response, start_response: Callable) -> Iterable[bytes]:
+    """Send a (status, headers, body) response through WSGI start_response."""
+    status, headers, body = response
+    start_response(status, [*headers, ("Content-Length", str(len(body)))])
+    return [body]
+
+
+def _status(code: int) -> str:
+    return f"{code} {_REASONS.get(code, '')}".rstrip()
+
+
+def _app_name(app: WSGIApp) -> str:
+    return getattr(app, "__name__", app.__class__.__name__)
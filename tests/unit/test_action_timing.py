@@ -0,0 +1,86 @@
+"""
+Unit tests for page object action timing (no browser).
+"""
+
+import pytest
+
+from core.action_timing import ActionTimer
+from core.base_page import BasePage
+
+
+class FakePage:
+    url = "about:blank"
+
+    def __init__(self):
+        self.calls = []
+
+    def click(self, selector):
+        self.calls.append(("click", selector))
+
+    def wait_for_selector(self, selector, **kwargs):
+        self.calls.append(("wait", selector))
+
+
+class CartPage(BasePage):
+    ITEM = "#item"
+
+    def add_item(self, name):
+        """Calls Playwright directly, bypassing BasePage.click."""
+        self.page.click(f"{self.ITEM}-{name}")
+
+    def add_via_primitive(self):
+        self.click(self.ITEM)
+
+    def _helper(self):
+        self.page.click(self.ITEM)
+
+
+@pytest.fixture
+def timer(monkeypatch):
+    timer = ActionTimer(enabled=True)
+    monkeypatch.setattr("core.action_timing._timer", timer)
+    return timer
+
+
+def test_page_object_methods_are_timed(timer):
+    page = CartPage(FakePage())
+
+    page.add_item("backpack")
+
+    [entry] = timer.entries()
+    assert (entry.action, entry.selector, entry.page) == ("add_item", "", "CartPage")
+    assert CartPage.add_item.__doc__ == "Calls Playwright directly, bypassing BasePage.click."
+
+
+def test_nested_primitives_recorded_separately(timer):
+    CartPage(FakePage()).add_via_primitive()
+
+    assert [(e.action, e.selector) for e in timer.entries()] == [
+        ("wait_for_visible", "#item"),
+        ("click", "#item"),
+        ("add_via_primitive", ""),
+    ]
+
+
+def test_private_helpers_and_overrides_are_not_wrapped(timer):
+    class DeepLinkPage(CartPage):
+        def open(self, url="", wait_ready=False):
+            super().open(f"https://example.test/{url}", wait_ready=wait_ready)
+
+    page = DeepLinkPage(FakePage())
+    page.page.goto = lambda url, wait_until: None
+    page._helper()
+    page.open("cart")
+
+    assert [e.action for e in timer.entries()] == ["open"]
+
+
+def test_failed_action_recorded(timer):
+    class BrokenPage(BasePage):
+        def explode(self):
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        BrokenPage(FakePage()).explode()
+
+    assert [(e.action, e.ok) for e in timer.entries()] == [("explode", False)]
@@ -0,0 +1,31 @@
+"""
+Unit tests for APIClient log helpers (no network).
+"""
+
+from core.api_client import LazyPayload
+
+
+def test_lazy_payload_truncates_strings():
+    assert str(LazyPayload("y" * 200, limit=10)) == "yyyyyyyyyy... [truncated 190 chars]"
+
+
+def test_lazy_payload_bounds_large_objects():
+    class Item:
+        renders = 0
+
+        def __repr__(self):
+            Item.renders += 1
+            return "<item>"
+
+    payload = [Item() for _ in range(100000)]
+
+    text = str(LazyPayload(payload, limit=100))
+
+    assert text.endswith("... [truncated]")
+    assert len(text) <= 100 + len("... [truncated]")
+    assert Item.renders < 100
+
+
+def test_lazy_payload_small_values_unchanged():
+    assert str(LazyPayload({"id": 1}, limit=100)) == "{'id': 1}"
+    assert str(LazyPayload(lambda: 1 / 0, limit=100)) == "<unreadable>"
@@ -0,0 +1,59 @@
+"""
+Unit tests for AsyncAPIClient fan-out and retry backoff (no network).
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from core.api_client import backoff_delay, build_retry
+from core.async_api_client import AsyncAPIClient
+
+
+def test_gather_cancels_pending_requests_on_first_failure():
+    client = AsyncAPIClient("http://api.local", concurrency=2)
+    finished = []
+
+    async def slow(n):
+        await asyncio.sleep(10)
+        finished.append(n)
+
+    async def failing():
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    async def scenario():
+        requests = [failing(), slow(1), slow(2), slow(3)]
+        with pytest.raises(RuntimeError, match="boom"):
+            await asyncio.wait_for(client.gather(requests), timeout=5)
+        await client.aclose()
+
+    asyncio.run(scenario())
+
+    assert finished == []
+
+
+def test_status_retries_follow_sync_backoff_schedule(monkeypatch):
+    client = AsyncAPIClient("http://api.local", retries=3)
+    client.session = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(503))
+    )
+
+    sleeps = []
+
+    async def record_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("core.async_api_client.asyncio.sleep", record_sleep)
+
+    async def scenario():
+        response = await client.get("/users")
+        await client.aclose()
+        return response
+
+    response = asyncio.run(scenario())
+
+    retry = build_retry(total=3)
+    assert response.status_code == 503
+    assert sleeps == [backoff_delay(retry, attempt) for attempt in (1, 2, 3)]
@@ -0,0 +1,116 @@
+"""
+Unit tests for ContextPool storage reset (no browser).
+"""
+
+from types import SimpleNamespace
+
+from core.browser_pool import ContextPool
+
+
+class FakeRequest:
+    def __init__(self, url, navigation=True):
+        self.url = url
+        self.navigation = navigation
+
+    def is_navigation_request(self):
+        return self.navigation
+
+
+class FakeCDPSession:
+    def __init__(self, sent):
+        self.sent = sent
+
+    def send(self, method, params):
+        self.sent.append((method, params["origin"], params["storageTypes"]))
+
+    def detach(self):
+        pass
+
+
+class FakePage:
+    def __init__(self, url):
+        self.url = url
+        self.scripts = []
+
+    def evaluate(self, script):
+        self.scripts.append(script)
+
+    def close(self):
+        pass
+
+
+class FakeContext:
+    """Just enough of BrowserContext for ContextPool._reset."""
+
+    def __init__(self):
+        self.pages = []
+        self.handlers = []
+        self.sent = []
+
+    def on(self, event, handler):
+        self.handlers.append(handler)
+
+    def visit(self, url, navigation=True):
+        for handler in self.handlers:
+            handler(FakeRequest(url, navigation))
+
+    def new_page(self):
+        page = FakePage("about:blank")
+        self.pages.append(page)
+        return page
+
+    def new_cdp_session(self, page):
+        return FakeCDPSession(self.sent)
+
+    def __getattr__(self, name):
+        # clear_cookies, clear_permissions, unroute_all, ...
+        return lambda *args, **kwargs: None
+
+
+def make_pool(browser_name):
+    browser = SimpleNamespace(
+        browser_type=SimpleNamespace(name=browser_name),
+        new_context=lambda **options: FakeContext(),
+    )
+    return ContextPool(browser, size=1, context_options={})
+
+
+def test_chromium_clears_every_visited_origin():
+    pool = make_pool("chromium")
+    context = pool.acquire()
+    context.visit("https://demoqa.com/text-box")
+    context.visit("https://ads.example.com/frame")
+    context.visit("https://cdn.example.com/app.js", navigation=False)
+
+    pool.release(context)
+
+    assert pool.stats()["resets"] == 1
+    assert sorted(context.sent) == [
+        ("Storage.clearDataForOrigin", "https://ads.example.com", "all"),
+        ("Storage.clearDataForOrigin", "https://demoqa.com", "all"),
+    ]
+
+
+def test_other_browsers_discard_contexts_with_unreachable_origins():
+    pool = make_pool("firefox")
+    context = pool.acquire()
+    context.pages.append(FakePage("https://demoqa.com/text-box"))
+    context.visit("https://demoqa.com/text-box")
+    context.visit("https://www.saucedemo.com/")
+
+    pool.release(context)
+
+    assert pool.stats()["discards"] == 1
+    assert context.pages[0].scripts
+
+
+def test_other_browsers_reuse_contexts_cleared_from_open_pages():
+    pool = make_pool("webkit")
+    context = pool.acquire()
+    context.pages.append(FakePage("https://demoqa.com/text-box"))
+    context.visit("https://demoqa.com/text-box")
+
+    pool.release(context)
+
+    assert pool.stats()["resets"] == 1
+    assert pool.acquire() is context
@@ -0,0 +1,132 @@
+"""
+Unit tests for the duration history, regression detection and summary.
+"""
+
+import pytest
+
+from core.duration_profiler import DurationHistory, find_regressions, format_summary
+
+
+def run(ts, **totals):
+    """History row where each test's duration is all in the call phase."""
+    return {
+        "ts": ts,
+        "tests": {nodeid: [0.0, total, 0.0, "passed"] for nodeid, total in totals.items()},
+        "fixtures": {},
+        "groups": {},
+    }
+
+
+# ---------- DurationHistory ----------
+
+
+def test_history_keeps_last_runs_only(tmp_path):
+    history = DurationHistory(tmp_path / "durations.jsonl", max_runs=3)
+
+    for ts in range(5):
+        history.append(run(ts, t=1.0))
+
+    assert [row["ts"] for row in history.runs()] == [2, 3, 4]
+    assert not (tmp_path / "durations.tmp").exists()
+
+
+def test_history_skips_unreadable_rows(tmp_path):
+    path = tmp_path / "durations.jsonl"
+    history = DurationHistory(path, max_runs=5)
+    history.append(run(1, t=1.0))
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write('{"ts": 2, "tes\n')
+
+    assert [row["ts"] for row in history.runs()] == [1]
+    assert DurationHistory(tmp_path / "missing.jsonl").runs() == []
+
+
+def test_baseline_is_median_of_passed_runs(tmp_path):
+    history = DurationHistory(tmp_path / "durations.jsonl", max_runs=10)
+    for total in (1.0, 9.0, 2.0, 3.0):
+        history.append(run(0, t=total))
+    failed = run(0, t=100.0)
+    failed["tests"]["t"][3] = "failed"
+    history.append(failed)
+
+    assert history.baseline(runs=5) == {"t": 2.5}
+    assert history.baseline(runs=4) == {"t": 3.0}
+    assert history.baseline(runs=2, skip_latest=True) == {"t": 2.5}
+
+
+def test_groups_most_recent_run_wins(tmp_path):
+    history = DurationHistory(tmp_path / "durations.jsonl", max_runs=10)
+    first, second = run(1), run(2)
+    first["groups"] = {"logged_in_page": ["a", "b"]}
+    second["groups"] = {"api_client": ["b"]}
+    history.append(first)
+    history.append(second)
+
+    assert history.groups() == {"a": "logged_in_page", "b": "api_client"}
+
+
+# ---------- find_regressions ----------
+
+
+@pytest.mark.parametrize(
+    "current, expected",
+    [
+        (1.4, False),  # +40%: under the percentage threshold
+        (1.6, True),  # +60% and +0.6s
+        (12.0, True),
+    ],
+)
+def test_regression_percentage_threshold(current, expected):
+    regressions = find_regressions(
+        {"t": [0.0, current, 0.0, "passed"]}, {"t": 1.0}, threshold_pct=50, min_seconds=0.5
+    )
+
+    assert bool(regressions) is expected
+
+
+def test_regression_ignores_small_absolute_increase():
+    tests = {"fast": [0.0, 0.3, 0.0, "passed"]}  # +200%, but only +0.2s
+
+    assert find_regressions(tests, {"fast": 0.1}, threshold_pct=50, min_seconds=0.5) == []
+
+
+def test_regression_ignores_failed_and_new_tests():
+    tests = {
+        "failed": [0.0, 10.0, 0.0, "failed"],
+        "new": [0.0, 10.0, 0.0, "passed"],
+    }
+
+    assert find_regressions(tests, {"failed": 1.0}, threshold_pct=50, min_seconds=0.5) == []
+
+
+def test_regressions_sorted_by_absolute_increase():
+    tests = {
+        "small": [0.5, 1.5, 0.0, "passed"],  # +1s
+        "large": [0.0, 12.0, 0.0, "passed"],  # +2s
+    }
+
+    regressions = find_regressions(
+        tests, {"small": 1.0, "large": 10.0}, threshold_pct=10, min_seconds=0.5
+    )
+
+    assert regressions == [
+        {"nodeid": "large", "baseline": 10.0, "current": 12.0, "increase_pct": 20.0},
+        {"nodeid": "small", "baseline": 1.0, "current": 2.0, "increase_pct": 100.0},
+    ]
+
+
+# ---------- format_summary ----------
+
+
+def test_format_summary():
+    tests = {"a": [0.5, 2.0, 0.25, "passed"], "b": [0.5, 1.0, 0.0, "failed"]}
+    fixtures = {"page": [2, 0.75], "cheap": [4, 0.001], "browser": [1, 3.0]}
+    regressions = [{"nodeid": "a", "baseline": 1.0, "current": 2.75, "increase_pct": 175.0}]
+
+    assert format_summary(tests, fixtures, regressions) == [
+        "phases: setup=1.00s, call=3.00s, teardown=0.25s",
+        "fixture browser: 3.00s over 1 setups",
+        "fixture page: 0.75s over 2 setups",
+        "REGRESSION a: 2.75s vs baseline 1.00s (+175.0%)",
+    ]
+    assert format_summary(tests, {}, [])[-1] == "no duration regressions"
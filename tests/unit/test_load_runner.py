@@ -0,0 +1,158 @@
+"""
+Unit tests for the load runner's pure logic (no network).
+"""
+
+import math
+import random
+
+import pytest
+
+from core.load_runner import (
+    Endpoint,
+    EndpointStats,
+    LatencyHistogram,
+    LoadProfile,
+    LoadResult,
+    compare_results,
+    parse_endpoint,
+)
+
+
+# ---------- LatencyHistogram ----------
+
+
+def test_histogram_percentiles_within_one_percent():
+    rng = random.Random(7)
+    values = sorted(rng.expovariate(1 / 0.05) for _ in range(50000))
+
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    for pct in (50, 90, 99, 99.9):
+        exact = values[math.ceil(pct / 100 * len(values)) - 1]
+        assert histogram.percentile(pct) == pytest.approx(exact, rel=0.01)
+    assert histogram.max / 1e6 == pytest.approx(values[-1], abs=1e-6)
+
+
+def test_histogram_small_values_are_exact():
+    histogram = LatencyHistogram(precision_bits=7)
+    for micros in (1, 17, 255):
+        histogram.record(micros / 1e6)
+
+    assert sorted(histogram.counts) == [1, 17, 255]
+    assert histogram.percentile(100) == pytest.approx(255 / 1e6)
+
+
+def test_histogram_bucket_bounds():
+    histogram = LatencyHistogram(precision_bits=7)
+
+    for value in (256, 1000, 123456, 10**7):
+        bucket = histogram._bucket(value)
+        width = histogram._width(bucket)
+        assert bucket <= value < bucket + width
+        assert width / bucket <= 1 / 128  # relative bucket size
+
+
+def test_histogram_percentile_never_exceeds_max():
+    histogram = LatencyHistogram()
+    histogram.record(0.123457)
+
+    assert histogram.percentile(50) == pytest.approx(0.123457)
+
+
+def test_histogram_merge():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    for value in (0.001, 0.002):
+        first.record(value)
+    second.record(0.5)
+
+    merged = first.merge(second)
+
+    assert merged.count == 3
+    assert merged.max == 500000
+    assert merged.percentile(100) == pytest.approx(0.5)
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(99) == 0.0
+    assert histogram.mean() == 0.0
+
+
+# ---------- LoadProfile ramp-up ----------
+
+
+def test_linear_ramp_delays():
+    profile = LoadProfile(users=4, ramp_up=2.0)
+
+    assert [profile.start_delay(u) for u in range(4)] == [0.0, 0.5, 1.0, 1.5]
+
+
+def test_stepped_ramp_delays():
+    profile = LoadProfile(users=6, ramp_up=3.0, ramp_steps=3)
+
+    assert [profile.start_delay(u) for u in range(6)] == [0.0, 0.0, 1.0, 1.0, 2.0, 2.0]
+
+
+def test_no_ramp_starts_everyone_at_once():
+    assert LoadProfile(users=5).start_delay(4) == 0.0
+    assert LoadProfile(users=1, ramp_up=10).start_delay(0) == 0.0
+
+
+# ---------- Endpoints ----------
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("/users", Endpoint("GET", "/users")),
+        ("post /login", Endpoint("POST", "/login")),
+        ("GET /users?page=2", Endpoint("GET", "/users?page=2")),
+        ("GET /users/2*3", Endpoint("GET", "/users/2", weight=3)),
+    ],
+)
+def test_parse_endpoint(spec, expected):
+    assert parse_endpoint(spec) == expected
+
+
+def test_endpoint_name_drops_query():
+    assert Endpoint("GET", "/users?page=2").name == "GET /users"
+
+
+# ---------- Results ----------
+
+
+def test_throughput_counts_full_load_window_only():
+    stats = EndpointStats()
+    for _ in range(10):
+        stats.record(0.01, "200", True, full_load=False)  # during ramp-up
+    for _ in range(40):
+        stats.record(0.01, "200", True)
+    stats.record(0.01, "503", False)
+
+    result = LoadResult("t", LoadProfile(ramp_up=2.0), {"GET /users": stats}, elapsed=6.0)
+    row = result.to_dict()
+
+    assert row["window"] == 4.0
+    assert row["total"]["requests"] == 51
+    assert row["total"]["rps"] == pytest.approx(41 / 4.0, abs=0.1)
+    assert row["total"]["errors"] == 1
+    assert row["total"]["statuses"] == {"200": 50, "503": 1}
+
+
+def test_compare_results():
+    def row(p99, rps, endpoints=("GET /users",)):
+        stats = {"p99_ms": p99, "rps": rps}
+        return {"endpoints": {name: stats for name in endpoints}, "total": stats}
+
+    lines = compare_results(
+        row(10.0, 100.0), row(15.0, 50.0, endpoints=("GET /users", "GET /users/2"))
+    )
+
+    assert lines == [
+        "GET /users: p99 10.0 -> 15.0 ms (+50%), rps 100.0 -> 50.0 (-50%)",
+        "GET /users/2: new endpoint",
+        "total: p99 10.0 -> 15.0 ms (+50%), rps 100.0 -> 50.0 (-50%)",
+    ]
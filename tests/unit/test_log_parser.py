@@ -0,0 +1,93 @@
+"""
+Round trip: JSONL execution log records written by core.logger, read back
+and aggregated by utils.log_parser.
+"""
+
+import logging
+
+import pytest
+
+from core.config import Config
+from core.logger import (
+    JsonLineFormatter,
+    _ContextFilter,
+    clear_log_context,
+    event_extra,
+    set_log_context,
+)
+from utils.log_parser import DurationStats, aggregate_durations, iter_records
+
+
+@pytest.fixture
+def jsonl_logger(tmp_path):
+    path = tmp_path / "execution.jsonl"
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(JsonLineFormatter())
+
+    logger = logging.getLogger("tests.unit.log_round_trip")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addFilter(_ContextFilter())
+    logger.addHandler(handler)
+
+    yield logger, path
+
+    logger.removeHandler(handler)
+    handler.close()
+    clear_log_context()
+
+
+def test_records_round_trip_with_context(jsonl_logger):
+    logger, path = jsonl_logger
+
+    set_log_context("tests/test_a.py::test_one", "call")
+    for duration in (10.0, 20.0, 30.0):
+        logger.info("action", extra=event_extra("ui.action", duration_ms=duration))
+    logger.info("plain message")
+
+    set_log_context("tests/test_a.py::test_two", "setup")
+    logger.info("action", extra=event_extra("ui.action", duration_ms=100.0))
+    clear_log_context()
+
+    records = list(iter_records(path))
+
+    assert len(records) == 5
+    first = records[0]
+    assert first["nodeid"] == "tests/test_a.py::test_one"
+    assert first["phase"] == "call"
+    assert first["worker"] == Config.worker_id()
+    assert first["event"] == "ui.action"
+    assert first["duration_ms"] == 10.0
+    assert "event" not in records[3]
+
+    groups = aggregate_durations(
+        iter_records(path, event="ui.action"), group_by=("nodeid", "phase")
+    )
+
+    assert set(groups) == {
+        ("tests/test_a.py::test_one", "call"),
+        ("tests/test_a.py::test_two", "setup"),
+    }
+    one = groups[("tests/test_a.py::test_one", "call")]
+    assert (one.count, one.total, one.min, one.max) == (3, 60.0, 10.0, 30.0)
+    assert one.mean == 20.0
+    assert groups[("tests/test_a.py::test_two", "setup")].as_dict()["p99"] == 100.0
+
+
+def test_malformed_lines_are_skipped(tmp_path):
+    path = tmp_path / "execution.jsonl"
+    path.write_text('{"event": "a", "duration_ms": 5}\n{"event": "a", "dur\n', encoding="utf-8")
+
+    groups = aggregate_durations(iter_records(path))
+
+    assert groups[("a",)].count == 1
+
+
+def test_duration_stats_percentile_error_is_bounded():
+    stats = DurationStats()
+    for value in range(1, 1001):
+        stats.add(float(value))
+
+    assert stats.percentile(50) == pytest.approx(500, rel=0.02)
+    assert stats.percentile(99) == pytest.approx(990, rel=0.02)
+    assert stats.percentile(100) == 1000.0
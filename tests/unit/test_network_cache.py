@@ -0,0 +1,75 @@
+"""
+Unit tests for HAR record/replay routing (no browser).
+"""
+
+import os
+
+from core.network_cache import NetworkCache
+
+
+class FakePage:
+    """Records the routes a NetworkCache installs."""
+
+    def __init__(self):
+        self.routes = []
+
+    def route(self, url, handler):
+        self.routes.append(("route", url))
+
+    def route_from_har(self, har, url=None, not_found="abort", **kwargs):
+        self.routes.append(("har", har.name, not_found, kwargs.get("update", False)))
+
+
+def touch(path, mtime):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{}")
+    os.utime(path, (mtime, mtime))
+
+
+def test_record_writes_one_har_per_worker(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    cache = NetworkCache("record", "assets", tmp_path, blocklist=[])
+    page = FakePage()
+
+    cache.attach(page, "demoqa", "text-box")
+
+    assert page.routes == [("har", "text-box.gw3.har", "abort", True)]
+
+
+def test_replay_uses_most_recent_recording(tmp_path):
+    cache = NetworkCache("replay", "assets", tmp_path, blocklist=[])
+    touch(tmp_path / "demoqa" / "slider.har", 100)
+    touch(tmp_path / "demoqa" / "slider.gw0.har", 300)
+    touch(tmp_path / "demoqa" / "slider.gw1.har", 200)
+    touch(tmp_path / "demoqa" / "slider.extra.har", 400)  # another page
+
+    assert cache.replay_path("demoqa", "slider").name == "slider.gw0.har"
+    assert cache.replay_path("demoqa", "checkbox") is None
+
+
+def test_offline_replay_falls_back_across_hars(tmp_path):
+    cache = NetworkCache("replay", "all", tmp_path, blocklist=["ads.example"])
+    touch(tmp_path / "demoqa" / "elements.har", 100)
+    touch(tmp_path / "demoqa" / "checkbox.har", 100)
+    page = FakePage()
+
+    cache.attach(page, "demoqa", "elements")
+    cache.attach(page, "demoqa", "checkbox")
+    cache.attach(page, "demoqa", "checkbox")
+
+    # The catch-all abort is registered first, so it runs after every HAR
+    assert [r[:3] for r in page.routes] == [
+        ("route", "**/*"),
+        ("har", "elements.har", "fallback"),
+        ("route", cache._blocked_host),
+        ("har", "checkbox.har", "fallback"),
+    ]
+
+
+def test_replay_without_recording_stays_online(tmp_path):
+    cache = NetworkCache("replay", "all", tmp_path, blocklist=[])
+    page = FakePage()
+
+    cache.attach(page, "demoqa", "widgets")
+
+    assert page.routes == []
@@ -0,0 +1,188 @@
+"""
+Unit tests for duration-aware / affinity xdist scheduling and cache stats.
+"""
+
+import pytest
+
+from core.duration_profiler import DurationHistory
+from core.scheduling import (
+    AffinityScheduling,
+    DurationScheduling,
+    _rate,
+    affinity_key,
+    format_cache_stats,
+    lpt_makespan,
+)
+
+
+class FakeNode:
+    """The part of xdist's WorkerController a scheduler talks to."""
+
+    def __init__(self, name):
+        self.gateway = type("Gateway", (), {"id": name})()
+        self.sent = []
+        self.shutting_down = False
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+@pytest.fixture
+def xdist_config(pytestconfig, monkeypatch):
+    """Session config with two xdist execution nodes (as with -n 2)."""
+    monkeypatch.setattr(pytestconfig.option, "tx", ["2*popen"], raising=False)
+    return pytestconfig
+
+
+def make_scheduler(cls, config, tmp_path, durations, groups=None):
+    history = DurationHistory(tmp_path / "durations.jsonl")
+    history.append(
+        {
+            "ts": 0,
+            "tests": {nodeid: [0.0, cost, 0.0, "passed"] for nodeid, cost in durations.items()},
+            "fixtures": {},
+            "groups": groups or {},
+        }
+    )
+
+    return cls(config, history=history)
+
+
+def start(scheduler, collection, workers=2):
+    nodes = [FakeNode(f"gw{i}") for i in range(workers)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    scheduler.schedule()
+    return nodes
+
+
+# ---------- lpt_makespan ----------
+
+
+@pytest.mark.parametrize(
+    "costs, workers, expected",
+    [
+        ([5, 4, 3, 3, 3], 2, 10),  # greedy {5, 3}, {4, 3, 3}; the optimum is 9
+        ([1, 1, 1, 1], 4, 1),
+        ([10, 1, 1], 2, 10),
+        ([], 3, 0),
+    ],
+)
+def test_lpt_makespan(costs, workers, expected):
+    assert lpt_makespan(costs, workers) == expected
+
+
+# ---------- DurationScheduling ----------
+
+
+def test_units_dispatched_longest_first(xdist_config, tmp_path):
+    durations = {
+        "t/a.py::short": 1.0,
+        "t/a.py::long": 8.0,
+        "t/a.py::mid": 4.0,
+        "t/a.py::tiny": 0.5,
+    }
+    collection = list(durations) + ["t/a.py::unknown"]
+    scheduler = make_scheduler(DurationScheduling, xdist_config, tmp_path, durations)
+
+    first, second = start(scheduler, collection)
+
+    # Unknown tests cost the median known duration (2.5s)
+    assert scheduler.cost("t/a.py::unknown") == 2.5
+    # Idle workers pull the next unit: long, mid, then unknown, short
+    assert [collection[i] for i in first.sent] == ["t/a.py::long", "t/a.py::unknown"]
+    assert [collection[i] for i in second.sent] == ["t/a.py::mid", "t/a.py::short"]
+    assert list(scheduler.workqueue) == ["t/a.py::tiny"]
+
+
+def test_grouped_tests_chunked_to_fair_share(xdist_config, tmp_path):
+    grouped = [f"t/a.py::g{i}" for i in range(6)]
+    durations = dict.fromkeys(grouped, 2.0)
+    durations["t/b.py::alone"] = 0.0
+    scheduler = make_scheduler(
+        DurationScheduling, xdist_config, tmp_path, durations, {"authenticated_page": grouped}
+    )
+
+    # total 12s over 2 workers: fair share 6s -> chunks of three 2s tests
+    scopes = scheduler._plan_scopes(list(durations), workers=2)
+
+    assert scopes == {
+        **dict.fromkeys(grouped[:3], "authenticated_page#0"),
+        **dict.fromkeys(grouped[3:], "authenticated_page#1"),
+    }
+    assert scheduler._split_scope("t/b.py::alone") == "t/b.py::alone"
+
+
+def test_expensive_grouped_test_gets_its_own_chunk(xdist_config, tmp_path):
+    durations = {"t/a.py::huge": 10.0, "t/a.py::small": 1.0}
+    groups = {"authenticated_page": list(durations)}
+    scheduler = make_scheduler(DurationScheduling, xdist_config, tmp_path, durations, groups)
+
+    # fair share 5.5s: the 10s test gets a chunk of its own, never an empty one
+    assert scheduler._plan_scopes(list(durations), workers=2) == {
+        "t/a.py::huge": "authenticated_page#0",
+        "t/a.py::small": "authenticated_page#1",
+    }
+
+
+# ---------- AffinityScheduling ----------
+
+
+@pytest.mark.parametrize(
+    "nodeid, expected",
+    [
+        ("apps/demoqa/tests/test_forms.py::test_submit", "apps/demoqa"),
+        ("api/reqres/tests/test_users_api.py::test_list[2]", "api/reqres"),
+        ("apps/saucedemo/tests/test_cart.py::test_add", "apps/saucedemo:standard"),
+        ("apps/saucedemo/tests/test_cart.py::test_add[problem]", "apps/saucedemo:problem"),
+        ("apps/saucedemo/tests/test_cart.py::test_add[chrome-visual]", "apps/saucedemo:visual"),
+        ("apps/saucedemo/tests/test_cart.py::test_add[unknown]", "apps/saucedemo:standard"),
+    ],
+)
+def test_affinity_key(nodeid, expected):
+    assert affinity_key(nodeid) == expected
+
+
+def test_affinity_units_follow_app_and_persona(xdist_config, tmp_path):
+    collection = [
+        "apps/saucedemo/tests/test_cart.py::test_add[problem]",
+        "apps/demoqa/tests/test_forms.py::test_submit",
+        "apps/saucedemo/tests/test_cart.py::test_add[standard]",
+        "apps/saucedemo/tests/test_login.py::test_login[problem]",
+    ]
+    scheduler = make_scheduler(
+        AffinityScheduling, xdist_config, tmp_path, dict.fromkeys(collection, 1.0)
+    )
+
+    scopes = scheduler._plan_scopes(collection, workers=1)
+
+    assert scopes[collection[0]] == scopes[collection[3]] == "apps/saucedemo:problem#0"
+    assert scopes[collection[1]] == "apps/demoqa#0"
+    assert scopes[collection[2]] == "apps/saucedemo:standard#0"
+
+
+# ---------- Cache stats ----------
+
+
+@pytest.mark.parametrize(
+    "hits, misses, expected", [(3, 1, "75%"), (0, 0, "n/a"), (0, 5, "0%"), (2, 0, "100%")]
+)
+def test_rate(hits, misses, expected):
+    assert _rate(hits, misses) == expected
+
+
+def test_format_cache_stats():
+    stats = {
+        "gw1": {"token": {"hits": 1, "misses": 1}, "login": {"hits": 0, "misses": 0}},
+        "gw0": {"token": {"hits": 9, "misses": 1}},
+    }
+
+    assert format_cache_stats(stats) == [
+        "gw0: token=90%",
+        "gw1: login=n/a, token=50%",
+        "overall: login=n/a (0/0), token=83% (10/12)",
+    ]
@@ -0,0 +1,67 @@
+"""
+Unit tests for SchemaStore $ref preloading and invalidation.
+"""
+
+import json
+import os
+
+import pytest
+
+from utils.validators import SchemaStore, SchemaValidationError
+
+
+USER = {"type": "object", "properties": {"id": {"type": "integer"}}, "required": ["id"]}
+PAGE = {"type": "object", "properties": {"data": {"type": "array", "items": {"$ref": "user.json"}}}}
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    (tmp_path / "user.json").write_text(json.dumps(USER))
+    (tmp_path / "page.json").write_text(json.dumps(PAGE))
+    return tmp_path
+
+
+def test_referenced_schemas_are_preloaded(schema_dir, monkeypatch):
+    store = SchemaStore(root=schema_dir)
+    store.validator("page.json")
+
+    retrieved = []
+    monkeypatch.setattr(store, "_retrieve", retrieved.append)
+
+    store.validate({"data": [{"id": n} for n in range(50)]}, "page.json")
+
+    assert retrieved == []
+    assert set(store._validators[schema_dir / "page.json"][0]) == {
+        schema_dir / "page.json",
+        schema_dir / "user.json",
+    }
+
+
+def test_refresh_rebuilds_after_dependency_change(schema_dir):
+    store = SchemaStore(root=schema_dir)
+    store.validate({"data": [{"id": 1}]}, "page.json")
+
+    user_file = schema_dir / "user.json"
+    user_file.write_text(json.dumps({**USER, "properties": {"id": {"type": "string"}}}))
+    mtime = user_file.stat().st_mtime_ns + 10**9
+    os.utime(user_file, ns=(mtime, mtime))
+
+    # No disk I/O on validate: the change is picked up by refresh()
+    store.validate({"data": [{"id": 1}]}, "page.json")
+    assert store.refresh() == 1
+
+    with pytest.raises(SchemaValidationError, match="is not of type 'string'"):
+        store.validate({"data": [{"id": 1}]}, "page.json")
+
+
+def test_validate_does_no_disk_io(schema_dir, monkeypatch):
+    store = SchemaStore(root=schema_dir)
+    store.validate({"data": []}, "page.json")
+
+    def no_io(*args, **kwargs):
+        raise AssertionError("filesystem access on the validation hot path")
+
+    monkeypatch.setattr("pathlib.Path.stat", no_io)
+    monkeypatch.setattr("pathlib.Path.resolve", no_io)
+
+    store.validate({"data": [{"id": 1}]}, "page.json")
@@ -0,0 +1,150 @@
+# Streaming aggregation of JSONL execution logs (Config.LOG_JSONL)
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+
+PathLike = Union[str, Path]
+
+
+def iter_records(
+    paths: Union[PathLike, Iterable[PathLike]], event: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield log records one line at a time (constant memory).
+
+    `paths` may be files or glob patterns (e.g. "reports/execution*.jsonl").
+    Malformed lines (e.g. a worker killed mid-write) are skipped.
+    """
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+
+    for pattern in paths:
+        files = sorted(glob.glob(str(pattern))) or [str(pattern)]
+        for file_path in files:
+            with open(file_path, encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if event is None or record.get("event") == event:
+                        yield record
+
+
+class DurationStats:
+    """
+    Running duration statistics in constant memory.
+
+    Percentiles come from a log-scale histogram (bucket width ~2%), so
+    the error is bounded regardless of how many values are added.
+    """
+
+    _GROWTH = 1.02
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._buckets: Dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        bucket = math.ceil(math.log(value, self._GROWTH)) if value > 1e-3 else -1000
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Approximate percentile (upper bound of the matching bucket)."""
+        if not self.count:
+            return 0.0
+
+        rank = math.ceil(self.count * pct / 100)
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(self._GROWTH**bucket, self.max)
+        return self.max
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": round(self.total, 3),
+            "mean": round(self.mean, 3),
+            "min": round(self.min if self.count else 0.0, 3),
+            "p50": round(self.percentile(50), 3),
+            "p95": round(self.percentile(95), 3),
+            "p99": round(self.percentile(99), 3),
+            "max": round(self.max, 3),
+        }
+
+
+def aggregate_durations(
+    records: Iterable[Dict[str, Any]],
+    group_by: Sequence[str] = ("event",),
+    field: str = "duration_ms",
+) -> Dict[Tuple[Any, ...], DurationStats]:
+    """Group records by the given keys and aggregate `field` (records without it are skipped)."""
+    groups: Dict[Tuple[Any, ...], DurationStats] = {}
+
+    for record in records:
+        value = record.get(field)
+        if not isinstance(value, (int, float)):
+            continue
+
+        key = tuple(record.get(name) for name in group_by)
+        stats = groups.get(key)
+        if stats is None:
+            stats = groups[key] = DurationStats()
+        stats.add(float(value))
+
+    return groups
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Print the slowest groups of a JSONL log.
+
+    Usage:
+        python -m utils.log_parser "reports/execution*.jsonl" --event api.response --by url
+    """
+    parser = argparse.ArgumentParser(description="Aggregate durations from JSONL logs")
+    parser.add_argument("paths", nargs="+", help="JSONL files or glob patterns")
+    parser.add_argument("--event", default=None, help="Only records of this event")
+    parser.add_argument(
+        "--by", default="event", help="Comma-separated grouping keys (default: event)"
+    )
+    parser.add_argument("--top", type=int, default=20, help="Rows to print")
+    args = parser.parse_args(argv)
+
+    group_by = [name.strip() for name in args.by.split(",") if name.strip()]
+    groups = aggregate_durations(iter_records(args.paths, args.event), group_by)
+
+    rows = sorted(groups.items(), key=lambda item: item[1].total, reverse=True)
+    print(f"{'group':<70} {'count':>7} {'total_ms':>11} {'p50':>9} {'p95':>9} {'max':>9}")
+    for key, stats in rows[: args.top]:
+        summary = stats.as_dict()
+        label = " | ".join(str(part) for part in key)[:70]
+        print(
+            f"{label:<70} {summary['count']:>7} {summary['total']:>11.1f} "
+            f"{summary['p50']:>9.1f} {summary['p95']:>9.1f} {summary['max']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
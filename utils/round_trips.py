@@ -0,0 +1,64 @@
+# Driver round-trip counting for benchmarks
+
+from __future__ import annotations
+
+from typing import Any
+
+# Page/Locator methods that build objects locally (no browser call)
+_LOCAL_METHODS = {
+    "locator",
+    "frame_locator",
+    "get_by_role",
+    "get_by_text",
+    "get_by_label",
+    "get_by_placeholder",
+    "get_by_test_id",
+    "get_by_title",
+    "get_by_alt_text",
+    "filter",
+    "first",
+    "last",
+    "nth",
+    "or_",
+    "and_",
+}
+
+
+class RoundTripCounter:
+    """
+    Proxy around a Playwright Page (or Locator) counting driver calls.
+
+    Every sync API method call is one round-trip to the browser driver,
+    except locator construction, which is counted on the derived locator's
+    actions instead.
+
+    Usage:
+        counter = RoundTripCounter(page_object.page)
+        page_object.page = counter
+        ...
+        counter.calls
+    """
+
+    def __init__(self, target: Any, root: "RoundTripCounter | None" = None):
+        self._target = target
+        self._root = root or self
+        self.calls = 0
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+
+        if name in _LOCAL_METHODS:
+            if callable(attr):
+                return lambda *args, **kwargs: RoundTripCounter(
+                    attr(*args, **kwargs), self._root
+                )
+            return RoundTripCounter(attr, self._root)  # .first / .last
+
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            self._root.calls += 1
+            return attr(*args, **kwargs)
+
+        return call
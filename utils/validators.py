@@ -1 +1,273 @@
 # Custom assertions
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urljoin, urlsplit
+from urllib.request import url2pathname
+
+from jsonschema import validators as jsonschema_validators
+from jsonschema.exceptions import ValidationError, best_match
+from jsonschema.protocols import Validator
+from referencing import Registry, Resource
+from referencing.exceptions import NoSuchResource
+from referencing.jsonschema import DRAFT202012
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+SchemaPath = Union[str, Path]
+
+
+class SchemaValidationError(AssertionError):
+    """Response data does not match its JSON schema."""
+
+    def __init__(self, schema_path: Path, error: ValidationError, index: Optional[int] = None):
+        self.schema_path = schema_path
+        self.error = error
+        self.index = index
+
+        location = error.json_path if index is None else f"$[{index}]{error.json_path[1:]}"
+        super().__init__(f"{schema_path.name}: {error.message} (at {location})")
+
+
+class SchemaStore:
+    """
+    Loads JSON schemas from disk and compiles validators once.
+
+    - Schemas are read once and validators compiled once per schema file.
+      Validation does no disk I/O: schema edits are picked up by refresh()
+      (rebuilds validators whose file or $ref-erenced files changed) or
+      clear(); each process / worker starts with a fresh store
+    - $ref between schema files resolves through one shared registry,
+      relative to the referencing file (e.g. {"$ref": "user_schema.json"});
+      referenced files are loaded before compiling, so validation never
+      goes back to disk
+    - validate_many() checks list items with one compiled validator and
+      only builds error details for invalid items
+    - iter_valid() validates records of a stream (e.g. APIClient.paginate)
+      as they are consumed and stops the stream at the first invalid one
+
+    Relative schema paths are resolved against the project root.
+
+    Usage:
+        store = get_schema_store()
+        store.validate(user, "api/reqres/schemas/user_schema.json")
+        store.validate_many(users, "api/reqres/schemas/user_schema.json")
+        store.refresh()  # after editing schema files in a long-lived process
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or PROJECT_ROOT)
+
+        self._lock = threading.RLock()
+        self._schemas: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        # path -> (mtimes of the schema and every file it references, validator)
+        self._validators: Dict[Path, Tuple[Dict[Path, int], Validator]] = {}
+        # Path as given -> absolute path (Path.resolve() hits the filesystem)
+        self._resolved: Dict[SchemaPath, Path] = {}
+        self._registry: Registry = Registry(retrieve=self._retrieve)
+
+    # ---------- Public API ----------
+
+    def schema(self, path: SchemaPath) -> Dict[str, Any]:
+        """Return the parsed schema (with "$id" set to its file URI)."""
+        resolved = self._resolve(path)
+        return self._load(resolved, resolved.stat().st_mtime_ns)
+
+    def validator(self, path: SchemaPath) -> Validator:
+        """Return the compiled validator for a schema file (compiled on first use)."""
+        resolved = self._resolve(path)
+
+        cached = self._validators.get(resolved)
+        if cached is None:
+            with self._lock:
+                cached = self._validators.get(resolved)
+                if cached is None:
+                    cached = self._compile(resolved)
+                    self._validators[resolved] = cached
+        return cached[1]
+
+    def validate(self, data: Any, path: SchemaPath) -> None:
+        """Raise SchemaValidationError (the most relevant error) if data is invalid."""
+        validator = self.validator(path)
+        if not validator.is_valid(data):
+            raise SchemaValidationError(self._resolve(path), _best_error(validator, data))
+
+    def validate_many(
+        self, items: Iterable[Any], path: SchemaPath, fail_fast: bool = True
+    ) -> List[SchemaValidationError]:
+        """
+        Validate every item of a list response against one schema.
+
+        fail_fast: raise on the first invalid item; otherwise return all
+        errors (empty list: everything is valid).
+        """
+        validator = self.validator(path)
+        resolved = self._resolve(path)
+
+        errors = []
+        for index, item in enumerate(items):
+            if validator.is_valid(item):
+                continue
+            error = SchemaValidationError(resolved, _best_error(validator, item), index)
+            if fail_fast:
+                raise error
+            errors.append(error)
+        return errors
+
+    def iter_valid(self, items: Iterable[Any], path: SchemaPath) -> Iterator[Any]:
+        """
+        Yield items lazily, each validated first; raise on the first invalid one.
+
+        The source iterator is closed on failure, so a paginator fetches no
+        further pages.
+        """
+        validator = self.validator(path)
+        resolved = self._resolve(path)
+
+        try:
+            for index, item in enumerate(items):
+                if not validator.is_valid(item):
+                    raise SchemaValidationError(
+                        resolved, _best_error(validator, item), index
+                    )
+                yield item
+        finally:
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+
+    def refresh(self) -> int:
+        """Drop validators whose schema files changed on disk; return how many."""
+        with self._lock:
+            stale = [
+                path
+                for path, (mtimes, _validator) in self._validators.items()
+                if not _unchanged(mtimes)
+            ]
+            for path in stale:
+                del self._validators[path]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+            self._validators.clear()
+            self._resolved.clear()
+            self._registry = Registry(retrieve=self._retrieve)
+
+    # ---------- Internal ----------
+
+    def _resolve(self, path: SchemaPath) -> Path:
+        resolved = self._resolved.get(path)
+        if resolved is None:
+            candidate = Path(path)
+            resolved = (candidate if candidate.is_absolute() else self.root / candidate).resolve()
+            self._resolved[path] = resolved
+        return resolved
+
+    def _load(self, path: Path, mtime: int) -> Dict[str, Any]:
+        cached = self._schemas.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # utf-8-sig: schemas saved by some editors start with a BOM
+        schema = json.loads(path.read_text(encoding="utf-8-sig"))
+        if isinstance(schema, dict):
+            schema.setdefault("$id", path.as_uri())
+        self._schemas[path] = (mtime, schema)
+
+        # Shared by all validators compiled afterwards (replaces a stale version)
+        self._registry = self._registry.with_resource(
+            path.as_uri(), Resource.from_contents(schema, default_specification=DRAFT202012)
+        )
+        return schema
+
+    def _compile(self, path: Path) -> Tuple[Dict[Path, int], Validator]:
+        dependencies: Dict[Path, int] = {}
+        self._load_with_refs(path, dependencies)
+
+        schema = self._schemas[path][1]
+        cls = jsonschema_validators.validator_for(schema)
+        cls.check_schema(schema)
+        return dependencies, cls(schema, registry=self._registry)
+
+    def _load_with_refs(self, path: Path, dependencies: Dict[Path, int]) -> None:
+        """Load a schema and, recursively, the files its $refs point to."""
+        if path in dependencies:
+            return
+
+        mtime = path.stat().st_mtime_ns
+        dependencies[path] = mtime
+        schema = self._load(path, mtime)
+
+        for ref in _refs(schema):
+            target = urlsplit(urljoin(path.as_uri(), ref))
+            if target.scheme == "file" and target.path:
+                self._load_with_refs(Path(url2pathname(target.path)), dependencies)
+
+    def _retrieve(self, uri: str) -> Resource:
+        """Registry hook: load schema files missed by the $ref crawl (fallback)."""
+        if not uri.startswith("file:"):
+            raise NoSuchResource(ref=uri)
+
+        path = Path(url2pathname(urlsplit(uri).path))
+        try:
+            schema = self._load(path, path.stat().st_mtime_ns)
+        except OSError as exc:
+            raise NoSuchResource(ref=uri) from exc
+        return Resource.from_contents(schema, default_specification=DRAFT202012)
+
+
+def _best_error(validator: Validator, data: Any) -> ValidationError:
+    return best_match(validator.iter_errors(data))
+
+
+def _refs(schema: Any) -> Iterator[str]:
+    """Yield every "$ref" value in a schema document."""
+    if isinstance(schema, dict):
+        for key, value in schema.items():
+            if key == "$ref" and isinstance(value, str):
+                yield value
+            else:
+                yield from _refs(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            yield from _refs(value)
+
+
+def _unchanged(mtimes: Dict[Path, int]) -> bool:
+    try:
+        return all(path.stat().st_mtime_ns == mtime for path, mtime in mtimes.items())
+    except OSError:
+        return False
+
+
+_store: Optional[SchemaStore] = None
+
+
+def get_schema_store() -> SchemaStore:
+    """Return the process-wide (per worker) SchemaStore."""
+    global _store
+    if _store is None:
+        _store = SchemaStore()
+    return _store
+
+
+def assert_schema(data: Any, path: SchemaPath) -> None:
+    """Assert that data matches the JSON schema file at path."""
+    get_schema_store().validate(data, path)
+
+
+def assert_schema_many(items: Iterable[Any], path: SchemaPath) -> None:
+    """Assert that every item matches the JSON schema file at path (first failure raises)."""
+    get_schema_store().validate_many(items, path)
+
+
+def iter_validated(items: Iterable[Any], path: SchemaPath) -> Iterator[Any]:
+    """Yield items that match the JSON schema at path; the first invalid item raises."""
+    return get_schema_store().iter_valid(items, path)